@@ -1,10 +1,14 @@
 import os
+from typing import Dict
+from typing import List
 
 os.environ["CODE_GENERATING"] = "true"
 
 from tracking_numbers.helpers.spec import iter_courier_specs  # noqa:E402
 from tracking_numbers.helpers.spec import iter_definitions  # noqa:E402
 
+OUTPUT_DIR = "tracking_numbers/_generated"
+HEADER = "# DO NOT EDIT - Generated by codegen.py\n"
 
 import_statements = [
     "import re",
@@ -31,22 +35,75 @@ def main():
     The reason we use codegen here is so that we don't have to ship the JSON files around,
     which have a lot of additional metadata, test cases, etc. and are slower to parse at
     startup.
+
+    Each courier gets its own module, listed in the package's manifest in precedence
+    order, so that a courier's definitions are only built when it's first needed.
     """
+    couriers: Dict[str, List[str]] = {}
+    for courier_spec in iter_courier_specs():
+        for definition, _ in iter_definitions(courier_spec):
+            sources = couriers.setdefault(definition.courier.code, [])
+            sources.append(repr(definition))
 
-    with open("tracking_numbers/_generated.py", "w") as wf:
-        wf.write("# DO NOT EDIT - Generated by codegen.py\n")
-        wf.write("\n")
-        for import_stmt in import_statements:
-            wf.write(f"{import_stmt}\n")
+    write_definitions(OUTPUT_DIR, couriers)
+
+
+def write_definitions(output_dir: str, couriers: Dict[str, List[str]]):
+    """Writes a module per courier code with the given definition sources, and the
+    manifest listing them in order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
 
-        wf.write("\n\n")
-        wf.write("DEFINITIONS = [\n")
-        for courier_spec in iter_courier_specs():
-            for definition, _ in iter_definitions(courier_spec):
-                wf.write(f"  {repr(definition)},\n")
+    manifest = []
+    for courier_code, sources in couriers.items():
+        module_name = module_name_for(courier_code)
+        manifest.append((courier_code, module_name))
+        with open(os.path.join(output_dir, f"{module_name}.py"), "w") as wf:
+            write_courier_module(wf, sources)
+
+    with open(os.path.join(output_dir, "__init__.py"), "w") as wf:
+        wf.write(HEADER)
+        wf.write("\n")
+        wf.write("# Courier code and module of each courier, in precedence order\n")
+        wf.write("MANIFEST = [\n")
+        for courier_code, module_name in manifest:
+            wf.write(f'    ("{courier_code}", "{module_name}"),\n')
 
         wf.write("]\n")
 
 
+def write_courier_module(wf, sources: List[str]):
+    body = "".join(f"    {source},\n" for source in sources)
+
+    wf.write(HEADER)
+    for import_stmt in _used_imports(body):
+        wf.write(f"{import_stmt}\n")
+
+    wf.write("\n\n")
+    wf.write("DEFINITIONS = [\n")
+    wf.write(body)
+    wf.write("]\n")
+
+
+def module_name_for(courier_code: str) -> str:
+    name = "".join(ch if ch.isalnum() else "_" for ch in courier_code.lower())
+    return name if name.isidentifier() else f"courier_{name}"
+
+
+def _used_imports(body: str) -> List[str]:
+    used: List[str] = []
+    for import_stmt in import_statements:
+        if not import_stmt:
+            if used:
+                used.append(import_stmt)
+            continue
+
+        name = import_stmt.split()[-1]
+        if f"{name}." in body or f"{name}(" in body:
+            used.append(import_stmt)
+
+    return used
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,60 @@
+"""Measures how classification throughput scales with the number of threads, using
+get_tracking_numbers_threaded(...). Run it on both a regular and a free-threaded
+build (e.g. python3.13t) to compare: with the GIL, more threads don't help. Run it
+from the repository root in the project's environment, or with the root on the path
+if the package isn't installed:
+
+    poetry run python scripts/bench_threads.py --max-threads 8 --numbers 200000
+    PYTHONPATH=. python3.13t scripts/bench_threads.py --max-threads 8
+"""
+import argparse
+import os
+import sys
+import time
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.batch import get_tracking_numbers_threaded
+from tracking_numbers.batch import gil_disabled
+from tracking_numbers.helpers.equivalence import iter_inputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--numbers", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    samples_per_definition = args.numbers // (2 * len(DEFINITIONS) + 2) + 1
+    numbers = list(iter_inputs(samples_per_definition=samples_per_definition))
+    numbers = numbers[: args.numbers]
+
+    print(f"python {sys.version.split()[0]}, GIL disabled: {gil_disabled()}")
+    print(f"{len(numbers)} numbers ({len(set(numbers))} distinct)")
+    print(f"{'threads':>7} {'seconds':>8} {'numbers/s':>10} {'speedup':>7}")
+
+    baseline = None
+    for threads in range(1, args.max_threads + 1):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            get_tracking_numbers_threaded(
+                numbers,
+                classify=get_tracking_number,
+                workers=threads,
+                chunk_size=args.chunk_size,
+            )
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        baseline = baseline or best
+        print(
+            f"{threads:>7} {best:>8.3f} {len(numbers) / best:>10.0f} "
+            f"{baseline / best:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measures how much of each forked worker's memory stays shared with the parent
+after running a classification workload, with and without preload(freeze=True).
+
+Linux only (reads /proc/self/smaps_rollup). Run it from the repository root in the
+project's environment, or with the root on the path if the package isn't installed:
+
+    poetry run python scripts/measure_fork_memory.py --workers 4 --iterations 20000
+    PYTHONPATH=. python scripts/measure_fork_memory.py --no-preload
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.preload import preload
+
+SAMPLE_NUMBERS = [
+    "9405511108078863434863",
+    "1Z5R89390357567127",
+    "RB123456785US",
+    "TBA123456789012",
+    "986578788855",
+    "C11031500001879",
+    "not a number",
+]
+
+FIELDS = [
+    "Rss",
+    "Pss",
+    "Shared_Clean",
+    "Shared_Dirty",
+    "Private_Clean",
+    "Private_Dirty",
+]
+
+
+def read_memory():
+    memory = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in FIELDS:
+                memory[key] = int(value.split()[0])
+
+    return memory
+
+
+def run_worker(iterations, write_fd):
+    for i in range(iterations):
+        get_tracking_number(SAMPLE_NUMBERS[i % len(SAMPLE_NUMBERS)])
+        if i % 1000 == 0:
+            gc.collect()
+
+    gc.collect()
+    with os.fdopen(write_fd, "w") as wf:
+        json.dump(read_memory(), wf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--no-preload", action="store_true")
+    parser.add_argument("--no-freeze", action="store_true")
+    args = parser.parse_args()
+
+    if not args.no_preload:
+        preload(freeze=not args.no_freeze)
+
+    pipes = []
+    for _ in range(args.workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            run_worker(args.iterations, write_fd)
+            os._exit(0)
+
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+
+    print(f"{'worker':>8}" + "".join(f"{field:>15}" for field in FIELDS) + "  (kB)")
+    for index, (pid, read_fd) in enumerate(pipes):
+        with os.fdopen(read_fd) as f:
+            memory = json.load(f)
+        os.waitpid(pid, 0)
+        print(f"{index:>8}" + "".join(f"{memory[field]:>15}" for field in FIELDS))
+
+
+if __name__ == "__main__":
+    if not sys.platform.startswith("linux"):
+        sys.exit("This script reads /proc and only works on Linux")
+
+    main()
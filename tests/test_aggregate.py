@@ -0,0 +1,83 @@
+import pickle
+from functools import reduce
+
+import pytest
+
+from tracking_numbers.aggregate import aggregate
+from tracking_numbers.aggregate import Aggregate
+from tracking_numbers.helpers.equivalence import iter_inputs
+from tracking_numbers.helpers.equivalence import reference_get_tracking_number
+from tracking_numbers.helpers.hyperloglog import HyperLogLog
+
+INPUTS = list(iter_inputs(seed=7, samples_per_definition=50))
+
+
+def test_valid_counts_match_get_tracking_number():
+    totals = aggregate(INPUTS)
+
+    expected: dict = {}
+    for number in INPUTS:
+        tracking_number = reference_get_tracking_number(number)
+        if tracking_number:
+            key = tracking_number.courier.code, tracking_number.product.name
+            expected[key] = expected.get(key, 0) + 1
+
+    not_valid = totals.unrecognized + sum(totals.invalid.values())
+    assert totals.total == len(INPUTS)
+    assert dict(totals.valid) == expected
+    assert not_valid == len(INPUTS) - sum(expected.values())
+
+
+def test_invalid_and_errors():
+    totals = aggregate(["1Z5R89390357567128", "RB123456786US", "not a number"])
+    summary = totals.to_dict()
+
+    assert summary["valid"] == 0
+    assert summary["invalid"] == 2
+    assert summary["unrecognized"] == 1
+    assert summary["errors"] == {"checksum": 2}
+    assert summary["couriers"]["ups"] == {
+        "valid": 0,
+        "invalid": 1,
+        "products": {"UPS": {"valid": 0, "invalid": 1}},
+    }
+
+
+def test_merge_equals_single_pass():
+    chunks = [INPUTS[start : start + 100] for start in range(0, len(INPUTS), 100)]
+    # Partial aggregates come back from worker processes pickled
+    partials = [pickle.loads(pickle.dumps(aggregate(chunk))) for chunk in chunks]
+
+    merged = reduce(Aggregate.merge, partials, Aggregate())
+
+    assert merged == aggregate(INPUTS)
+    assert merged.to_dict() == aggregate(INPUTS).to_dict()
+
+
+def test_distinct_estimate():
+    numbers = [f"RB{serial:08d}5US" for serial in range(10_000)]
+    totals = aggregate(numbers * 2 + [f" {numbers[0]} "])
+
+    assert totals.total == 20_001
+    assert abs(totals.distinct.count() - 10_000) < 10_000 * 0.03
+
+
+def test_hyperloglog():
+    small = HyperLogLog()
+    for value in ("a", "b", "c", "a"):
+        small.add(value)
+
+    assert small.count() == 3
+
+    first, second = HyperLogLog(precision=10), HyperLogLog(precision=10)
+    for value in range(5000):
+        (first if value % 2 else second).add(str(value))
+
+    first.merge(second)
+    assert abs(first.count() - 5000) < 5000 * 0.1
+
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog())
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=30)
@@ -0,0 +1,41 @@
+import os
+
+from tracking_numbers.helpers.allocations import AllocationProfile
+from tracking_numbers.helpers.allocations import load_budgets
+from tracking_numbers.helpers.allocations import over_budget
+from tracking_numbers.helpers.allocations import profile_call
+from tracking_numbers.helpers.allocations import profile_definitions
+
+# Recorded with `python -m tracking_numbers.helpers.allocations --repeat 50 --record
+# tests/allocation_budgets.json`. Re-record when an increase is intended.
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), "allocation_budgets.json")
+
+
+def test_allocations_within_budget():
+    budgets = load_budgets(BUDGETS_PATH)
+    profiles = profile_definitions(repeat=50)
+
+    regressions = {}
+    for name, profile in profiles.items():
+        assert name in budgets, f"No budget recorded for {name}"
+        regressions[name] = over_budget(profile, budgets[name])
+
+    assert not any(regressions.values()), {
+        name: regression for name, regression in regressions.items() if regression
+    }
+
+
+def test_profile_counts_retained_blocks():
+    profile = profile_call(lambda n: [object() for _ in range(n)], 10, repeat=20)
+
+    assert profile.blocks >= 11
+    assert profile.peak >= profile.size > 0
+
+
+def test_over_budget():
+    budget = AllocationProfile(blocks=5, size=500, peak=3000)
+
+    assert over_budget(budget, budget) == []
+    assert over_budget(AllocationProfile(blocks=20, size=500, peak=3000), budget)
+    assert over_budget(AllocationProfile(blocks=5, size=500, peak=9000), budget)
+    assert over_budget(AllocationProfile(blocks=5, size=500, peak=3300), budget)
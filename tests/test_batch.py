@@ -0,0 +1,36 @@
+from tracking_numbers import get_tracking_number
+from tracking_numbers.batch import get_tracking_numbers
+
+NUMBERS = [
+    "1Z5R89390357567127",
+    "not a number",
+    "9405511108078863434863",
+    "1Z5R89390357567127",
+    "not a number",
+    "1Z5R89390357567127",
+]
+
+
+def test_results_in_input_order():
+    batch = get_tracking_numbers(NUMBERS)
+
+    assert batch.results == [get_tracking_number(number) for number in NUMBERS]
+    assert batch.counts is None
+
+
+def test_duplicates_are_classified_once_and_shared():
+    calls = []
+
+    def classify(number):
+        calls.append(number)
+        return get_tracking_number(number)
+
+    batch = get_tracking_numbers(NUMBERS, with_counts=True, classify=classify)
+
+    assert sorted(calls) == sorted(set(NUMBERS))
+    assert batch.results[0] is batch.results[3] is batch.results[5]
+    assert batch.counts == {
+        "1Z5R89390357567127": 3,
+        "not a number": 2,
+        "9405511108078863434863": 1,
+    }
@@ -0,0 +1,38 @@
+from tracking_numbers import get_tracking_number
+from tracking_numbers.columnar import classify_columnar
+from tracking_numbers.columnar import NO_MATCH
+from tracking_numbers.definition import CHECKSUM_ERROR
+
+NUMBERS = [
+    "9405511108078863434863",
+    "not a number",
+    "1Z5R89390357567128",
+    "RB123456785US",
+    "TBA123456789012",
+    "986578788855",
+    "C11031500001879",
+    "",
+    "1Z5R89390357567127",
+]
+
+
+def test_columnar_agrees_with_get_tracking_number():
+    result = classify_columnar(NUMBERS)
+
+    assert len(result) == len(NUMBERS)
+    assert result.error_codes is None
+    for row, number in enumerate(NUMBERS):
+        tracking_number = get_tracking_number(number)
+        assert result.is_valid(row) == (tracking_number is not None)
+        if tracking_number:
+            assert result.definition(row).product == tracking_number.product
+
+
+def test_columnar_reports_invalid_matches():
+    result = classify_columnar(NUMBERS, errors=True)
+
+    assert result.definition_indexes[1] == NO_MATCH
+    assert result.definition(2).product.name == "UPS"
+    assert not result.is_valid(2)
+    assert result.error_codes[2] == CHECKSUM_ERROR
+    assert result.error_codes[0] == 0
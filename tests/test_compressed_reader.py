@@ -0,0 +1,102 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.compressed_reader import BZ2
+from tracking_numbers.compressed_reader import detect_compression
+from tracking_numbers.compressed_reader import GZIP
+from tracking_numbers.compressed_reader import iter_line_blocks
+from tracking_numbers.compressed_reader import PipelineStats
+from tracking_numbers.compressed_reader import scan_compressed_file
+from tracking_numbers.compressed_reader import XZ
+
+LINES = [
+    "9405511108078863434863",
+    "not a number",
+    "1Z5R89390357567127",
+    "",
+    "RB123456785US",
+    "TBA123456789012",
+    "986578788855",
+] * 50
+
+COMPRESSORS = {
+    GZIP: gzip.compress,
+    BZ2: bz2.compress,
+    XZ: lzma.compress,
+    None: lambda data: data,
+}
+
+
+@pytest.fixture(params=list(COMPRESSORS))
+def compressed_file(request, tmp_path):
+    path = tmp_path / "numbers"
+    path.write_bytes(COMPRESSORS[request.param]("\r\n".join(LINES).encode()))
+    return request.param, str(path)
+
+
+def test_detect_compression(compressed_file):
+    compression, path = compressed_file
+
+    assert detect_compression(path) == compression
+
+
+def test_line_blocks(compressed_file):
+    compression, path = compressed_file
+    stats = PipelineStats()
+
+    blocks = list(iter_line_blocks(path, block_size=256, queue_size=2, stats=stats))
+
+    assert len(blocks) > 1
+    assert [line for block in blocks for line in block] == LINES
+    assert stats.compression == compression
+    assert stats.decompress.lines == len(LINES)
+    assert stats.compressed_bytes > 0
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_scan_compressed_file(compressed_file, workers):
+    _, path = compressed_file
+    stats = PipelineStats()
+
+    results = list(
+        scan_compressed_file(path, workers=workers, block_size=512, stats=stats),
+    )
+
+    assert results == [get_tracking_number(line) for line in LINES]
+    assert stats.classify.lines == len(LINES)
+    assert stats.classify.busy_seconds > 0
+    assert "classify: 350 lines" in stats.summary()
+
+
+def test_line_spanning_many_blocks(tmp_path):
+    long_line = "x" * 10_000
+    path = tmp_path / "numbers"
+    path.write_bytes(f"RB123456785US\n{long_line}\n{long_line}".encode())
+
+    blocks = list(iter_line_blocks(str(path), block_size=64))
+
+    assert [line for block in blocks for line in block] == [
+        "RB123456785US",
+        long_line,
+        long_line,
+    ]
+
+
+def test_stopping_early_stops_reader(compressed_file):
+    _, path = compressed_file
+    blocks = iter_line_blocks(path, block_size=64, queue_size=1)
+
+    assert next(blocks)
+    blocks.close()
+
+
+def test_truncated_input_raises(tmp_path):
+    path = tmp_path / "numbers.gz"
+    path.write_bytes(gzip.compress(b"RB123456785US\n" * 100)[:-20])
+
+    with pytest.raises(EOFError):
+        list(iter_line_blocks(str(path)))
@@ -0,0 +1,103 @@
+import pytest
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.checksum_validator import Mod7
+from tracking_numbers.checksum_validator import S10
+from tracking_numbers.checksum_validator import SumProductWithWeightsAndModulo
+from tracking_numbers.correction import INSERTION
+from tracking_numbers.correction import SUBSTITUTION
+from tracking_numbers.correction import suggest_corrections
+from tracking_numbers.correction import TRANSPOSITION
+
+VALID_NUMBERS = [
+    "9405511108078863434863",
+    "1Z5R89390357567127",
+    "RB123456785US",
+    "986578788855",
+    "020207021381215",
+    "C11031500001879",
+]
+
+
+def _numbers(corrections):
+    return [correction.number for correction in corrections]
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        Mod10(odds_multiplier=1, evens_multiplier=3),
+        Mod10(odds_multiplier=2, evens_multiplier=1),
+        Mod7(),
+        S10(),
+        SumProductWithWeightsAndModulo([3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1], 11, 10),
+    ],
+)
+def test_weights_agree_with_passes(validator):
+    for length in (8, 11, 14):
+        serial_number = [(index * 7 + 3) % 10 for index in range(length)]
+        weights = validator.digit_weights(length)
+        total = sum(digit * weight for digit, weight in zip(serial_number, weights))
+
+        assert validator.passes(serial_number, validator.check_digit(total))
+
+
+def test_suggests_single_wrong_digit():
+    for number in VALID_NUMBERS:
+        for position, ch in enumerate(number):
+            if not ch.isdigit():
+                continue
+
+            wrong = number[:position] + str((int(ch) + 5) % 10) + number[position + 1 :]
+            if get_tracking_number(wrong):
+                continue
+
+            corrections = suggest_corrections(wrong)
+            assert all(c.tracking_number.valid for c in corrections)
+            # Unless the digit isn't covered by the checksum, or the pattern itself
+            tn_definition = next(d for d in DEFINITIONS if d.is_valid(number))
+            match = tn_definition.number_regex.fullmatch(number)
+            start, end = match.span("SerialNumber")
+            covered = start <= position < end or position == match.start("CheckDigit")
+            if covered and tn_definition.number_regex.fullmatch(wrong):
+                assert number in _numbers(corrections), wrong
+
+
+def test_suggests_missing_and_unreadable_digits():
+    corrections = suggest_corrections("940551110807886343486")
+    assert "9405511108078863434863" in _numbers(corrections)
+    assert {c.edit for c in corrections} == {INSERTION}
+
+    corrections = suggest_corrections("RB12345?785US")
+    assert _numbers(corrections)[0] == "RB123456785US"
+    assert corrections[0].edit == SUBSTITUTION
+    assert corrections[0].position == 7
+
+
+def test_suggests_transpositions():
+    corrections = suggest_corrections("9405511108078863443863")
+    assert TRANSPOSITION in {c.edit for c in corrections}
+    assert "9405511108078863434863" in _numbers(corrections)
+
+    assert "9405511108078863434863" not in _numbers(
+        suggest_corrections("9405511108078863443863", transpositions=False)
+    )
+
+    corrections = suggest_corrections("RB12345678U5S")
+    assert _numbers(corrections) == ["RB123456785US"]
+
+
+def test_ranking():
+    corrections = suggest_corrections("RB123456775US")
+
+    edits = [SUBSTITUTION, TRANSPOSITION, INSERTION]
+    ranks = [edits.index(correction.edit) for correction in corrections]
+    assert ranks == sorted(ranks)
+    assert len(set(_numbers(corrections))) == len(corrections)
+
+
+def test_no_suggestions():
+    assert suggest_corrections("") == []
+    assert suggest_corrections("not a tracking number") == []
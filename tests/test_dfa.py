@@ -0,0 +1,91 @@
+import re
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.dfa import DfaMatcher
+from tracking_numbers.helpers.equivalence import compare_engines
+from tracking_numbers.helpers.equivalence import iter_inputs
+
+MATCHER = DfaMatcher()
+
+INPUTS = list(iter_inputs(seed=5, samples_per_definition=100))
+
+
+def _products(definitions):
+    return [definition.product.name for definition in definitions]
+
+
+def _spans(match):
+    return [match.span(group) for group in range(match.re.groups + 1)]
+
+
+def test_matches_reference():
+    report = compare_engines(MATCHER.get, inputs=INPUTS)
+
+    assert report.ok, report.mismatches[:10]
+
+
+def test_get_all_matches_every_valid_definition():
+    for number in INPUTS[::10]:
+        results = [tn_definition.test(number) for tn_definition in DEFINITIONS]
+        expected = [result for result in results if result and result.valid]
+
+        assert MATCHER.get_all(number) == expected, number
+
+
+def test_accepting_and_captures_agree_with_re():
+    for number in INPUTS:
+        matches = MATCHER.match(number)
+        expected = [
+            (tn_definition, re_match)
+            for tn_definition in DEFINITIONS
+            for re_match in [tn_definition.number_regex.fullmatch(number)]
+            if re_match
+        ]
+        definitions = [tn_definition for tn_definition, _ in expected]
+
+        assert [match.definition for match in matches] == definitions, number
+        assert MATCHER.accepting(number) == definitions, number
+        for match, (_, re_match) in zip(matches, expected):
+            assert match.spans == _spans(re_match), number
+            assert match.groupdict() == re_match.groupdict(), number
+
+
+def test_whitespace_captures():
+    (match,) = MATCHER.match(" 1 Z 5R8939 0357567127\t")
+
+    assert match.definition.product.name == "UPS"
+    assert match.group("ShipperId") == "5R8939 "
+    assert match.group("CheckDigit") == "7\t"
+    assert match.span() == (0, 23)
+
+
+def test_lookahead_falls_back_to_re():
+    assert _products(MATCHER.fallback) == ["CDL Last Mile Solutions"]
+    assert _products(MATCHER.accepting("abcdef0123")) == ["CDL Last Mile Solutions"]
+    assert MATCHER.accepting("0123456789abcdef") == []
+
+
+def test_unicode_whitespace_and_unknown_chars():
+    assert _products(MATCHER.accepting("RB　123456785US")) == ["S10"]
+    assert MATCHER.accepting("RB12345678éUS") == []
+    assert MATCHER.get("") is None
+
+
+def test_non_greedy_and_alternation():
+    tn_definition = TrackingNumberDefinition(
+        courier=DEFINITIONS[0].courier,
+        product=DEFINITIONS[0].product,
+        number_regex=re.compile(r"(?P<A>a+?)(?P<B>a*)(?:x|(?P<C>y))"),
+        tracking_url_template=None,
+        serial_number_parser=DEFINITIONS[0].serial_number_parser,
+        checksum_validator=None,
+        additional_validations=[],
+    )
+    matcher = DfaMatcher(definitions=[tn_definition])
+
+    for number in ("aaax", "ay", "aaaay", "x", "aaa"):
+        re_match = tn_definition.number_regex.fullmatch(number)
+        expected = [_spans(re_match)] if re_match else []
+
+        assert [match.spans for match in matcher.match(number)] == expected, number
@@ -1,4 +1,15 @@
+import re
+
+from tracking_numbers import detect_courier
+from tracking_numbers import get_definition
 from tracking_numbers import get_tracking_number
+from tracking_numbers import is_valid
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.definition import CHECKSUM_ERROR
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
 
 
 def test_usps_not_confused_for_dhl():
@@ -10,3 +21,43 @@ def test_usps_not_confused_for_dhl():
 
     assert tracking_number is not None
     assert tracking_number.courier.code == "usps"
+
+
+def test_letter_check_digit_is_invalid():
+    """The UPS pattern allows a letter where the check digit goes, which can never
+    pass the checksum (rather than failing to parse as a digit).
+    """
+    number = "1Z5R8939035756712A"
+    ups = get_definition("UPS")
+
+    assert get_tracking_number(number) is None
+    assert not is_valid(number)
+    assert detect_courier(number) is None
+    assert ups.check(number) == CHECKSUM_ERROR
+    assert ups.test(number).validation_errors == [
+        ("checksum", "CheckDigit is not a digit"),
+    ]
+
+
+def test_unparseable_serial_number_fails_checksum():
+    """A spec's pattern can allow characters its serial number parser can't turn into
+    digits, which fails the checksum rather than raising.
+    """
+    tn_definition = TrackingNumberDefinition(
+        courier=Courier(code="test", name="Test"),
+        product=Product(name="Test"),
+        number_regex=re.compile(r"X(?P<SerialNumber>[0-9A-Z]{5})(?P<CheckDigit>[0-9])"),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(),
+        checksum_validator=Mod10(),
+        additional_validations=[],
+    )
+
+    tracking_number = tn_definition.test("XAB1234")
+    assert tracking_number.serial_number is None
+    assert tracking_number.validation_errors == [
+        ("checksum", "SerialNumber is not numeric"),
+    ]
+    assert not tn_definition.is_valid("XAB1234")
+    assert tn_definition.check("XAB1234") == CHECKSUM_ERROR
+    assert tn_definition.is_valid("X123455")
@@ -0,0 +1,37 @@
+from tracking_numbers import get_tracking_number
+from tracking_numbers.helpers.equivalence import compare_engines
+from tracking_numbers.helpers.equivalence import iter_inputs
+from tracking_numbers.matcher import TrackingNumberMatcher
+
+
+def test_get_tracking_number_is_the_reference():
+    report = compare_engines(get_tracking_number, samples_per_definition=50)
+
+    assert report.ok, report.mismatches[:5]
+    assert report.inputs > 0
+
+
+def test_matcher_is_equivalent():
+    report = compare_engines(TrackingNumberMatcher().get, samples_per_definition=50)
+
+    assert report.ok, report.mismatches[:5]
+    assert report.engine_seconds > 0 and report.reference_seconds > 0
+
+
+def test_detects_differences():
+    def broken(number):
+        tracking_number = get_tracking_number(number)
+        if tracking_number and tracking_number.courier.code == "ups":
+            return None
+        return tracking_number
+
+    inputs = ["1Z5R89390357567127", "RB123456785US"]
+    report = compare_engines(broken, inputs=inputs)
+
+    assert [mismatch.number for mismatch in report.mismatches] == [inputs[0]]
+
+
+def test_inputs_are_deterministic():
+    first = list(iter_inputs(seed=1, samples_per_definition=5))
+
+    assert first == list(iter_inputs(seed=1, samples_per_definition=5))
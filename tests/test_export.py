@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+from dataclasses import asdict
+
+import pytest
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.export import write_csv
+from tracking_numbers.export import write_jsonl
+from tracking_numbers.types import FIELDS
+
+NUMBERS = [
+    "1Z5R89390357567127",
+    "RB123456785US",
+    "TBA123456789012",
+    "not a number",
+]
+
+
+def test_to_dict_matches_asdict():
+    for number in NUMBERS[:3]:
+        tracking_number = get_tracking_number(number)
+        assert tracking_number.to_dict() == asdict(tracking_number)
+
+
+def test_invalid_to_dict_matches_asdict():
+    tracking_number = get_tracking_number("1Z5R89390357567127")
+    tracking_number.validation_errors = [("checksum", "Checksum validation failed")]
+
+    assert tracking_number.to_dict() == asdict(tracking_number)
+
+
+def test_to_tuple():
+    tracking_number = get_tracking_number("1Z5R89390357567127")
+
+    assert tracking_number.to_tuple(["courier_code", "valid"]) == ("ups", True)
+
+
+@pytest.mark.parametrize("fields", [None, list(FIELDS)])
+def test_write_jsonl_matches_json_dumps(fields):
+    results = [get_tracking_number(number) for number in NUMBERS]
+    invalid = get_tracking_number("1Z5R89390357567127")
+    invalid.validation_errors = [("checksum", "Checksum validation failed")]
+    results.append(invalid)
+
+    out = io.StringIO()
+    kwargs = {"fields": fields} if fields else {}
+    assert write_jsonl(results, out, **kwargs) == len(results)
+
+    expected = [
+        json.dumps(result.to_dict(**kwargs)) if result else "null" for result in results
+    ]
+    assert out.getvalue().splitlines() == expected
+
+
+def test_write_csv():
+    results = [get_tracking_number(number) for number in NUMBERS]
+
+    out = io.StringIO()
+    fields = ["number", "courier_code", "serial_number", "valid"]
+    assert write_csv(results, out, fields=fields) == len(results)
+
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == fields
+    assert rows[2] == ["RB123456785US", "s10", "12345678", "True"]
+    assert rows[4] == ["", "", "", ""]
+
+
+def test_unknown_field():
+    with pytest.raises(ValueError):
+        write_jsonl([], io.StringIO(), fields=["nope"])
@@ -0,0 +1,35 @@
+import pytest
+
+from tracking_numbers import detect_courier
+from tracking_numbers import get_tracking_number
+from tracking_numbers import is_valid
+
+NUMBERS = [
+    "9405511108078863434863",
+    "1Z5R89390357567127",
+    "1Z5R89390357567128",
+    "RB123456785US",
+    "RB123456785XX",
+    "TBA123456789012",
+    "986578788855",
+    "C11031500001879",
+    "1234567890",
+    "",
+    "not a number",
+]
+
+
+@pytest.mark.parametrize("number", NUMBERS)
+def test_fast_path_agrees_with_get_tracking_number(number):
+    tracking_number = get_tracking_number(number)
+
+    assert is_valid(number) == (tracking_number is not None)
+    if tracking_number:
+        expected = (tracking_number.courier.code, tracking_number.product.name)
+        assert detect_courier(number) == expected
+    else:
+        assert detect_courier(number) is None
+
+
+def test_detect_courier():
+    assert detect_courier("1Z5R89390357567127") == ("ups", "UPS")
@@ -0,0 +1,67 @@
+import pytest
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.file_scanner import scan_file
+from tracking_numbers.file_scanner import scan_file_to_shards
+from tracking_numbers.file_scanner import split_ranges
+
+LINES = [
+    "9405511108078863434863",
+    "not a number",
+    "1Z5R89390357567127",
+    "",
+    "RB123456785US",
+    "TBA123456789012",
+    "986578788855",
+] * 20
+
+
+@pytest.fixture
+def numbers_file(tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_text("\r\n".join(LINES))
+    return str(path)
+
+
+def test_split_ranges_are_line_aligned(numbers_file):
+    ranges = split_ranges(numbers_file, shard_size=100)
+
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0
+    with open(numbers_file, "rb") as f:
+        content = f.read()
+
+    assert ranges[-1][1] == len(content)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert content[end - 1 : end] == b"\n"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_file_preserves_order(numbers_file, workers):
+    results = list(scan_file(numbers_file, workers=workers, shard_size=100))
+
+    assert results == [get_tracking_number(line) for line in LINES]
+
+
+def test_scan_file_to_shards(numbers_file, tmp_path):
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+
+    shard_paths = scan_file_to_shards(numbers_file, str(output_dir), shard_size=100)
+
+    rows = []
+    for shard_path in shard_paths:
+        with open(shard_path) as f:
+            rows.extend(line.rstrip("\n").split("\t") for line in f)
+
+    assert [row[0] for row in rows] == LINES
+    assert rows[2] == ["1Z5R89390357567127", "ups", "UPS"]
+    assert rows[1] == ["not a number", "", ""]
+
+
+def test_scan_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+
+    assert list(scan_file(str(path))) == []
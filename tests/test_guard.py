@@ -0,0 +1,36 @@
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.guard import analyze_worst_case
+from tracking_numbers.guard import InputGuard
+
+NUMBERS = [
+    "9405511108078863434863",
+    "9405 5111 0807 8863 4348 63",
+    "  1Z5R89390357567127\n",
+    "RB123456785US",
+    "not a number",
+]
+
+
+def test_guard_allows_real_numbers():
+    guard = InputGuard()
+
+    for number in NUMBERS:
+        assert guard.allows(number)
+        assert guard.get_tracking_number(number) == get_tracking_number(number)
+
+
+def test_guard_rejects_oversized_input():
+    guard = InputGuard()
+
+    assert not guard.allows("1" * (guard.max_length + 1))
+    assert not guard.allows("1" + " " * (guard.max_whitespace + 1) + "2")
+    assert not guard.allows("1 " * 10_000)
+    assert guard.get_tracking_number("9" * 1_000_000) is None
+
+
+def test_analyze_worst_case():
+    reports = analyze_worst_case(sizes=(1, 4), repeat=1)
+
+    assert [report.definition for report in reports] == DEFINITIONS
+    assert all(report.worst_seconds > 0 for report in reports)
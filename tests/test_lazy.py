@@ -0,0 +1,72 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_definitions
+from tracking_numbers.lazy import courier_codes
+from tracking_numbers.lazy import LazyDefinitions
+from tracking_numbers.lazy import load_courier
+
+
+def _loaded_couriers(code: str):
+    script = (
+        "import sys\n"
+        f"{code}\n"
+        "prefix = 'tracking_numbers._generated.'\n"
+        "print(' '.join(sorted(m[len(prefix):] for m in sys.modules "
+        "if m.startswith(prefix))))\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], text=True)
+    return output.split()
+
+
+def test_precedence_follows_manifest():
+    expected = []
+    for courier_code in courier_codes():
+        expected.extend(load_courier(courier_code))
+
+    assert list(DEFINITIONS) == expected
+    assert [d.courier.code for d in DEFINITIONS][:4] == ["cdl", "dhl", "dhl", "amazon"]
+
+
+def test_couriers_are_loaded_on_demand():
+    assert _loaded_couriers("import tracking_numbers") == []
+    assert _loaded_couriers(
+        "from tracking_numbers.matcher import TrackingNumberMatcher\n"
+        "TrackingNumberMatcher(couriers=['UPS']).get('1Z5R89390357567127')"
+    ) == ["ups"]
+    assert _loaded_couriers(
+        "import tracking_numbers\n"
+        "tracking_numbers.get_tracking_number('1Z5R89390357567127')"
+    ) == sorted(courier_codes())
+
+
+def test_get_definitions():
+    ups = get_definitions(["ups"])
+
+    assert ups and {d.courier.code for d in ups} == {"ups"}
+    assert get_definitions() == list(DEFINITIONS)
+    with pytest.raises(ValueError):
+        get_definitions(["nope"])
+
+
+def test_lazy_definitions_load_once():
+    definitions = LazyDefinitions()
+    results = []
+
+    def read():
+        results.append(len(definitions))
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [len(DEFINITIONS)] * 8
+    assert definitions.loaded
+    assert type(definitions) is not LazyDefinitions
+    assert definitions == list(DEFINITIONS)
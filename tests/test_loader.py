@@ -0,0 +1,141 @@
+import json
+import os
+import pickle
+import stat
+
+import pytest
+
+import tracking_numbers
+from tracking_numbers import get_tracking_number
+from tracking_numbers import loader
+from tracking_numbers.loader import load_definitions
+from tracking_numbers.loader import register_definitions
+
+ACME_SPEC = {
+    "name": "Acme Freight",
+    "courier_code": "acme",
+    "tracking_numbers": [
+        {
+            "name": "Acme Parcel",
+            "regex": "\\s*A\\s*C\\s*(?<SerialNumber>([0-9]\\s*){8})(?<CheckDigit>[0-9]\\s*)",
+            "tracking_url": "https://acme.example/track?n=%s",
+            "validation": {"checksum": {"name": "mod7"}},
+        },
+    ],
+}
+
+
+@pytest.fixture
+def spec_dir(tmp_path):
+    spec_dir = tmp_path / "couriers"
+    spec_dir.mkdir()
+    (spec_dir / "acme.json").write_text(json.dumps(ACME_SPEC))
+    return str(spec_dir)
+
+
+@pytest.fixture
+def restore_definitions():
+    original = list(tracking_numbers.DEFINITIONS)
+    yield
+    tracking_numbers.DEFINITIONS[:] = original
+
+
+def test_load_definitions(spec_dir):
+    (definition,) = load_definitions([spec_dir], cache_dir=None)
+
+    assert definition.courier.code == "acme"
+    assert definition.product.name == "Acme Parcel"
+    assert definition.test("AC123456782").valid
+    assert not definition.test("AC123456789").valid
+
+
+def test_load_definitions_uses_cache(spec_dir, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    load_definitions([spec_dir], cache_dir=cache_dir)
+    (cache_file,) = os.listdir(cache_dir)
+
+    # Same content: served from the cache without touching the JSON
+    cached = load_definitions([spec_dir], cache_dir=cache_dir)
+    assert cached[0].product.name == "Acme Parcel"
+    assert os.listdir(cache_dir) == [cache_file]
+
+    # Changed content: new cache entry
+    spec = dict(ACME_SPEC, name="Acme")
+    with open(os.path.join(spec_dir, "acme.json"), "w") as f:
+        json.dump(spec, f)
+
+    reloaded = load_definitions([spec_dir], cache_dir=cache_dir)
+    assert reloaded[0].courier.name == "Acme"
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_corrupt_cache_is_rebuilt(spec_dir, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    load_definitions([spec_dir], cache_dir=cache_dir)
+    (cache_file,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, cache_file), "wb") as f:
+        f.write(b"garbage")
+
+    (definition,) = load_definitions([spec_dir], cache_dir=cache_dir)
+    assert definition.product.name == "Acme Parcel"
+
+
+def test_register_definitions(spec_dir, restore_definitions):
+    assert get_tracking_number("AC123456782") is None
+
+    register_definitions([spec_dir], cache_dir=None)
+    register_definitions([spec_dir], cache_dir=None)
+
+    tracking_number = get_tracking_number("AC123456782")
+    assert tracking_number.courier.code == "acme"
+    products = [definition.product.name for definition in tracking_numbers.DEFINITIONS]
+    assert products.count("Acme Parcel") == 1
+
+
+def test_only_json_files_are_loaded(spec_dir):
+    with open(os.path.join(spec_dir, "README.md"), "w") as f:
+        f.write("# Not a spec")
+
+    (definition,) = load_definitions([spec_dir], cache_dir=None)
+    assert definition.product.name == "Acme Parcel"
+
+
+def test_cache_is_keyed_on_library_code(spec_dir, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    load_definitions([spec_dir], cache_dir=cache_dir)
+
+    # As if the library had been upgraded
+    monkeypatch.setattr(loader, "_library_fingerprint", lambda: b"upgraded")
+    load_definitions([spec_dir], cache_dir=cache_dir)
+
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_cache_dir_is_private(spec_dir, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    load_definitions([spec_dir], cache_dir=cache_dir)
+
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX file ownership")
+def test_untrusted_cache_is_ignored(spec_dir, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    load_definitions([spec_dir], cache_dir=cache_dir)
+    (cache_file,) = os.listdir(cache_dir)
+    cache_path = os.path.join(cache_dir, cache_file)
+    with open(cache_path, "wb") as f:
+        pickle.dump(["poisoned"], f)
+
+    # Writable by others
+    os.chmod(cache_path, 0o666)
+    (definition,) = load_definitions([spec_dir], cache_dir=cache_dir)
+    assert definition.product.name == "Acme Parcel"
+
+    # Owned by someone else
+    with open(cache_path, "wb") as f:
+        pickle.dump(["poisoned"], f)
+    os.chmod(cache_path, 0o600)
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(cache_path).st_uid + 1)
+    (definition,) = load_definitions([spec_dir], cache_dir=cache_dir)
+    assert definition.product.name == "Acme Parcel"
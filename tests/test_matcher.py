@@ -0,0 +1,103 @@
+import re
+
+import pytest
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.matcher import TrackingNumberMatcher
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+NUMBERS = [
+    "9405511108078863434863",
+    "1Z5R89390357567127",
+    "  1Z5R89390357567127",
+    "1Z5R89390357567128",
+    "RB123456785US",
+    "TBA123456789012",
+    "986578788855",
+    "C11031500001879",
+    "020207021381215",
+    "1234567890",
+    "",
+    "   ",
+    "not a number",
+]
+
+
+@pytest.mark.parametrize("number", NUMBERS)
+def test_unfiltered_matcher_agrees_with_get_tracking_number(number):
+    matcher = TrackingNumberMatcher()
+
+    assert matcher.get(number) == get_tracking_number(number)
+    assert matcher.is_valid(number) == (get_tracking_number(number) is not None)
+
+
+def test_filter_by_courier():
+    matcher = TrackingNumberMatcher(couriers=["ups", "FedEx"])
+
+    assert {d.courier.code for d in matcher.definitions} == {"ups", "fedex"}
+    assert matcher.get("1Z5R89390357567127").courier.code == "ups"
+    assert matcher.get("986578788855").courier.code == "fedex"
+    assert matcher.get("RB123456785US") is None
+    assert matcher.detect_courier("9405511108078863434863") is None
+
+
+def test_filter_by_product():
+    matcher = TrackingNumberMatcher(products=["s10"])
+
+    assert matcher.detect_courier("RB123456785US") == ("s10", "S10")
+    assert not matcher.is_valid("1Z5R89390357567127")
+
+
+def test_unknown_filter():
+    with pytest.raises(ValueError):
+        TrackingNumberMatcher(couriers=["ups", "acme"])
+
+
+def test_get_all():
+    matcher = TrackingNumberMatcher()
+
+    products = [t.product.name for t in matcher.get_all("020207021381215")]
+    assert products[0] == get_tracking_number("020207021381215").product.name
+    assert len(products) == len(set(products))
+
+
+def test_get_many():
+    matcher = TrackingNumberMatcher(couriers=["ups"])
+
+    batch = matcher.get_many(NUMBERS[:4], with_counts=True)
+    assert [bool(t) for t in batch.results] == [False, True, True, False]
+    assert batch.counts["1Z5R89390357567127"] == 1
+
+
+def _definition(regex):
+    return TrackingNumberDefinition(
+        courier=Courier(code="acme", name="Acme"),
+        product=Product(name="Acme"),
+        number_regex=re.compile(regex),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(),
+        checksum_validator=None,
+        additional_validations=[],
+    )
+
+
+@pytest.mark.parametrize(
+    "regex", [r"(?i)\s*A\s*C\s*[0-9]{3}", r"(?i:A\s*C)\s*[0-9]{3}"]
+)
+def test_case_insensitive_definition(regex):
+    tn_definition = _definition(regex)
+    matcher = TrackingNumberMatcher(definitions=[tn_definition])
+
+    assert matcher.get("ac123") == tn_definition.test("ac123")
+    assert matcher.is_valid("AC123")
+
+
+@pytest.mark.parametrize("number", [" B123", "AB123", "B123", "\tB123"])
+def test_whitespace_in_character_class(number):
+    tn_definition = _definition(r"[ A]B[0-9]{3}")
+    matcher = TrackingNumberMatcher(definitions=[tn_definition])
+
+    assert matcher.get(number) == tn_definition.test(number)
@@ -0,0 +1,83 @@
+import multiprocessing
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.persistent_cache import PersistentCache
+
+NUMBERS = [
+    "9405511108078863434863",
+    "  1Z5R89390357567127\n",
+    "1Z5R89390357567127",
+    "RB123456785US",
+    "not a number",
+]
+
+
+def test_results_match_get_tracking_number(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    calls = []
+
+    def classify(number):
+        calls.append(number)
+        return get_tracking_number(number)
+
+    with PersistentCache(path) as cache:
+        first = cache.get_tracking_numbers(NUMBERS, classify=classify)
+    with PersistentCache(path) as cache:
+        second = cache.get_tracking_numbers(NUMBERS, classify=classify)
+        cached = cache.get_many(NUMBERS + ["unknown"])
+
+    expected = [get_tracking_number(number) for number in NUMBERS]
+    assert first == expected
+    assert second == expected
+    assert calls == NUMBERS
+    assert set(cached) == set(NUMBERS)
+    assert cached["not a number"] is None
+
+
+def test_definitions_change_invalidates(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with PersistentCache(path) as cache:
+        cache.get_tracking_numbers(NUMBERS)
+
+    with PersistentCache(path, definitions=DEFINITIONS[:-1]) as cache:
+        assert cache.get_many(NUMBERS) == {}
+
+
+def test_evicts_oldest_entries(tmp_path):
+    with PersistentCache(str(tmp_path / "cache.sqlite"), max_entries=3) as cache:
+        cache.put_many([(str(n), None) for n in range(10)])
+
+        assert set(cache.get_many([str(n) for n in range(10)])) == {"7", "8", "9"}
+
+        cache.clear()
+        assert cache.get_many(["9"]) == {}
+
+
+def _fill(path, worker):
+    numbers = [f"{worker}-{n}" for n in range(200)] + NUMBERS
+    with PersistentCache(path, timeout=60) as cache:
+        for start in range(0, len(numbers), 20):
+            cache.get_tracking_numbers(numbers[start : start + 20])
+
+
+def test_concurrent_processes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    PersistentCache(path).close()
+
+    processes = [
+        multiprocessing.Process(target=_fill, args=(path, worker))
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0] * 4
+    with PersistentCache(path) as cache:
+        numbers = [f"{worker}-{n}" for worker in range(4) for n in range(200)]
+        assert len(cache.get_many(numbers)) == 800
+        assert cache.get_tracking_numbers(NUMBERS, classify=None) == [
+            get_tracking_number(number) for number in NUMBERS
+        ]
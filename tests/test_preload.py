@@ -0,0 +1,58 @@
+import gc
+import re
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import preload as preload_module
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.preload import preload
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+
+def test_preload_builds_derived_structures():
+    preloaded = preload(freeze=False)
+
+    assert preloaded.definitions == DEFINITIONS
+    assert all("min_length" in vars(definition) for definition in DEFINITIONS)
+    assert preloaded.matcher.get("1Z5R89390357567127").courier.code == "ups"
+    assert preload(freeze=False) is preloaded
+
+
+def test_typeahead_sessions_share_the_automaton():
+    preloaded = preload(freeze=False)
+    first, second = preloaded.typeahead(), preloaded.typeahead()
+
+    first.push("1Z5R8939")
+    status = second.push("RB12")
+
+    assert first._automaton is second._automaton is preloaded.typeahead_automaton
+    assert first.text == "1Z5R8939"
+    assert [d.courier.code for d in status.possible] == ["s10"]
+
+
+def test_preload_freezes_gc():
+    try:
+        preload(freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_preload_with_patterns_the_automaton_cant_represent(monkeypatch):
+    # e.g. a loaded spec using \d
+    digits = TrackingNumberDefinition(
+        courier=Courier(code="test", name="Test"),
+        product=Product(name="Test"),
+        number_regex=re.compile(r"T\d{4}"),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(),
+        checksum_validator=None,
+        additional_validations=[],
+    )
+    monkeypatch.setattr(preload_module, "DEFINITIONS", DEFINITIONS + [digits])
+    monkeypatch.setattr(preload_module, "_preloaded", None)
+
+    preloaded = preload(freeze=False)
+
+    assert preloaded.typeahead().push("T1234").valid == [digits]
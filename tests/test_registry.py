@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.registry import Registry
+
+UPS_NUMBER = "1Z5R89390357567127"
+S10_NUMBER = "RB123456785US"
+
+WITHOUT_UPS = [d for d in DEFINITIONS if d.courier.code != "ups"]
+
+
+def test_lookups():
+    registry = Registry()
+    result = registry.get_tracking_number(UPS_NUMBER)
+
+    assert result.version == 1
+    assert result.tracking_number == get_tracking_number(UPS_NUMBER)
+    assert registry.is_valid(UPS_NUMBER)
+    assert registry.detect_courier(UPS_NUMBER) == ("ups", "UPS")
+    assert registry.get_definition("ups").product.name == "UPS"
+    assert registry.get_tracking_number("nope").tracking_number is None
+
+
+def test_publish():
+    registry = Registry()
+    old = registry.snapshot
+
+    snapshot = registry.publish(WITHOUT_UPS)
+
+    assert snapshot.version == registry.version == 2
+    assert registry.get_tracking_number(UPS_NUMBER).tracking_number is None
+    assert registry.get_tracking_number(S10_NUMBER).version == 2
+    assert registry.get_definition("UPS") is None
+    # Snapshots that were already read are left untouched
+    assert old.matcher.get(UPS_NUMBER) is not None
+
+
+def test_publish_later():
+    registry = Registry()
+
+    snapshot = registry.publish_later(lambda: WITHOUT_UPS).result(timeout=10)
+
+    assert snapshot is registry.snapshot
+    assert registry.version == 2
+
+
+def test_failed_publish_keeps_current():
+    registry = Registry()
+
+    def load():
+        raise OSError("missing spec file")
+
+    with pytest.raises(OSError):
+        registry.publish_later(load).result(timeout=10)
+
+    assert registry.version == 1
+
+
+def test_readers_during_publishes():
+    registry = Registry()
+    # Odd versions have every definition, even ones none of UPS's
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        last_version = 0
+        while not stop.is_set():
+            result = registry.get_tracking_number(UPS_NUMBER)
+            if result.version < last_version:
+                errors.append(f"version went back to {result.version}")
+            if (result.tracking_number is not None) != (result.version % 2 == 1):
+                errors.append(f"version {result.version} returned {result}")
+
+            last_version = result.version
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+
+    for version in range(2, 22):
+        registry.publish(WITHOUT_UPS if version % 2 == 0 else DEFINITIONS)
+
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert registry.version == 21
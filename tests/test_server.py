@@ -0,0 +1,154 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import pytest
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.server import ClassificationServer
+
+
+@pytest.fixture
+def server():
+    loop = asyncio.new_event_loop()
+    server = ClassificationServer(max_batch_delay=0.01)
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def _request(connection, method, path, body=None):
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_classify_with_keep_alive(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+
+    for number in ["1Z5R89390357567127", "RB123456785US", "not a number"]:
+        path = f"/classify?number={quote(number)}"
+        status, result = _request(connection, "GET", path)
+        assert status == 200
+
+        expected = get_tracking_number(number)
+        if expected:
+            assert result == json.loads(json.dumps(expected.to_dict()))
+        else:
+            assert result is None
+
+    connection.close()
+    assert server.stats.connections_total == 1
+
+
+def test_batch_endpoint(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+    numbers = ["1Z5R89390357567127", "not a number"]
+
+    body = json.dumps(numbers)
+    status, results = _request(connection, "POST", "/classify/batch", body)
+
+    assert status == 200
+    assert results[0]["courier"]["code"] == "ups"
+    assert results[1] is None
+
+
+def test_concurrent_singles_are_micro_batched(server):
+    def classify(_):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port)
+        try:
+            return _request(connection, "GET", "/classify?number=RB123456785US")
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        responses = list(executor.map(classify, range(64)))
+
+    assert all(status == 200 for status, _ in responses)
+    assert all(result["product"]["name"] == "S10" for _, result in responses)
+
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+    _, stats = _request(connection, "GET", "/stats")
+    assert stats["numbers_total"] == 64
+    assert stats["batches_total"] < 64
+    assert stats["connections_total"] == 65
+
+
+def test_errors(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+
+    assert _request(connection, "GET", "/classify")[0] == 400
+    assert _request(connection, "GET", "/nope")[0] == 404
+    assert _request(connection, "POST", "/classify/batch", "{")[0] == 400
+    assert _request(connection, "POST", "/stats")[0] == 405
+
+
+def test_failing_number_only_fails_itself(server, monkeypatch):
+    def get_tracking_number_or_fail(number):
+        if number == "fail":
+            raise RuntimeError("boom")
+        return get_tracking_number(number)
+
+    monkeypatch.setattr(
+        "tracking_numbers.server.get_tracking_number",
+        get_tracking_number_or_fail,
+    )
+
+    def classify(number):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port)
+        try:
+            return _request(connection, "GET", f"/classify?number={number}")
+        finally:
+            connection.close()
+
+    numbers = ["fail"] + ["RB123456785US"] * 5
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        responses = list(executor.map(classify, numbers))
+
+    assert responses[0] == (200, None)
+    assert all(result["product"]["name"] == "S10" for _, result in responses[1:])
+
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+    body = json.dumps(["fail", "1Z5R8939035756712A", "RB123456785US"])
+    status, results = _request(connection, "POST", "/classify/batch", body)
+    assert status == 200
+    assert results[:2] == [None, None]
+    assert results[2]["product"]["name"] == "S10"
+
+
+def test_unexpected_error_is_500(server, monkeypatch):
+    def classify_batch(numbers):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("tracking_numbers.server.classify_batch", classify_batch)
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+
+    assert _request(connection, "GET", "/classify?number=x")[0] == 500
+    # The connection is kept alive after the error
+    assert _request(connection, "POST", "/classify/batch", "[]")[0] == 500
+    assert _request(connection, "GET", "/stats")[0] == 200
+
+
+def test_negative_content_length(server):
+    with socket.create_connection(("127.0.0.1", server.port)) as sock:
+        sock.sendall(
+            b"POST /classify/batch HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: -5\r\n"
+            b"\r\n"
+        )
+        response = sock.makefile("rb").read()
+
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert b"Negative Content-Length" in response
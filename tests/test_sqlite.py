@@ -0,0 +1,113 @@
+import re
+import sqlite3
+
+import pytest
+
+import tracking_numbers
+from tracking_numbers import get_tracking_number
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+from tracking_numbers.sqlite import register_functions
+
+NUMBERS = [
+    "9405511108078863434863",
+    "1Z5R89390357567127",
+    "1Z5R89390357567128",
+    "RB123456785US",
+    "not a number",
+    None,
+]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    register_functions(connection)
+    connection.execute("CREATE TABLE shipments (number TEXT)")
+    connection.executemany(
+        "INSERT INTO shipments VALUES (?)",
+        [(number,) for number in NUMBERS],
+    )
+    yield connection
+    connection.close()
+
+
+def test_functions_agree_with_get_tracking_number(connection):
+    rows = connection.execute(
+        "SELECT number, tracking_courier(number), tracking_product(number), "
+        "tracking_valid(number), tracking_url(number), "
+        "tracking_serial_number(number) FROM shipments ORDER BY rowid"
+    ).fetchall()
+
+    for number, courier, product, valid, url, serial_number in rows:
+        tracking_number = get_tracking_number(number) if number else None
+        if tracking_number:
+            assert courier == tracking_number.courier.code
+            assert product == tracking_number.product.name
+            assert valid == 1
+            assert url == tracking_number.tracking_url
+            assert serial_number == "".join(map(str, tracking_number.serial_number))
+        else:
+            assert (courier, product, valid, url) == (None, None, 0, None)
+
+
+def test_generated_column_and_expression_index(connection):
+    connection.execute(
+        "CREATE TABLE parcels (number TEXT, "
+        "courier TEXT GENERATED ALWAYS AS (tracking_courier(number)))"
+    )
+    connection.execute("CREATE INDEX parcels_valid ON parcels (tracking_valid(number))")
+    connection.execute("INSERT INTO parcels (number) SELECT number FROM shipments")
+
+    couriers = connection.execute(
+        "SELECT courier FROM parcels WHERE tracking_valid(number) = 1 ORDER BY rowid"
+    ).fetchall()
+    assert couriers == [("usps",), ("ups",), ("s10",)]
+
+
+def test_integers_and_unrecognized_values():
+    connection = sqlite3.connect(":memory:")
+    register_functions(connection, cache_size=None)
+
+    assert connection.execute("SELECT tracking_courier(986578788855)").fetchone() == (
+        "fedex",
+    )
+    assert connection.execute("SELECT tracking_valid(1.5)").fetchone() == (0,)
+    assert connection.execute(
+        "SELECT tracking_courier('1Z5R8939035756712A')"
+    ).fetchone() == (None,)
+
+
+def test_unparseable_serial_number_is_unrecognized(monkeypatch):
+    # e.g. a loaded spec whose pattern allows letters its serial parser can't handle
+    letters = TrackingNumberDefinition(
+        courier=Courier(code="test", name="Test"),
+        product=Product(name="Test"),
+        number_regex=re.compile(r"X(?P<SerialNumber>[0-9A-Z]{5})(?P<CheckDigit>[0-9])"),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(),
+        checksum_validator=Mod10(),
+        additional_validations=[],
+    )
+    monkeypatch.setattr(
+        tracking_numbers,
+        "DEFINITIONS",
+        tracking_numbers.DEFINITIONS + [letters],
+    )
+    connection = sqlite3.connect(":memory:")
+    register_functions(connection)
+    connection.execute("CREATE TABLE parcels (number TEXT)")
+    connection.execute(
+        "CREATE INDEX parcels_courier ON parcels (tracking_courier(number))"
+    )
+    connection.executemany(
+        "INSERT INTO parcels VALUES (?)",
+        [("XAB1234",), ("X123455",)],
+    )
+
+    assert connection.execute(
+        "SELECT tracking_courier(number) FROM parcels ORDER BY rowid"
+    ).fetchall() == [(None,), ("test",)]
@@ -0,0 +1,85 @@
+import re
+
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.stream_scanner import find_tracking_numbers
+from tracking_numbers.stream_scanner import StreamScanner
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+TEXT = (
+    "order shipped via ups 1Z5R89390357567127, usps 9405 5111 0807 8863 4348 63 "
+    "and amazon T B A 123456789012 (not 1Z5R89390357567128 or x986578788855)\n"
+    "intl: RB123456785US."
+)
+
+
+def _numbers(tracking_numbers):
+    return [tracking_number.number for tracking_number in tracking_numbers]
+
+
+def test_find_tracking_numbers():
+    assert _numbers(find_tracking_numbers(TEXT)) == [
+        "1Z5R89390357567127",
+        "9405 5111 0807 8863 4348 63",
+        "T B A 123456789012",
+        "RB123456785US",
+    ]
+
+
+def test_chunk_boundaries_do_not_change_matches():
+    expected = _numbers(find_tracking_numbers(TEXT))
+    for chunk_size in (1, 2, 3, 7, 16):
+        scanner = StreamScanner()
+        found = []
+        for i in range(0, len(TEXT), chunk_size):
+            found.extend(scanner.feed(TEXT[i : i + chunk_size]))
+        found.extend(scanner.close())
+
+        assert _numbers(found) == expected
+
+
+def test_buffer_stays_bounded():
+    scanner = StreamScanner()
+    for _ in range(1000):
+        scanner.feed("no numbers here ")
+
+    assert len(scanner._buffer) <= scanner._window + len("no numbers here ")
+
+
+def test_matches_emitted_before_close():
+    scanner = StreamScanner()
+
+    assert _numbers(scanner.feed("1Z5R89390357567127" + " " * 200)) == [
+        "1Z5R89390357567127",
+    ]
+    assert scanner.close() == []
+
+
+def test_unparseable_candidate_does_not_stop_the_stream():
+    scanner = StreamScanner()
+    found = scanner.feed("log: 1Z5R8939035756712A ")
+    for chunk in ["more log lines " * 10, "intl: RB123456785US ", " " * 100]:
+        found.extend(scanner.feed(chunk))
+
+    assert _numbers(found + scanner.close()) == ["RB123456785US"]
+
+
+def test_validation_errors_do_not_stop_the_stream():
+    # The default serial number parser can't handle the letters the pattern allows
+    tn_definition = TrackingNumberDefinition(
+        courier=Courier(code="test", name="Test"),
+        product=Product(name="Test"),
+        number_regex=re.compile(r"X(?P<SerialNumber>[0-9A-Z]{5})(?P<CheckDigit>[0-9])"),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(),
+        checksum_validator=Mod10(),
+        additional_validations=[],
+    )
+    scanner = StreamScanner(definitions=[tn_definition])
+
+    found = scanner.feed("XAB1234 then ")
+    found.extend(scanner.feed("X123455 "))
+
+    assert _numbers(found + scanner.close()) == ["X123455"]
@@ -0,0 +1,82 @@
+import pickle
+import threading
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.batch import get_tracking_numbers
+from tracking_numbers.batch import get_tracking_numbers_threaded
+from tracking_numbers.batch import gil_disabled
+from tracking_numbers.helpers.equivalence import iter_inputs
+from tracking_numbers.matcher import TrackingNumberMatcher
+
+INPUTS = list(iter_inputs(seed=3, samples_per_definition=100))
+
+
+def _run_concurrently(target, threads=8):
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            target()
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert errors == []
+
+
+def test_threaded_batch_matches_sequential():
+    numbers = INPUTS * 3
+    expected = get_tracking_numbers(
+        numbers,
+        with_counts=True,
+        classify=get_tracking_number,
+    )
+
+    for workers in (1, 2, 8):
+        batch = get_tracking_numbers_threaded(
+            numbers,
+            with_counts=True,
+            classify=get_tracking_number,
+            workers=workers,
+            chunk_size=64,
+        )
+        assert batch.results == expected.results
+        assert batch.counts == expected.counts
+
+
+def test_default_workers_follow_gil():
+    batch = get_tracking_numbers_threaded(["1Z5R89390357567127"] * 3)
+
+    assert batch.results == [get_tracking_number("1Z5R89390357567127")] * 3
+    assert isinstance(gil_disabled(), bool)
+
+
+def test_shared_matcher_under_contention():
+    matcher = TrackingNumberMatcher()
+    expected = [get_tracking_number(number) for number in INPUTS]
+    results = []
+
+    def classify_all():
+        results.append([matcher.get(number) for number in INPUTS])
+
+    # Fresh copies, so that lazily computed attributes are raced on first use
+    definitions = pickle.loads(pickle.dumps(list(DEFINITIONS)))
+    fresh = TrackingNumberMatcher(definitions=definitions)
+
+    def classify_fresh():
+        for number in INPUTS:
+            for tn_definition in fresh.definitions:
+                tn_definition.is_valid(number)
+
+    _run_concurrently(classify_all)
+    _run_concurrently(classify_fresh)
+
+    assert all(result == expected for result in results)
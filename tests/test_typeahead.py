@@ -0,0 +1,132 @@
+import random
+import re
+
+import pytest
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_definition
+from tracking_numbers.automaton import MATCH
+from tracking_numbers.automaton import Nfa
+from tracking_numbers.automaton import UnsupportedPattern
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.typeahead import build_automaton
+from tracking_numbers.typeahead import TypeaheadMatcher
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+
+def _products(definitions):
+    return [definition.product.name for definition in definitions]
+
+
+def test_nfa_agrees_with_fullmatch():
+    patterns = [definition.number_regex for definition in DEFINITIONS]
+    nfa = Nfa(patterns, approximate=True)
+    rng = random.Random(0)
+
+    for index, pattern in enumerate(patterns):
+        if nfa.approximate[index]:
+            continue
+
+        for _ in range(500):
+            length = rng.randint(8, 36)
+            text = "".join(rng.choice("0123456789 1ZTBACUSR") for _ in range(length))
+            states = nfa.start_states[index]
+            for ch in text:
+                states = nfa.advance(states, ch)
+
+            accepted = any(nfa.kind[state] == MATCH for state in states)
+            assert accepted == bool(pattern.fullmatch(text)), text
+
+
+def test_lookahead_needs_approximate():
+    cdl = DEFINITIONS[0].number_regex
+
+    with pytest.raises(UnsupportedPattern):
+        Nfa([cdl])
+
+
+@pytest.mark.parametrize("regex", [r"(?i)AC[0-9]{3}", r"(?i:AC)[0-9]{3}"])
+def test_case_insensitive_is_unsupported(regex):
+    with pytest.raises(UnsupportedPattern):
+        Nfa([re.compile(regex)])
+
+
+def test_typing_a_ups_number():
+    matcher = TypeaheadMatcher()
+
+    status = matcher.push("1Z")
+    assert _products(status.possible) == ["UPS"]
+    assert status.complete == []
+
+    status = matcher.push("5R8939035756712")
+    assert _products(status.possible) == ["UPS"]
+    assert status.complete == []
+
+    status = matcher.push("7")
+    assert _products(status.complete) == ["UPS"]
+    assert _products(status.valid) == ["UPS"]
+
+    status = matcher.pop()
+    assert status.text == "1Z5R8939035756712"
+    assert status.valid == []
+
+    status = matcher.push("8")
+    assert _products(status.complete) == ["UPS"]
+    assert status.valid == []
+
+
+def test_impossible_prefix():
+    matcher = TypeaheadMatcher()
+
+    assert matcher.push("1Z!").possible == []
+    assert matcher.pop().possible
+
+
+def test_set_text():
+    matcher = TypeaheadMatcher()
+    matcher.push("9405511108078863434")
+
+    status = matcher.set_text("9405511108078863434863")
+    assert _products(status.valid) == ["USPS 91"]
+
+    status = matcher.set_text("RB123456785US")
+    assert _products(status.valid) == ["S10"]
+
+
+def test_shared_automaton():
+    ups = [d for d in DEFINITIONS if d.courier.code == "ups"]
+    automaton = build_automaton(ups)
+    first = TypeaheadMatcher(ups, automaton=automaton)
+    second = TypeaheadMatcher(ups, automaton=automaton)
+
+    first.push("1Z5R8939")
+
+    assert second.push("1Z") == TypeaheadMatcher(ups).push("1Z")
+    assert first.push("0357567127") == TypeaheadMatcher(ups).push("1Z5R89390357567127")
+    assert TypeaheadMatcher(automaton=automaton).definitions == ups
+    with pytest.raises(ValueError):
+        TypeaheadMatcher(DEFINITIONS, automaton=automaton)
+
+
+def test_unsupported_patterns_fall_back_to_re():
+    ups = get_definition("UPS")
+    digits = TrackingNumberDefinition(
+        courier=Courier(code="test", name="Test"),
+        product=Product(name="Test"),
+        number_regex=re.compile(r"T\d{4}"),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(),
+        checksum_validator=None,
+        additional_validations=[],
+    )
+    matcher = TypeaheadMatcher([ups, digits])
+
+    status = matcher.push("1Z")
+    assert status.possible == [ups, digits]
+    assert status.complete == []
+
+    status = matcher.set_text("T1234")
+    assert status.possible == [digits]
+    assert status.complete == status.valid == [digits]
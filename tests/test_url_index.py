@@ -0,0 +1,68 @@
+from tracking_numbers import get_tracking_number
+from tracking_numbers.url_index import template_key
+from tracking_numbers.url_index import UrlIndex
+
+INDEX = UrlIndex()
+
+USPS_NUMBER = "9405511108078863434863"
+UPS_NUMBER = "1Z5R89390357567127"
+FEDEX_NUMBER = "986578788855"
+
+
+def _products(tracking_numbers):
+    return [tracking_number.product.name for tracking_number in tracking_numbers]
+
+
+def test_template_key():
+    assert template_key("https://www.fedex.com/apps/fedextrack/?tracknumbers=%s") == (
+        "fedex.com",
+        "tracknumbers",
+    )
+    assert template_key("https://example.com/track/%s") is None
+    assert template_key(None) is None
+
+
+def test_index_keys():
+    assert ("tools.usps.com", "tlabels") in INDEX.keys()
+    assert ("wwwapps.ups.com", "tracknums") in INDEX.keys()
+    assert _products(INDEX.definitions_for("dhl.com/x?AWB=1")) == [
+        "DHL Express",
+        "DHL Express Air",
+    ]
+
+
+def test_tracking_urls_round_trip():
+    for number in (USPS_NUMBER, UPS_NUMBER, FEDEX_NUMBER):
+        tracking_number = get_tracking_number(number)
+
+        assert INDEX.get(tracking_number.tracking_url) == [tracking_number]
+
+
+def test_get_many():
+    urls = [
+        f"https://tools.usps.com/go/TrackConfirmAction?tLabels={USPS_NUMBER}",
+        f"tools.usps.com/go/TrackConfirmAction?tLabels={USPS_NUMBER}%2C{USPS_NUMBER}",
+        f"https://wwwapps.ups.com/WebTracking/track?track=yes&trackNums={UPS_NUMBER}",
+        f"https://fedex.com/apps/fedextrack/?tracknumbers={FEDEX_NUMBER}&cntry_code=us",
+        # Numbers are only tested against the template's definitions
+        f"https://www.fedex.com/apps/fedextrack/?tracknumbers={UPS_NUMBER}",
+        "https://tools.usps.com/go/TrackConfirmAction?tLabels=12345",
+        f"https://example.com/?tLabels={USPS_NUMBER}",
+        "not a url",
+        "http://[::1/?x=1",
+    ]
+
+    results = INDEX.get_many(urls)
+
+    assert [_products(tracking_numbers) for tracking_numbers in results] == [
+        ["USPS 91"],
+        ["USPS 91", "USPS 91"],
+        ["UPS"],
+        ["FedEx Express (12)"],
+        [],
+        [],
+        [],
+        [],
+        [],
+    ]
+    assert results[2] == [get_tracking_number(UPS_NUMBER)]
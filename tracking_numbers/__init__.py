@@ -1,17 +1,25 @@
 import os
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.lazy import courier_codes
+from tracking_numbers.lazy import Definitions
+from tracking_numbers.lazy import LazyDefinitions
+from tracking_numbers.lazy import load_courier
 from tracking_numbers.types import TrackingNumber
 
+DEFINITIONS: Definitions
 if not os.environ.get("CODE_GENERATING"):
-    from tracking_numbers._generated import DEFINITIONS
+    # Each courier's definitions are imported on first use
+    DEFINITIONS = LazyDefinitions()
 else:
     # When running codegen, it's very possible that the items in
     # DEFINITIONS are out of date / can't be successfully constructed
     # so we use an empty list so that codegen can still import utils
-    DEFINITIONS = []
+    DEFINITIONS = Definitions()
 
 
 def get_tracking_number(number: str) -> Optional[TrackingNumber]:
@@ -23,9 +31,57 @@ def get_tracking_number(number: str) -> Optional[TrackingNumber]:
     return None
 
 
+def is_valid(number: str) -> bool:
+    return any(tn_definition.is_valid(number) for tn_definition in DEFINITIONS)
+
+
+def detect_courier(number: str) -> Optional[Tuple[str, str]]:
+    for tn_definition in DEFINITIONS:
+        if tn_definition.is_valid(number):
+            return tn_definition.courier.code, tn_definition.product.name
+
+    return None
+
+
 def get_definition(product_name: str) -> Optional[TrackingNumberDefinition]:
     for tn_definition in DEFINITIONS:
         if tn_definition.product.name.lower() == product_name.lower():
             return tn_definition
 
     return None
+
+
+def get_definitions(
+    couriers: Optional[Iterable[str]] = None,
+) -> List[TrackingNumberDefinition]:
+    """All the definitions, or those of the given courier codes, in precedence order.
+    Until something needs all of them, only the given couriers' definitions are
+    imported.
+    """
+    if couriers is None:
+        return list(DEFINITIONS)
+
+    requested = {courier_code.lower() for courier_code in couriers}
+    if DEFINITIONS.loaded:
+        # Includes any definitions registered since
+        known = {tn_definition.courier.code.lower() for tn_definition in DEFINITIONS}
+    else:
+        known = set(courier_codes())
+
+    unknown = sorted(requested - known)
+    if unknown:
+        raise ValueError(f"Unknown courier: {', '.join(unknown)}")
+
+    if DEFINITIONS.loaded:
+        return [
+            tn_definition
+            for tn_definition in DEFINITIONS
+            if tn_definition.courier.code.lower() in requested
+        ]
+
+    definitions: List[TrackingNumberDefinition] = []
+    for courier_code in courier_codes():
+        if courier_code in requested:
+            definitions.extend(load_courier(courier_code))
+
+    return definitions
@@ -0,0 +1,13 @@
+# DO NOT EDIT - Generated by codegen.py
+
+# Courier code and module of each courier, in precedence order
+MANIFEST = [
+    ("cdl", "cdl"),
+    ("dhl", "dhl"),
+    ("amazon", "amazon"),
+    ("usps", "usps"),
+    ("fedex", "fedex"),
+    ("ups", "ups"),
+    ("s10", "s10"),
+    ("ontrac", "ontrac"),
+]
@@ -0,0 +1,22 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="amazon", name="Amazon"),
+        product=Product(name="Amazon Logistics"),
+        number_regex=re.compile(
+            "\\s*T\\s*B\\s*A\\s*(?P<SerialNumber>([0-9]\\s*){12,12})\\s*",
+        ),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=None,
+        additional_validations=[],
+    ),
+]
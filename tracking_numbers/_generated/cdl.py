@@ -0,0 +1,22 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="cdl", name="CDL"),
+        product=Product(name="CDL Last Mile Solutions"),
+        number_regex=re.compile(
+            "\\s*(?=.*[a-z])(?P<PackageId>([0-9a-f]\\s*){10,10})\\s*",
+        ),
+        tracking_url_template="https://ship.cdldelivers.com/Xcelerator/Tracking/Tracking?packageitemrefno=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=None,
+        additional_validations=[],
+    ),
+]
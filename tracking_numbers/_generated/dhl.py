@@ -0,0 +1,34 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.checksum_validator import Mod7
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="dhl", name="DHL"),
+        product=Product(name="DHL Express"),
+        number_regex=re.compile(
+            "\\s*(?P<SerialNumber>([0-9]\\s*){9})(?P<CheckDigit>([0-9]\\s*))",
+        ),
+        tracking_url_template="http://www.dhl.com/en/express/tracking.html?brand=DHL&AWB=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=Mod7(),
+        additional_validations=[],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="dhl", name="DHL"),
+        product=Product(name="DHL Express Air"),
+        number_regex=re.compile(
+            "\\s*(?P<SerialNumber>([0-9]\\s*){10})(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="http://www.dhl.com/en/express/tracking.html?brand=DHL&AWB=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=Mod7(),
+        additional_validations=[],
+    ),
+]
@@ -0,0 +1,118 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.checksum_validator import SumProductWithWeightsAndModulo
+from tracking_numbers.definition import AdditionalValidation
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.serial_number import PrependIf
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+from tracking_numbers.value_matcher import ExactValueMatcher
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="fedex", name="FedEx"),
+        product=Product(name="FedEx Express (12)"),
+        number_regex=re.compile(
+            "\\s*(?P<SerialNumber>([0-9]\\s*){11})(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://www.fedex.com/apps/fedextrack/?tracknumbers=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=SumProductWithWeightsAndModulo(
+            weights=[3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1],
+            first_modulo=11,
+            second_modulo=10,
+        ),
+        additional_validations=[],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="fedex", name="FedEx"),
+        product=Product(name="FedEx Express (34)"),
+        number_regex=re.compile(
+            "\\s*1\\s*0\\s*0\\s*[0-9]\\s*[0-9]\\s*([0-9]\\s*){10}(?P<DestinationZip>([0-9]\\s*){5})(?P<SerialNumber>([0-9]\\s*){13})(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://www.fedex.com/apps/fedextrack/?tracknumbers=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=SumProductWithWeightsAndModulo(
+            weights=[1, 7, 3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1],
+            first_modulo=11,
+            second_modulo=10,
+        ),
+        additional_validations=[],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="fedex", name="FedEx"),
+        product=Product(name="FedEx SmartPost"),
+        number_regex=re.compile(
+            "\\s*(?P<ApplicationIdentifier>9\\s*2\\s*)?(?P<SerialNumber>(?P<ServiceType>([0-9]\\s*){3})(?P<ShipperId>([0-9]\\s*){9})(?P<PackageId>([0-9]\\s*){7}))(?P<CheckDigit>([0-9]\\s*))",
+        ),
+        tracking_url_template="https://www.fedex.com/apps/fedextrack/?tracknumbers=%s",
+        serial_number_parser=DefaultSerialNumberParser(
+            prepend_if=PrependIf(matches_regex=re.compile("^(?!92).+"), content="92"),
+        ),
+        checksum_validator=Mod10(odds_multiplier=1, evens_multiplier=3),
+        additional_validations=[],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="fedex", name="FedEx"),
+        product=Product(name="FedEx Ground"),
+        number_regex=re.compile(
+            "\\s*(?P<SerialNumber>([0-9]\\s*){14})(?P<CheckDigit>([0-9]\\s*))",
+        ),
+        tracking_url_template="https://www.fedex.com/apps/fedextrack/?tracknumbers=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=Mod10(odds_multiplier=3, evens_multiplier=1),
+        additional_validations=[],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="fedex", name="FedEx"),
+        product=Product(name="FedEx Ground (SSCC-18)"),
+        number_regex=re.compile(
+            "\\s*(?P<ShippingContainerType>([0-9]\\s*){2})(?P<SerialNumber>([0-9]\\s*){15})(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://www.fedex.com/apps/fedextrack/?tracknumbers=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=Mod10(odds_multiplier=1, evens_multiplier=3),
+        additional_validations=[
+            AdditionalValidation(
+                name="Container Type",
+                regex_group_name="ShippingContainerType",
+                value_matchers=[
+                    ExactValueMatcher(value="00"),
+                    ExactValueMatcher(value="01"),
+                    ExactValueMatcher(value="02"),
+                    ExactValueMatcher(value="04"),
+                ],
+            ),
+        ],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="fedex", name="FedEx"),
+        product=Product(name="FedEx Ground 96 (22)"),
+        number_regex=re.compile(
+            "\\s*(?P<ApplicationIdentifier>9\\s*6\\s*)(?P<SCNC>([0-9]\\s*){2})(?P<ServiceType>([0-9]\\s*){3})(?P<SerialNumber>(?P<ShipperId>([0-9]\\s*){7})(?P<PackageId>([0-9]\\s*){7}))(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://www.fedex.com/apps/fedextrack/?tracknumbers=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=Mod10(odds_multiplier=3, evens_multiplier=1),
+        additional_validations=[],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="fedex", name="FedEx"),
+        product=Product(name="FedEx Ground GSN"),
+        number_regex=re.compile(
+            "\\s*(?P<ApplicationIdentifier>9\\s*6\\s*)(?P<SCNC>([0-9]\\s*){2})([0-9]\\s*){5}(?P<GSN>([0-9]\\s*){10})[0-9]\\s*(?P<SerialNumber>([0-9]\\s*){13})(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://www.fedex.com/apps/fedextrack/?tracknumbers=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=SumProductWithWeightsAndModulo(
+            weights=[1, 7, 3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1],
+            first_modulo=11,
+            second_modulo=10,
+        ),
+        additional_validations=[],
+    ),
+]
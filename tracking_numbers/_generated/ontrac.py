@@ -0,0 +1,26 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.serial_number import PrependIf
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="ontrac", name="OnTrac"),
+        product=Product(name="OnTrac"),
+        number_regex=re.compile(
+            "\\s*C\\s*(?P<SerialNumber>([0-9]\\s*){13})(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="http://www.ontrac.com/trackingres.asp?tracking_number=%s",
+        serial_number_parser=DefaultSerialNumberParser(
+            prepend_if=PrependIf(matches_regex=re.compile("^(?!4).+$"), content="4"),
+        ),
+        checksum_validator=Mod10(odds_multiplier=2, evens_multiplier=1),
+        additional_validations=[],
+    ),
+]
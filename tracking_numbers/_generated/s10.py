@@ -0,0 +1,242 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.checksum_validator import S10
+from tracking_numbers.definition import AdditionalValidation
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+from tracking_numbers.value_matcher import ExactValueMatcher
+from tracking_numbers.value_matcher import RegexValueMatcher
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="s10", name="S10 International Standard"),
+        product=Product(name="S10"),
+        number_regex=re.compile(
+            "\\s*(?P<ServiceType>([A-Z]\\s*){2})(?P<SerialNumber>([0-9]\\s*){8})(?P<CheckDigit>([0-9]\\s*))(?P<CountryCode>([A-Z]\\s*){2})",
+        ),
+        tracking_url_template=None,
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=S10(),
+        additional_validations=[
+            AdditionalValidation(
+                name="Service Type",
+                regex_group_name="ServiceType",
+                value_matchers=[
+                    RegexValueMatcher(pattern=re.compile("E[A-Z]")),
+                    RegexValueMatcher(pattern=re.compile("L[A-Z]")),
+                    RegexValueMatcher(pattern=re.compile("M[A-Z]")),
+                    RegexValueMatcher(pattern=re.compile("Q[A-M]")),
+                    RegexValueMatcher(pattern=re.compile("R[A-Z]")),
+                    RegexValueMatcher(pattern=re.compile("U[A-Z]")),
+                    RegexValueMatcher(pattern=re.compile("V[A-Z]")),
+                    RegexValueMatcher(pattern=re.compile("C[A-Z]")),
+                    RegexValueMatcher(pattern=re.compile("H[A-Z]")),
+                    RegexValueMatcher(
+                        pattern=re.compile("([BDNPZ][A-Z]|A[V-Z]|G[AD])"),
+                    ),
+                ],
+            ),
+            AdditionalValidation(
+                name="Courier",
+                regex_group_name="CountryCode",
+                value_matchers=[
+                    ExactValueMatcher(value="AF"),
+                    ExactValueMatcher(value="AL"),
+                    ExactValueMatcher(value="DZ"),
+                    ExactValueMatcher(value="AO"),
+                    ExactValueMatcher(value="AG"),
+                    ExactValueMatcher(value="AR"),
+                    ExactValueMatcher(value="AM"),
+                    ExactValueMatcher(value="AU"),
+                    ExactValueMatcher(value="AT"),
+                    ExactValueMatcher(value="AZ"),
+                    ExactValueMatcher(value="BS"),
+                    ExactValueMatcher(value="BH"),
+                    ExactValueMatcher(value="BD"),
+                    ExactValueMatcher(value="BB"),
+                    ExactValueMatcher(value="BY"),
+                    ExactValueMatcher(value="BE"),
+                    ExactValueMatcher(value="BZ"),
+                    ExactValueMatcher(value="BJ"),
+                    ExactValueMatcher(value="BT"),
+                    ExactValueMatcher(value="BO"),
+                    ExactValueMatcher(value="BA"),
+                    ExactValueMatcher(value="BW"),
+                    ExactValueMatcher(value="BR"),
+                    ExactValueMatcher(value="BN"),
+                    ExactValueMatcher(value="BG"),
+                    ExactValueMatcher(value="BF"),
+                    ExactValueMatcher(value="BI"),
+                    ExactValueMatcher(value="KH"),
+                    ExactValueMatcher(value="CM"),
+                    ExactValueMatcher(value="CA"),
+                    ExactValueMatcher(value="CV"),
+                    ExactValueMatcher(value="CF"),
+                    ExactValueMatcher(value="TD"),
+                    ExactValueMatcher(value="CL"),
+                    ExactValueMatcher(value="CN"),
+                    ExactValueMatcher(value="HK"),
+                    ExactValueMatcher(value="CO"),
+                    ExactValueMatcher(value="KM"),
+                    ExactValueMatcher(value="CG"),
+                    ExactValueMatcher(value="CR"),
+                    ExactValueMatcher(value="HR"),
+                    ExactValueMatcher(value="CU"),
+                    ExactValueMatcher(value="CY"),
+                    ExactValueMatcher(value="CZ"),
+                    ExactValueMatcher(value="CI"),
+                    ExactValueMatcher(value="KP"),
+                    ExactValueMatcher(value="CD"),
+                    ExactValueMatcher(value="DK"),
+                    ExactValueMatcher(value="DJ"),
+                    ExactValueMatcher(value="DM"),
+                    ExactValueMatcher(value="DO"),
+                    ExactValueMatcher(value="EC"),
+                    ExactValueMatcher(value="EG"),
+                    ExactValueMatcher(value="SV"),
+                    ExactValueMatcher(value="GQ"),
+                    ExactValueMatcher(value="ER"),
+                    ExactValueMatcher(value="EE"),
+                    ExactValueMatcher(value="ET"),
+                    ExactValueMatcher(value="FJ"),
+                    ExactValueMatcher(value="FI"),
+                    ExactValueMatcher(value="FR"),
+                    ExactValueMatcher(value="GA"),
+                    ExactValueMatcher(value="GM"),
+                    ExactValueMatcher(value="GE"),
+                    ExactValueMatcher(value="DE"),
+                    ExactValueMatcher(value="GH"),
+                    ExactValueMatcher(value="GB"),
+                    ExactValueMatcher(value="GR"),
+                    ExactValueMatcher(value="GD"),
+                    ExactValueMatcher(value="GT"),
+                    ExactValueMatcher(value="GN"),
+                    ExactValueMatcher(value="GW"),
+                    ExactValueMatcher(value="GY"),
+                    ExactValueMatcher(value="HT"),
+                    ExactValueMatcher(value="HN"),
+                    ExactValueMatcher(value="HU"),
+                    ExactValueMatcher(value="IS"),
+                    ExactValueMatcher(value="IN"),
+                    ExactValueMatcher(value="ID"),
+                    ExactValueMatcher(value="IR"),
+                    ExactValueMatcher(value="IQ"),
+                    ExactValueMatcher(value="IE"),
+                    ExactValueMatcher(value="IL"),
+                    ExactValueMatcher(value="IT"),
+                    ExactValueMatcher(value="JM"),
+                    ExactValueMatcher(value="JP"),
+                    ExactValueMatcher(value="JO"),
+                    ExactValueMatcher(value="KZ"),
+                    ExactValueMatcher(value="KE"),
+                    ExactValueMatcher(value="KI"),
+                    ExactValueMatcher(value="KR"),
+                    ExactValueMatcher(value="KW"),
+                    ExactValueMatcher(value="KG"),
+                    ExactValueMatcher(value="LA"),
+                    ExactValueMatcher(value="LV"),
+                    ExactValueMatcher(value="LB"),
+                    ExactValueMatcher(value="LS"),
+                    ExactValueMatcher(value="LR"),
+                    ExactValueMatcher(value="LY"),
+                    ExactValueMatcher(value="LI"),
+                    ExactValueMatcher(value="LT"),
+                    ExactValueMatcher(value="LU"),
+                    ExactValueMatcher(value="MG"),
+                    ExactValueMatcher(value="MW"),
+                    ExactValueMatcher(value="MY"),
+                    ExactValueMatcher(value="MV"),
+                    ExactValueMatcher(value="ML"),
+                    ExactValueMatcher(value="MT"),
+                    ExactValueMatcher(value="MR"),
+                    ExactValueMatcher(value="MU"),
+                    ExactValueMatcher(value="MX"),
+                    ExactValueMatcher(value="MD"),
+                    ExactValueMatcher(value="MC"),
+                    ExactValueMatcher(value="MN"),
+                    ExactValueMatcher(value="ME"),
+                    ExactValueMatcher(value="MA"),
+                    ExactValueMatcher(value="MZ"),
+                    ExactValueMatcher(value="MM"),
+                    ExactValueMatcher(value="NA"),
+                    ExactValueMatcher(value="NR"),
+                    ExactValueMatcher(value="NP"),
+                    ExactValueMatcher(value="NL"),
+                    ExactValueMatcher(value="NZ"),
+                    ExactValueMatcher(value="NI"),
+                    ExactValueMatcher(value="NE"),
+                    ExactValueMatcher(value="NG"),
+                    ExactValueMatcher(value="NO"),
+                    ExactValueMatcher(value="OM"),
+                    ExactValueMatcher(value="PK"),
+                    ExactValueMatcher(value="PA"),
+                    ExactValueMatcher(value="PG"),
+                    ExactValueMatcher(value="PY"),
+                    ExactValueMatcher(value="PE"),
+                    ExactValueMatcher(value="PH"),
+                    ExactValueMatcher(value="PL"),
+                    ExactValueMatcher(value="PT"),
+                    ExactValueMatcher(value="QA"),
+                    ExactValueMatcher(value="RO"),
+                    ExactValueMatcher(value="RU"),
+                    ExactValueMatcher(value="RW"),
+                    ExactValueMatcher(value="KN"),
+                    ExactValueMatcher(value="LC"),
+                    ExactValueMatcher(value="VC"),
+                    ExactValueMatcher(value="WS"),
+                    ExactValueMatcher(value="SM"),
+                    ExactValueMatcher(value="ST"),
+                    ExactValueMatcher(value="SA"),
+                    ExactValueMatcher(value="SN"),
+                    ExactValueMatcher(value="RS"),
+                    ExactValueMatcher(value="SC"),
+                    ExactValueMatcher(value="SL"),
+                    ExactValueMatcher(value="SG"),
+                    ExactValueMatcher(value="SK"),
+                    ExactValueMatcher(value="SI"),
+                    ExactValueMatcher(value="SB"),
+                    ExactValueMatcher(value="SO"),
+                    ExactValueMatcher(value="ZA"),
+                    ExactValueMatcher(value="SS"),
+                    ExactValueMatcher(value="ES"),
+                    ExactValueMatcher(value="LK"),
+                    ExactValueMatcher(value="SD"),
+                    ExactValueMatcher(value="SR"),
+                    ExactValueMatcher(value="SZ"),
+                    ExactValueMatcher(value="SE"),
+                    ExactValueMatcher(value="CH"),
+                    ExactValueMatcher(value="SY"),
+                    ExactValueMatcher(value="TJ"),
+                    ExactValueMatcher(value="TZ"),
+                    ExactValueMatcher(value="TH"),
+                    ExactValueMatcher(value="MK"),
+                    ExactValueMatcher(value="TL"),
+                    ExactValueMatcher(value="TG"),
+                    ExactValueMatcher(value="TO"),
+                    ExactValueMatcher(value="TT"),
+                    ExactValueMatcher(value="TN"),
+                    ExactValueMatcher(value="TR"),
+                    ExactValueMatcher(value="TM"),
+                    ExactValueMatcher(value="TV"),
+                    ExactValueMatcher(value="UG"),
+                    ExactValueMatcher(value="UA"),
+                    ExactValueMatcher(value="AE"),
+                    ExactValueMatcher(value="US"),
+                    ExactValueMatcher(value="UY"),
+                    ExactValueMatcher(value="UZ"),
+                    ExactValueMatcher(value="VU"),
+                    ExactValueMatcher(value="VA"),
+                    ExactValueMatcher(value="VE"),
+                    ExactValueMatcher(value="VN"),
+                    ExactValueMatcher(value="YE"),
+                    ExactValueMatcher(value="ZM"),
+                    ExactValueMatcher(value="ZW"),
+                ],
+            ),
+        ],
+    ),
+]
@@ -0,0 +1,69 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.definition import AdditionalValidation
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import UPSSerialNumberParser
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+from tracking_numbers.value_matcher import ExactValueMatcher
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="ups", name="UPS"),
+        product=Product(name="UPS"),
+        number_regex=re.compile(
+            "\\s*1\\s*Z\\s*(?P<SerialNumber>(?P<ShipperId>(?:[A-Z0-9]\\s*){6,6})(?P<ServiceType>(?:[A-Z0-9]\\s*){2,2})(?P<PackageId>(?:[A-Z0-9]\\s*){7,7}))(?P<CheckDigit>[A-Z0-9]\\s*)",
+        ),
+        tracking_url_template="https://wwwapps.ups.com/WebTracking/track?track=yes&trackNums=%s",
+        serial_number_parser=UPSSerialNumberParser(),
+        checksum_validator=Mod10(odds_multiplier=2, evens_multiplier=1),
+        additional_validations=[
+            AdditionalValidation(
+                name="Service Type",
+                regex_group_name="ServiceType",
+                value_matchers=[
+                    ExactValueMatcher(value="01"),
+                    ExactValueMatcher(value="02"),
+                    ExactValueMatcher(value="03"),
+                    ExactValueMatcher(value="04"),
+                    ExactValueMatcher(value="12"),
+                    ExactValueMatcher(value="13"),
+                    ExactValueMatcher(value="15"),
+                    ExactValueMatcher(value="22"),
+                    ExactValueMatcher(value="32"),
+                    ExactValueMatcher(value="33"),
+                    ExactValueMatcher(value="41"),
+                    ExactValueMatcher(value="42"),
+                    ExactValueMatcher(value="44"),
+                    ExactValueMatcher(value="66"),
+                    ExactValueMatcher(value="67"),
+                    ExactValueMatcher(value="68"),
+                    ExactValueMatcher(value="72"),
+                    ExactValueMatcher(value="78"),
+                    ExactValueMatcher(value="90"),
+                    ExactValueMatcher(value="A0"),
+                    ExactValueMatcher(value="A1"),
+                    ExactValueMatcher(value="A2"),
+                    ExactValueMatcher(value="A8"),
+                    ExactValueMatcher(value="A9"),
+                    ExactValueMatcher(value="AA"),
+                    ExactValueMatcher(value="YW"),
+                ],
+            ),
+        ],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="ups", name="UPS"),
+        product=Product(name="UPS Mail Innovations - Sequence Number"),
+        number_regex=re.compile(
+            "\\s*8\\s*0\\s*(?P<SerialNumber>([0-9]\\s*){16,16})\\s*",
+        ),
+        tracking_url_template="https://wwwapps.ups.com/WebTracking/track?track=yes&trackNums=%s",
+        serial_number_parser=UPSSerialNumberParser(),
+        checksum_validator=None,
+        additional_validations=[],
+    ),
+]
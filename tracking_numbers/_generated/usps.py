@@ -0,0 +1,65 @@
+# DO NOT EDIT - Generated by codegen.py
+import re
+
+from tracking_numbers.checksum_validator import Mod10
+from tracking_numbers.definition import AdditionalValidation
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.serial_number import DefaultSerialNumberParser
+from tracking_numbers.serial_number import PrependIf
+from tracking_numbers.types import Courier
+from tracking_numbers.types import Product
+from tracking_numbers.value_matcher import ExactValueMatcher
+
+
+DEFINITIONS = [
+    TrackingNumberDefinition(
+        courier=Courier(code="usps", name="United States Postal Service"),
+        product=Product(name="USPS 20"),
+        number_regex=re.compile(
+            "\\s*(?P<SerialNumber>(?P<ServiceType>([0-9]\\s*){2})(?P<ShipperId>([0-9]\\s*){9})(?P<PackageId>([0-9]\\s*){8}))(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://tools.usps.com/go/TrackConfirmAction?tLabels=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=Mod10(odds_multiplier=1, evens_multiplier=3),
+        additional_validations=[
+            AdditionalValidation(
+                name="Service Type",
+                regex_group_name="ServiceType",
+                value_matchers=[
+                    ExactValueMatcher(value="03"),
+                    ExactValueMatcher(value="71"),
+                    ExactValueMatcher(value="73"),
+                    ExactValueMatcher(value="77"),
+                    ExactValueMatcher(value="81"),
+                ],
+            ),
+        ],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="usps", name="United States Postal Service"),
+        product=Product(name="USPS 34v2"),
+        number_regex=re.compile(
+            "\\s*(?P<RoutingApplicationId>4\\s*2\\s*0\\s*)(?P<DestinationZip>([0-9]\\s*){5})(?P<RoutingNumber>([0-9]\\s*){4})(?P<SerialNumber>(?P<ApplicationIdentifier>9\\s*[2345]\\s*)?(?P<ShipperId>([0-9]\\s*){8})(?P<PackageId>([0-9]\\s*){11}))(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://tools.usps.com/go/TrackConfirmAction?tLabels=%s",
+        serial_number_parser=DefaultSerialNumberParser(prepend_if=None),
+        checksum_validator=Mod10(odds_multiplier=1, evens_multiplier=3),
+        additional_validations=[],
+    ),
+    TrackingNumberDefinition(
+        courier=Courier(code="usps", name="United States Postal Service"),
+        product=Product(name="USPS 91"),
+        number_regex=re.compile(
+            "\\s*(?:(?P<RoutingApplicationId>4\\s*2\\s*0\\s*)(?P<DestinationZip>([0-9]\\s*){5}))?(?P<SerialNumber>(?P<ApplicationIdentifier>9\\s*[12345]\\s*)?(?P<SCNC>([0-9]\\s*){2})(?P<ServiceType>([0-9]\\s*){2})(?P<ShipperId>([0-9]\\s*){8})(?P<PackageId>([0-9]\\s*){11}|([0-9]\\s*){7}))(?P<CheckDigit>[0-9]\\s*)",
+        ),
+        tracking_url_template="https://tools.usps.com/go/TrackConfirmAction?tLabels=%s",
+        serial_number_parser=DefaultSerialNumberParser(
+            prepend_if=PrependIf(
+                matches_regex=re.compile("^(?!9[1-5]).+"),
+                content="91",
+            ),
+        ),
+        checksum_validator=Mod10(odds_multiplier=1, evens_multiplier=3),
+        additional_validations=[],
+    ),
+]
@@ -0,0 +1,147 @@
+"""Statistics over a stream of raw numbers in constant memory, for when only the mix
+of couriers, products and validation errors is needed rather than the results.
+
+    totals = aggregate(numbers)
+    print(totals.to_dict())
+
+Partial aggregates (e.g. one per worker process) are combined with merge(), and are
+small enough to send between processes.
+"""
+from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.hyperloglog import DEFAULT_PRECISION
+from tracking_numbers.helpers.hyperloglog import HyperLogLog
+
+# Courier code and product name
+DefinitionKey = Tuple[str, str]
+
+
+@dataclass
+class Aggregate:
+    """Counts of the numbers seen, by the definition they were recognized as:
+
+    - valid: numbers that are valid for the definition (as get_tracking_number())
+    - invalid: numbers that are valid for no definition, but match the pattern of
+      this one (the first, in precedence order)
+    - errors: the validation errors of the invalid numbers, by name (e.g. "checksum")
+    - distinct: an estimate of the distinct numbers, ignoring surrounding whitespace
+    """
+
+    total: int = 0
+    unrecognized: int = 0
+    valid: Dict[DefinitionKey, int] = field(default_factory=Counter)
+    invalid: Dict[DefinitionKey, int] = field(default_factory=Counter)
+    errors: Dict[str, int] = field(default_factory=Counter)
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+
+    def add(
+        self,
+        number: str,
+        tn_definition: Optional[TrackingNumberDefinition],
+        errors: Sequence[str] = (),
+    ):
+        """Counts a number that was recognized as the definition (or not at all, if
+        None), with the names of its validation errors.
+        """
+        self.total += 1
+        self.distinct.add(number.strip())
+        if tn_definition is None:
+            self.unrecognized += 1
+            return
+
+        key = tn_definition.courier.code, tn_definition.product.name
+        if errors:
+            self.invalid[key] += 1
+            for error in errors:
+                self.errors[error] += 1
+        else:
+            self.valid[key] += 1
+
+    def merge(self, other: "Aggregate") -> "Aggregate":
+        """Adds the other aggregate's counts to this one, and returns it"""
+        self.total += other.total
+        self.unrecognized += other.unrecognized
+        self.valid.update(other.valid)  # type: ignore
+        self.invalid.update(other.invalid)  # type: ignore
+        self.errors.update(other.errors)  # type: ignore
+        self.distinct.merge(other.distinct)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        couriers: Dict[str, Dict[str, Any]] = {}
+        for counts, status in ((self.valid, "valid"), (self.invalid, "invalid")):
+            for (courier_code, product_name), count in sorted(counts.items()):
+                courier = couriers.setdefault(
+                    courier_code,
+                    {"valid": 0, "invalid": 0, "products": {}},
+                )
+                product = courier["products"].setdefault(
+                    product_name,
+                    {"valid": 0, "invalid": 0},
+                )
+                courier[status] += count
+                product[status] += count
+
+        return {
+            "total": self.total,
+            "valid": sum(self.valid.values()),
+            "invalid": sum(self.invalid.values()),
+            "unrecognized": self.unrecognized,
+            "distinct": self.distinct.count(),
+            "couriers": couriers,
+            "errors": dict(sorted(self.errors.items())),
+        }
+
+
+def aggregate(
+    numbers: Iterable[str],
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    precision: int = DEFAULT_PRECISION,
+) -> Aggregate:
+    """Consumes the numbers (e.g. a generator over a file), keeping only the counts"""
+    definitions = list(DEFINITIONS if definitions is None else definitions)
+    totals = Aggregate(distinct=HyperLogLog(precision))
+    for number in numbers:
+        tn_definition, errors = _classify(number, definitions)
+        totals.add(number, tn_definition, errors)
+
+    return totals
+
+
+def _classify(
+    number: str,
+    definitions: Sequence[TrackingNumberDefinition],
+) -> Tuple[Optional[TrackingNumberDefinition], List[str]]:
+    first_invalid: Optional[TrackingNumberDefinition] = None
+    for tn_definition in definitions:
+        failed = tn_definition.check(number)
+        if failed is None:
+            continue
+        elif not failed:
+            return tn_definition, []
+        elif first_invalid is None:
+            first_invalid = tn_definition
+
+    if first_invalid is None:
+        return None, []
+
+    return first_invalid, _error_names(first_invalid, number)
+
+
+def _error_names(tn_definition: TrackingNumberDefinition, number: str) -> List[str]:
+    tracking_number = tn_definition.test(number)
+    if tracking_number is None:
+        return []
+
+    return [name for name, _ in tracking_number.validation_errors]
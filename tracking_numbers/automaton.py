@@ -0,0 +1,228 @@
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers.helpers.regex import sre_parse
+
+# Kinds of NFA state
+CHAR = 0
+SPLIT = 1
+SAVE = 2
+MATCH = 3
+EPSILON = 4
+
+_MAX_RANGE_SIZE = 256
+
+
+class UnsupportedPattern(ValueError):
+    pass
+
+
+class CharSet:
+    """A set of explicit characters, optionally along with all whitespace (`\\s`)"""
+
+    def __init__(self, chars: FrozenSet[str], whitespace: bool = False):
+        self.chars = chars
+        self.whitespace = whitespace
+
+    def __repr__(self):
+        return f"CharSet({''.join(sorted(self.chars))!r}, whitespace={self.whitespace})"
+
+    def __contains__(self, ch: str) -> bool:
+        return ch in self.chars or (self.whitespace and ch.isspace())
+
+
+class Nfa:
+    """A Thompson NFA for one or more patterns, compiled from the regex subset used by
+    the definitions: literals, character classes of literals/ranges/`\\s`, groups,
+    alternation and (bounded or unbounded) repetition.
+
+    Lookaheads can't be represented, so with `approximate=True` they are treated as
+    always succeeding. The NFA then accepts a superset of what the pattern does, and
+    `approximate[pattern]` is set so that callers know to confirm matches with `re`.
+
+    States are stored column-wise: `kind`, `charset` (CHAR), `out1`/`out2` (`out2` is
+    the lower priority branch of a SPLIT), `slot` (SAVE, the capture slot number as in
+    `2 * group` / `2 * group + 1`) and `owner`, the index of the pattern they belong
+    to. `starts[pattern]` is the start state of each pattern.
+    """
+
+    def __init__(self, patterns: Sequence[Pattern], approximate: bool = False):
+        self.kind: List[int] = []
+        self.charset: List[Optional[CharSet]] = []
+        self.out1: List[int] = []
+        self.out2: List[int] = []
+        self.slot: List[int] = []
+        self.owner: List[int] = []
+        self.starts: List[int] = []
+        self.approximate: List[bool] = []
+        self.group_counts: List[int] = []
+
+        self._allow_approximate = approximate
+        for index, pattern in enumerate(patterns):
+            self._owner = index
+            self._approximate = False
+            parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+            if pattern.flags & sre_parse.SRE_FLAG_IGNORECASE:
+                raise UnsupportedPattern(f"Case-insensitive pattern: {pattern.pattern}")
+
+            # Slots 0 and 1 hold the bounds of the whole match
+            end = self._save(1, self._add(MATCH))
+            start = self._sequence(list(parsed), end)
+            self.starts.append(self._save(0, start))
+            self.approximate.append(self._approximate)
+            self.group_counts.append(pattern.groups + 1)
+
+        self.follow = [
+            self._closure(out) if kind == CHAR else ()
+            for kind, out in zip(self.kind, self.out1)
+        ]
+        self.start_states = [self._closure(start) for start in self.starts]
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def advance(self, states: Sequence[int], ch: str) -> Tuple[int, ...]:
+        """The CHAR/MATCH states reached by consuming `ch` from `states`"""
+        reached: List[int] = []
+        seen = set()
+        for state in states:
+            if self.kind[state] == CHAR and ch in self.charset[state]:  # type: ignore
+                for next_state in self.follow[state]:
+                    if next_state not in seen:
+                        seen.add(next_state)
+                        reached.append(next_state)
+
+        return tuple(reached)
+
+    def _closure(self, state: int) -> Tuple[int, ...]:
+        """The CHAR and MATCH states reachable from `state` without consuming input,
+        in priority order.
+        """
+        if state < 0:
+            return ()
+
+        reached: List[int] = []
+        seen = set()
+        stack = [state]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+
+            seen.add(current)
+            kind = self.kind[current]
+            if kind in (CHAR, MATCH):
+                reached.append(current)
+            elif kind == SPLIT:
+                stack.append(self.out2[current])
+                stack.append(self.out1[current])
+            else:
+                stack.append(self.out1[current])
+
+        return tuple(reached)
+
+    def _add(
+        self,
+        kind: int,
+        charset: Optional[CharSet] = None,
+        out1: int = -1,
+        out2: int = -1,
+        slot: int = -1,
+    ) -> int:
+        self.kind.append(kind)
+        self.charset.append(charset)
+        self.out1.append(out1)
+        self.out2.append(out2)
+        self.slot.append(slot)
+        self.owner.append(self._owner)
+        return len(self.kind) - 1
+
+    def _save(self, slot: int, next_state: int) -> int:
+        return self._add(SAVE, out1=next_state, slot=slot)
+
+    def _sequence(self, items, next_state: int) -> int:
+        for op, av in reversed(items):
+            next_state = self._item(op, av, next_state)
+
+        return next_state
+
+    def _item(self, op, av, next_state: int) -> int:
+        if op is sre_parse.LITERAL:
+            return self._add(CHAR, CharSet(frozenset(chr(av))), out1=next_state)
+        elif op is sre_parse.IN:
+            return self._add(CHAR, _charset(av), out1=next_state)
+        elif op is sre_parse.SUBPATTERN:
+            group, add_flags, items = av[0], av[1], list(av[-1])
+            if add_flags & sre_parse.SRE_FLAG_IGNORECASE:
+                raise UnsupportedPattern("Case-insensitive group")
+
+            if group is None:
+                return self._sequence(items, next_state)
+
+            inner = self._sequence(items, self._save(2 * group + 1, next_state))
+            return self._save(2 * group, inner)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            return self._repeat(op is sre_parse.MAX_REPEAT, av, next_state)
+        elif op is sre_parse.BRANCH:
+            state = -1
+            for branch in reversed(av[1]):
+                branch_start = self._sequence(list(branch), next_state)
+                state = (
+                    branch_start
+                    if state < 0
+                    else self._add(SPLIT, out1=branch_start, out2=state)
+                )
+            return state
+        elif op is sre_parse.ASSERT and av[0] == 1 and self._allow_approximate:
+            self._approximate = True
+            return self._add(EPSILON, out1=next_state)
+
+        raise UnsupportedPattern(f"Unsupported regex construct: {op}")
+
+    def _repeat(self, greedy: bool, av, next_state: int) -> int:
+        min_count, max_count, item = av
+        item = list(item)
+
+        state = next_state
+        if max_count == sre_parse.MAXREPEAT:
+            loop = self._add(SPLIT)
+            body = self._sequence(item, loop)
+            self._set_split(loop, greedy, body, next_state)
+            state = loop
+        else:
+            for _ in range(max_count - min_count):
+                body = self._sequence(item, state)
+                split = self._add(SPLIT)
+                self._set_split(split, greedy, body, next_state)
+                state = split
+
+        for _ in range(min_count):
+            state = self._sequence(item, state)
+
+        return state
+
+    def _set_split(self, split: int, greedy: bool, body: int, skip: int):
+        if greedy:
+            self.out1[split], self.out2[split] = body, skip
+        else:
+            self.out1[split], self.out2[split] = skip, body
+
+
+def _charset(items) -> CharSet:
+    chars = set()
+    whitespace = False
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_parse.RANGE and av[1] - av[0] < _MAX_RANGE_SIZE:
+            chars.update(chr(code) for code in range(av[0], av[1] + 1))
+        elif op is sre_parse.CATEGORY and av is sre_parse.CATEGORY_SPACE:
+            whitespace = True
+        else:
+            raise UnsupportedPattern(f"Unsupported character class item: {op}")
+
+    return CharSet(frozenset(chars), whitespace)
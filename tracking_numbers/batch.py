@@ -0,0 +1,103 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.types import TrackingNumber
+
+DEFAULT_CHUNK_SIZE = 1024
+
+
+@dataclass
+class BatchResult:
+    """Results in the same order as the input. Duplicate inputs share the same
+    TrackingNumber object. When requested, `counts` maps each distinct input to the
+    number of times it occurred.
+    """
+
+    results: List[Optional[TrackingNumber]]
+    counts: Optional[Dict[str, int]] = None
+
+
+def get_tracking_numbers(
+    numbers: Iterable[str],
+    with_counts: bool = False,
+    classify: Callable[[str], Optional[TrackingNumber]] = get_tracking_number,
+) -> BatchResult:
+    """Classifies a batch of numbers, evaluating each distinct value only once"""
+    distinct: Dict[str, Optional[TrackingNumber]] = {}
+    counts: Optional[Dict[str, int]] = {} if with_counts else None
+    results: List[Optional[TrackingNumber]] = []
+
+    for number in numbers:
+        if number in distinct:
+            tracking_number = distinct[number]
+        else:
+            tracking_number = distinct[number] = classify(number)
+
+        results.append(tracking_number)
+        if counts is not None:
+            counts[number] = counts.get(number, 0) + 1
+
+    return BatchResult(results=results, counts=counts)
+
+
+def gil_disabled() -> bool:
+    """Whether this is a free-threaded build (e.g. python3.13t) running without the
+    GIL, where threads classify numbers in parallel.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def get_tracking_numbers_threaded(
+    numbers: Iterable[str],
+    with_counts: bool = False,
+    classify: Callable[[str], Optional[TrackingNumber]] = get_tracking_number,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BatchResult:
+    """The same as get_tracking_numbers(...), but the distinct numbers are classified
+    in chunks on a thread pool. Unlike a process pool, nothing is pickled.
+
+    Threads only run in parallel without the GIL, so by default this uses a thread per
+    CPU when the GIL is disabled and no threads at all when it isn't.
+    """
+    if workers is None:
+        workers = (os.cpu_count() or 1) if gil_disabled() else 1
+
+    numbers = list(numbers)
+    distinct = list(dict.fromkeys(numbers))
+    if workers <= 1 or len(distinct) <= chunk_size:
+        return get_tracking_numbers(numbers, with_counts=with_counts, classify=classify)
+
+    # Import every courier's definitions up front rather than racing to on first use
+    DEFINITIONS.load()
+
+    chunks = [
+        distinct[start : start + chunk_size]
+        for start in range(0, len(distinct), chunk_size)
+    ]
+
+    def classify_chunk(chunk: List[str]) -> List[Optional[TrackingNumber]]:
+        return [classify(number) for number in chunk]
+
+    by_number: Dict[str, Optional[TrackingNumber]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk, results in zip(chunks, executor.map(classify_chunk, chunks)):
+            by_number.update(zip(chunk, results))
+
+    counts: Optional[Dict[str, int]] = None
+    if with_counts:
+        counts = dict.fromkeys(distinct, 0)
+        for number in numbers:
+            counts[number] += 1
+
+    return BatchResult(results=[by_number[n] for n in numbers], counts=counts)
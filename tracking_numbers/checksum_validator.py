@@ -17,6 +17,17 @@ class ChecksumValidator(metaclass=ABCMeta):
     def passes(self, serial_number: SerialNumber, check_digit: int) -> bool:
         raise NotImplementedError
 
+    def digit_weights(self, length: int) -> Optional[List[int]]:
+        """The weight of each digit when the checksum of a serial number of the given
+        length only depends on the weighted sum of its digits (see check_digit), or
+        None when it doesn't.
+        """
+        return None
+
+    def check_digit(self, total: int) -> int:
+        """The check digit for a weighted sum of the serial number digits"""
+        raise NotImplementedError
+
     @classmethod
     def from_spec(cls, validation_spec: Spec) -> Optional["ChecksumValidator"]:
         checksum_spec = validation_spec.get("checksum")
@@ -61,6 +72,18 @@ class S10(ChecksumValidator):
 
         return check == check_digit
 
+    def digit_weights(self, length: int) -> Optional[List[int]]:
+        return _pad_weights(self.WEIGHTS, length)
+
+    def check_digit(self, total: int) -> int:
+        remainder = total % 11
+        if remainder == 1:
+            return 0
+        elif remainder == 0:
+            return 5
+
+        return 11 - remainder
+
 
 class Mod10(ChecksumValidator):
     def __init__(
@@ -97,11 +120,26 @@ class Mod10(ChecksumValidator):
 
         return check == check_digit
 
+    def digit_weights(self, length: int) -> Optional[List[int]]:
+        odds = self.odds_multiplier or 1
+        evens = self.evens_multiplier or 1
+        return [evens if index % 2 == 0 else odds for index in range(length)]
+
+    def check_digit(self, total: int) -> int:
+        return (10 - total % 10) % 10
+
 
 class Mod7(ChecksumValidator):
     def passes(self, serial_number: SerialNumber, check_digit: int) -> bool:
         return check_digit == (to_int(serial_number) % 7)
 
+    def digit_weights(self, length: int) -> Optional[List[int]]:
+        # The number modulo 7 is the sum of each digit times its power of ten
+        return [pow(10, length - index - 1, 7) for index in range(length)]
+
+    def check_digit(self, total: int) -> int:
+        return total % 7
+
 
 class SumProductWithWeightsAndModulo(ChecksumValidator):
     def __init__(self, weights: List[int], first_modulo: int, second_modulo: int):
@@ -124,3 +162,14 @@ class SumProductWithWeightsAndModulo(ChecksumValidator):
 
         check = total % self.first_modulo % self.second_modulo
         return check == check_digit
+
+    def digit_weights(self, length: int) -> Optional[List[int]]:
+        return _pad_weights(self.weights, length)
+
+    def check_digit(self, total: int) -> int:
+        return total % self.first_modulo % self.second_modulo
+
+
+def _pad_weights(weights: List[int], length: int) -> List[int]:
+    # Digits past the weights are ignored (they're zipped together)
+    return list(weights[:length]) + [0] * (length - len(weights))
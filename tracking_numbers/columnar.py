@@ -0,0 +1,82 @@
+from array import array
+from dataclasses import dataclass
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+
+NO_MATCH = -1
+
+
+@dataclass
+class ColumnarResult:
+    """Column-oriented results of classifying a batch of numbers, one row per input.
+
+    - definition_indexes: array('h') of indexes into `definitions`. This is the first
+      definition the number is valid for or, if there is none, the first definition
+      whose pattern matched. NO_MATCH (-1) when no pattern matched at all.
+    - valid: bitmap with bit `row % 8` of byte `row // 8` set when the row is valid
+      (little-endian bit order, e.g. `numpy.unpackbits(..., bitorder="little")`).
+    - error_codes: array('B') of CHECKSUM_ERROR / ADDITIONAL_VALIDATION_ERROR bit
+      flags for the matched definition, if requested.
+    """
+
+    definitions: Tuple[TrackingNumberDefinition, ...]
+    definition_indexes: array
+    valid: bytearray
+    error_codes: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.definition_indexes)
+
+    def is_valid(self, row: int) -> bool:
+        return bool(self.valid[row >> 3] & (1 << (row & 7)))
+
+    def definition(self, row: int) -> Optional[TrackingNumberDefinition]:
+        index = self.definition_indexes[row]
+        return self.definitions[index] if index != NO_MATCH else None
+
+
+def classify_columnar(
+    numbers: Iterable[str],
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    errors: bool = False,
+) -> ColumnarResult:
+    definitions = tuple(DEFINITIONS if definitions is None else definitions)
+
+    definition_indexes = array("h")
+    valid = bytearray()
+    error_codes = array("B") if errors else None
+
+    for row, number in enumerate(numbers):
+        if row & 7 == 0:
+            valid.append(0)
+
+        match_index = NO_MATCH
+        match_errors = 0
+        for index, tn_definition in enumerate(definitions):
+            definition_errors = tn_definition.check(number)
+            if definition_errors is None:
+                continue
+
+            if not definition_errors:
+                match_index, match_errors = index, 0
+                valid[row >> 3] |= 1 << (row & 7)
+                break
+
+            if match_index == NO_MATCH:
+                match_index, match_errors = index, definition_errors
+
+        definition_indexes.append(match_index)
+        if error_codes is not None:
+            error_codes.append(match_errors)
+
+    return ColumnarResult(
+        definitions=definitions,
+        definition_indexes=definition_indexes,
+        valid=valid,
+        error_codes=error_codes,
+    )
@@ -0,0 +1,293 @@
+"""Reads gzip, bz2 or xz compressed (or uncompressed) newline-delimited files, with the
+decompression running in a background thread ahead of classification.
+
+The compression libraries release the GIL while decompressing, so the reader thread
+fills a bounded queue with large blocks of lines while the consumer classifies the
+previous ones. The format is detected from the file's magic bytes.
+
+    stats = PipelineStats()
+    for tracking_number in scan_compressed_file("export.csv.gz", stats=stats):
+        ...
+    print(stats.summary())
+"""
+import bz2
+import gzip
+import lzma
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import BinaryIO
+from typing import Callable
+from typing import Deque
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.types import TrackingNumber
+
+GZIP = "gzip"
+BZ2 = "bz2"
+XZ = "xz"
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+DEFAULT_QUEUE_SIZE = 8
+
+_MAGIC_BYTES = [
+    (b"\x1f\x8b", GZIP),
+    (b"BZh", BZ2),
+    (b"\xfd7zXZ\x00", XZ),
+]
+
+_OPENERS: dict = {
+    GZIP: lambda raw: gzip.GzipFile(fileobj=raw, mode="rb"),
+    BZ2: lambda raw: bz2.BZ2File(raw, mode="rb"),
+    XZ: lambda raw: lzma.LZMAFile(raw, mode="rb"),
+}
+
+# How often a blocked reader checks whether the consumer went away
+_PUT_TIMEOUT = 0.1
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Work done by one stage of the pipeline. `busy_seconds` is time spent working
+    and `wait_seconds` time spent blocked on the other stage.
+    """
+
+    lines: int = 0
+    bytes: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.busy_seconds if self.busy_seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class PipelineStats:
+    compression: Optional[str] = None
+    compressed_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    decompress: StageStats = field(default_factory=StageStats)
+    classify: StageStats = field(default_factory=StageStats)
+
+    def summary(self) -> str:
+        lines = [
+            f"compression: {self.compression or 'none'}, "
+            f"{self.compressed_bytes} bytes in, {self.elapsed_seconds:.3f}s elapsed",
+        ]
+        stages = (("decompress", self.decompress), ("classify", self.classify))
+        for name, stage in stages:
+            lines.append(
+                f"{name}: {stage.lines} lines, {stage.bytes} bytes, "
+                f"busy {stage.busy_seconds:.3f}s, waiting {stage.wait_seconds:.3f}s, "
+                f"{stage.lines_per_second:.0f} lines/s, "
+                f"{stage.bytes_per_second / 1e6:.1f} MB/s"
+            )
+
+        return "\n".join(lines)
+
+
+def detect_compression(path: str) -> Optional[str]:
+    """GZIP, BZ2 or XZ according to the file's magic bytes, or None"""
+    with open(path, "rb") as f:
+        head = f.read(6)
+
+    for magic, compression in _MAGIC_BYTES:
+        if head.startswith(magic):
+            return compression
+
+    return None
+
+
+def iter_line_blocks(
+    path: str,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    stats: Optional[PipelineStats] = None,
+) -> Iterator[List[str]]:
+    """Yields the lines of the file (decoded as UTF-8, without line endings) in blocks
+    of about `block_size` decompressed bytes, read ahead by up to `queue_size` blocks
+    in a background thread.
+    """
+    stats = stats if stats is not None else PipelineStats()
+    stats.compression = detect_compression(path)
+    blocks: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    reader = threading.Thread(
+        target=_read_blocks,
+        args=(path, block_size, blocks, stop, stats),
+        name="tracking-numbers-reader",
+        daemon=True,
+    )
+    started = time.perf_counter()
+    reader.start()
+    try:
+        while True:
+            waiting = time.perf_counter()
+            block = blocks.get()
+            stats.classify.wait_seconds += time.perf_counter() - waiting
+
+            if block is _DONE:
+                break
+            elif isinstance(block, BaseException):
+                raise block
+
+            yield block
+    finally:
+        stop.set()
+        reader.join()
+        stats.elapsed_seconds = time.perf_counter() - started
+
+
+def scan_compressed_file(
+    path: str,
+    workers: Optional[int] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    stats: Optional[PipelineStats] = None,
+    classify: Callable[[str], Optional[TrackingNumber]] = get_tracking_number,
+) -> Iterator[Optional[TrackingNumber]]:
+    """Classifies every line of the (possibly compressed) file, yielding the results
+    in file order. The blocks are classified in the calling thread, or by a pool of
+    `workers` processes (the classify function must then be picklable).
+    """
+    stats = stats if stats is not None else PipelineStats()
+    blocks = iter_line_blocks(path, block_size, queue_size, stats)
+
+    if workers is None or workers <= 1:
+        for block in blocks:
+            started = time.perf_counter()
+            results = [classify(line) for line in block]
+            _record_classified(stats, block, started)
+            yield from results
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Tuple[List[str], Future]] = deque()
+        for block in blocks:
+            pending.append((block, executor.submit(_classify_block, classify, block)))
+            # Keeps at most a couple of blocks per worker in flight
+            while len(pending) > 2 * workers:
+                yield from _collect(stats, *pending.popleft())
+
+        while pending:
+            yield from _collect(stats, *pending.popleft())
+
+
+def _collect(
+    stats: PipelineStats,
+    block: List[str],
+    future: Future,
+) -> List[Optional[TrackingNumber]]:
+    started = time.perf_counter()
+    results = future.result()
+    # With workers this is the time spent waiting on them, not their CPU time
+    _record_classified(stats, block, started)
+    return results
+
+
+def _record_classified(stats: PipelineStats, block: List[str], started: float):
+    stats.classify.busy_seconds += time.perf_counter() - started
+    stats.classify.lines += len(block)
+    stats.classify.bytes += sum(len(line) + 1 for line in block)
+
+
+def _classify_block(
+    classify: Callable[[str], Optional[TrackingNumber]],
+    block: List[str],
+) -> List[Optional[TrackingNumber]]:
+    return [classify(line) for line in block]
+
+
+def _read_blocks(
+    path: str,
+    block_size: int,
+    blocks: queue.Queue,
+    stop: threading.Event,
+    stats: PipelineStats,
+):
+    decompress = stats.decompress
+    try:
+        with open(path, "rb") as raw:
+            opener = _OPENERS.get(stats.compression)  # type: ignore
+            f: BinaryIO = opener(raw) if opener else raw
+
+            # The data read since the last newline, joined once the line ends (so a
+            # line spanning many blocks is copied once rather than on every read)
+            pending: List[bytes] = []
+            while not stop.is_set():
+                started = time.perf_counter()
+                data = f.read(block_size)
+                if data:
+                    end = data.rfind(b"\n") + 1
+                    if not end:
+                        pending.append(data)
+                        decompress.busy_seconds += time.perf_counter() - started
+                        continue
+
+                    pending.append(data[:end])
+                    data, pending = b"".join(pending), [data[end:]]
+                else:
+                    data, pending = b"".join(pending), []
+                    if not data:
+                        break
+
+                block = _split_lines(data)
+                stats.compressed_bytes = raw.tell()
+                decompress.bytes += len(data)
+                decompress.lines += len(block)
+                decompress.busy_seconds += time.perf_counter() - started
+
+                if not _put(blocks, block, stop, decompress):
+                    return
+
+            if opener:
+                f.close()
+    except BaseException as e:
+        _put(blocks, e, stop, decompress)
+        return
+
+    _put(blocks, _DONE, stop, decompress)
+
+
+def _put(
+    blocks: queue.Queue,
+    item: object,
+    stop: threading.Event,
+    decompress: StageStats,
+) -> bool:
+    waiting = time.perf_counter()
+    try:
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+    finally:
+        decompress.wait_seconds += time.perf_counter() - waiting
+
+
+def _split_lines(data: bytes) -> List[str]:
+    lines = data.split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+
+    return [line.rstrip(b"\r").decode("utf-8", errors="replace") for line in lines]
@@ -0,0 +1,313 @@
+"""Suggests corrections for a number with one wrong, unreadable or missing digit, or two
+swapped adjacent characters, e.g. from OCR or manual entry.
+
+Rather than trying every digit at every position against every definition, the digit
+is solved for with the checksum: the checksums are all a function of a weighted sum
+of the serial number digits, so changing a single digit changes the sum by a known
+amount. Only candidates that pass the checksum are then fully validated.
+
+    from tracking_numbers.correction import suggest_corrections
+
+    suggest_corrections("9405511108078863434833")
+    # => [Correction(number='9405511108078863434863', edit='substitution', ...)]
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import cast
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Match
+from typing import Optional
+from typing import Pattern
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.checksum_validator import ChecksumValidator
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.regex import bound_whitespace
+from tracking_numbers.helpers.regex import max_width
+from tracking_numbers.helpers.regex import min_width
+from tracking_numbers.types import TrackingNumber
+
+SUBSTITUTION = "substitution"
+TRANSPOSITION = "transposition"
+INSERTION = "insertion"
+
+# Cheaper edits are ranked first
+_EDIT_RANKS = {SUBSTITUTION: 0, TRANSPOSITION: 1, INSERTION: 2}
+
+_DIGITS = "0123456789"
+_PLACEHOLDER = "0"
+
+Candidate = Tuple[str, int, str]
+
+
+@dataclass
+class Correction:
+    """A valid number one edit away from the input. The number has the whitespace
+    removed, and the position is the index of the edit in that number.
+    """
+
+    number: str
+    edit: str
+    position: int
+    tracking_number: TrackingNumber
+
+
+def suggest_corrections(
+    number: str,
+    transpositions: bool = True,
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+) -> List[Correction]:
+    """Returns the valid numbers that are a single edit away from `number`, ranked by
+    the kind of edit (substitutions, then transpositions, then insertions) and then
+    by definition precedence.
+
+    Only edits that the checksum can decide on are considered: a digit of the serial
+    number or the check digit. A wrong or missing character anywhere else can't be
+    told apart from any other digit, so isn't suggested. Neither are digits that the
+    pattern itself constrains (e.g. a fixed prefix), when they're wrong.
+    """
+    compact = "".join(number.split())
+    ranked: List[Tuple[Tuple[int, int, int], Correction]] = []
+    for index, tn_definition in enumerate(
+        DEFINITIONS if definitions is None else definitions
+    ):
+        if not tn_definition.checksum_validator:
+            continue
+
+        for edit, position, candidate in _iter_candidates(
+            tn_definition,
+            compact,
+            transpositions,
+        ):
+            tracking_number = tn_definition.test(candidate)
+            if tracking_number and tracking_number.valid:
+                correction = Correction(candidate, edit, position, tracking_number)
+                ranked.append(((_EDIT_RANKS[edit], index, position), correction))
+
+    ranked.sort(key=lambda item: item[0])
+    corrections: List[Correction] = []
+    seen = set()
+    for _, correction in ranked:
+        if correction.number not in seen:
+            seen.add(correction.number)
+            corrections.append(correction)
+
+    return corrections
+
+
+def _iter_candidates(
+    tn_definition: TrackingNumberDefinition,
+    compact: str,
+    transpositions: bool,
+) -> Iterator[Candidate]:
+    min_length, max_length = _compact_widths(tn_definition.number_regex)
+    length = len(compact)
+
+    if min_length <= length and (max_length is None or length <= max_length):
+        match = tn_definition.number_regex.fullmatch(compact)
+        if match:
+            # A wrong digit or swapped characters that still fit the pattern, so the
+            # one match covers every position
+            layout = _Layout.from_match(tn_definition, match)
+            if layout:
+                for position, ch in enumerate(compact):
+                    for digit in layout.solve(position):
+                        if digit != ch:
+                            candidate = _replace(compact, position, digit)
+                            yield SUBSTITUTION, position, candidate
+
+                if transpositions:
+                    yield from _iter_transpositions(layout, compact)
+        else:
+            # An unreadable character (anything but a digit) where a digit belongs, or
+            # one swapped with a letter
+            for position, ch in enumerate(compact):
+                if ch.isdigit():
+                    continue
+
+                probe = _replace(compact, position, _PLACEHOLDER)
+                yield from _solve_probe(tn_definition, SUBSTITUTION, probe, position)
+                if transpositions:
+                    for swap in (position - 1, position):
+                        if 0 <= swap < length - 1:
+                            yield TRANSPOSITION, swap, _swap(compact, swap)
+
+    if min_length <= length + 1 and (max_length is None or length < max_length):
+        for position in range(length + 1):
+            probe = compact[:position] + _PLACEHOLDER + compact[position:]
+            yield from _solve_probe(tn_definition, INSERTION, probe, position)
+
+
+def _solve_probe(
+    tn_definition: TrackingNumberDefinition,
+    edit: str,
+    probe: str,
+    position: int,
+) -> Iterator[Candidate]:
+    match = tn_definition.number_regex.fullmatch(probe)
+    if match:
+        layout = _Layout.from_match(tn_definition, match)
+        if layout:
+            for digit in layout.solve(position):
+                yield edit, position, _replace(probe, position, digit)
+
+
+def _iter_transpositions(layout: "_Layout", compact: str) -> Iterator[Candidate]:
+    for position in range(len(compact) - 1):
+        first, second = compact[position], compact[position + 1]
+        if first == second:
+            continue
+        if not (layout.covers(position) or layout.covers(position + 1)):
+            continue
+
+        if layout.passes_with({position: second, position + 1: first}):
+            yield TRANSPOSITION, position, _swap(compact, position)
+
+
+def _replace(number: str, position: int, ch: str) -> str:
+    return number[:position] + ch + number[position + 1 :]
+
+
+def _swap(number: str, position: int) -> str:
+    return (
+        number[:position]
+        + number[position + 1]
+        + number[position]
+        + number[position + 2 :]
+    )
+
+
+class _Layout:
+    """Where the serial number and check digit are in a matched number, and the
+    weighted sum of the serial number digits.
+    """
+
+    def __init__(
+        self,
+        tn_definition: TrackingNumberDefinition,
+        number: str,
+        serial_span: Tuple[int, int],
+        check_position: int,
+    ):
+        self.number = number
+        self.serial_start, self.serial_end = serial_span
+        self.check_position = check_position
+        self.parser = tn_definition.serial_number_parser
+        self.validator = cast(ChecksumValidator, tn_definition.checksum_validator)
+
+        check = number[check_position]
+        self.check = int(check) if check.isdigit() else None
+
+        self.values = self.parser.parse(number[self.serial_start : self.serial_end])
+        # Some parsers prepend digits to the serial number
+        self.offset = len(self.values) - (self.serial_end - self.serial_start)
+
+        weights = self.validator.digit_weights(len(self.values))
+        self.weighted = weights is not None
+        self.weights = weights or []
+        self.total = 0
+        for value, weight in zip(self.values, self.weights):
+            self.total += value * weight
+
+        prepend_if = getattr(self.parser, "prepend_if", None)
+        # Whether the prepending depends on the first characters of the serial number
+        self.prefix_length = len(prepend_if.content) if prepend_if else 0
+
+    @classmethod
+    def from_match(
+        cls,
+        tn_definition: TrackingNumberDefinition,
+        match: Match,
+    ) -> Optional["_Layout"]:
+        groupindex = tn_definition.number_regex.groupindex
+        if "SerialNumber" not in groupindex or "CheckDigit" not in groupindex:
+            return None
+
+        serial_span = match.span("SerialNumber")
+        check_start, check_end = match.span("CheckDigit")
+        if serial_span[0] == -1 or check_end - check_start != 1:
+            return None
+
+        try:
+            layout = cls(tn_definition, match.string, serial_span, check_start)
+        except ValueError:
+            return None
+
+        return layout if layout.weighted else None
+
+    def covers(self, position: int) -> bool:
+        return (
+            position == self.check_position
+            or self.serial_start <= position < self.serial_end
+        )
+
+    def solve(self, position: int) -> List[str]:
+        """The digits that pass the checksum at the given position"""
+        if position == self.check_position:
+            check = self.validator.check_digit(self.total)
+            return [str(check)] if 0 <= check <= 9 else []
+        elif not self.serial_start <= position < self.serial_end or self.check is None:
+            return []
+        elif position - self.serial_start < self.prefix_length:
+            return [d for d in _DIGITS if self._passes_with_reparse({position: d})]
+
+        index = self.offset + position - self.serial_start
+        weight = self.weights[index]
+        partial = self.total - weight * self.values[index]
+        return [
+            digit
+            for value, digit in enumerate(_DIGITS)
+            if self.validator.check_digit(partial + weight * value) == self.check
+        ]
+
+    def passes_with(self, changes: Dict[int, str]) -> bool:
+        """Whether the checksum passes with the characters at the given positions
+        changed, updating the weighted sum rather than recomputing it.
+        """
+        total = self.total
+        check = self.check
+        for position, ch in changes.items():
+            if position == self.check_position:
+                check = int(ch) if ch.isdigit() else None
+            elif self.serial_start <= position < self.serial_end:
+                if position - self.serial_start < self.prefix_length:
+                    return self._passes_with_reparse(changes)
+
+                try:
+                    value = self.parser.parse(ch)[-1]
+                except ValueError:
+                    return False
+
+                index = self.offset + position - self.serial_start
+                total += self.weights[index] * (value - self.values[index])
+
+        return check is not None and self.validator.check_digit(total) == check
+
+    def _passes_with_reparse(self, changes: Dict[int, str]) -> bool:
+        chars = list(self.number)
+        for position, ch in changes.items():
+            chars[position] = ch
+
+        check = chars[self.check_position]
+        if not check.isdigit():
+            return False
+
+        try:
+            serial_number = self.parser.parse(
+                "".join(chars[self.serial_start : self.serial_end]),
+            )
+        except ValueError:
+            return False
+
+        return self.validator.passes(serial_number, int(check))
+
+
+@lru_cache(maxsize=None)
+def _compact_widths(pattern: Pattern) -> Tuple[int, Optional[int]]:
+    """The shortest and longest match without any whitespace"""
+    compact_pattern = bound_whitespace(pattern, 0)
+    return min_width(compact_pattern), max_width(compact_pattern)
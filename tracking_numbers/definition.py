@@ -1,11 +1,14 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict
 from typing import List
+from typing import Match
 from typing import Optional
 from typing import Pattern
 
 from tracking_numbers.checksum_validator import ChecksumValidator
 from tracking_numbers.compat import parse_regex
+from tracking_numbers.helpers.regex import min_width
 from tracking_numbers.helpers.repr import repr_with_args
 from tracking_numbers.serial_number import DefaultSerialNumberParser
 from tracking_numbers.serial_number import SerialNumberParser
@@ -20,6 +23,10 @@ from tracking_numbers.value_matcher import ValueMatcher
 
 MatchData = Dict[str, str]
 
+# Bit flags returned by TrackingNumberDefinition.check(...)
+CHECKSUM_ERROR = 1
+ADDITIONAL_VALIDATION_ERROR = 2
+
 
 @dataclass
 class AdditionalValidation:
@@ -114,7 +121,16 @@ class TrackingNumberDefinition:
         if not match:
             return None
 
-        match_data = match.groupdict() if match else {}
+        return self.test_match_data(tracking_number, match.groupdict())
+
+    def test_match_data(
+        self,
+        tracking_number: str,
+        match_data: MatchData,
+    ) -> TrackingNumber:
+        """The result for a number already known to match the pattern, given the
+        named groups of the match (e.g. from another matching engine).
+        """
         serial_number = self._get_serial_number(match_data)
         validation_errors = self._get_validation_errors(serial_number, match_data)
 
@@ -130,11 +146,19 @@ class TrackingNumberDefinition:
     def _get_serial_number(self, match_data: MatchData) -> Optional[SerialNumber]:
         raw_serial_number = match_data.get("SerialNumber")
         if raw_serial_number:
+            return self._parse_serial_number(raw_serial_number)
+
+        return None
+
+    def _parse_serial_number(self, raw_serial_number: str) -> Optional[SerialNumber]:
+        # A loaded spec's pattern may allow characters (e.g. letters) that its
+        # parser can't turn into digits, which can never pass the checksum
+        try:
             return self.serial_number_parser.parse(
                 _remove_whitespace(raw_serial_number),
             )
-
-        return None
+        except ValueError:
+            return None
 
     def _get_validation_errors(
         self,
@@ -162,15 +186,22 @@ class TrackingNumberDefinition:
             return None
 
         if not serial_number:
+            if match_data.get("SerialNumber"):
+                return "checksum", "SerialNumber is not numeric"
+
             return "checksum", "SerialNumber not found"
 
         check_digit = match_data.get("CheckDigit")
         if not check_digit:
             return "checksum", "CheckDigit not found"
 
+        check_digit_value = _parse_check_digit(check_digit)
+        if check_digit_value is None:
+            return "checksum", "CheckDigit is not a digit"
+
         passes_checksum = self.checksum_validator.passes(
             serial_number=serial_number,
-            check_digit=int(check_digit),
+            check_digit=check_digit_value,
         )
 
         if not passes_checksum:
@@ -198,6 +229,93 @@ class TrackingNumberDefinition:
 
         return None
 
+    @cached_property
+    def min_length(self) -> int:
+        return min_width(self.number_regex)
+
+    def is_valid(self, tracking_number: str) -> bool:
+        """Equivalent to checking `test(tracking_number).valid`, but stops at the
+        first failed check (cheapest first) and doesn't build any result or error
+        message objects along the way.
+        """
+        if len(tracking_number) < self.min_length:
+            return False
+
+        match = self.number_regex.fullmatch(tracking_number)
+        if not match:
+            return False
+
+        if self.checksum_validator and not self._passes_checksum(match):
+            return False
+
+        for validation in self.additional_validations:
+            if not self._passes_additional(validation, match):
+                return False
+
+        return True
+
+    def check(self, tracking_number: str) -> Optional[int]:
+        """Returns None if the number doesn't match this definition at all. Otherwise
+        returns a bit mask of the failed validations (CHECKSUM_ERROR and
+        ADDITIONAL_VALIDATION_ERROR), which is 0 when the number is valid.
+        """
+        if len(tracking_number) < self.min_length:
+            return None
+
+        match = self.number_regex.fullmatch(tracking_number)
+        if not match:
+            return None
+
+        errors = 0
+        if self.checksum_validator and not self._passes_checksum(match):
+            errors |= CHECKSUM_ERROR
+
+        for validation in self.additional_validations:
+            if not self._passes_additional(validation, match):
+                errors |= ADDITIONAL_VALIDATION_ERROR
+                break
+
+        return errors
+
+    def _match_group(self, match: Match, name: str) -> Optional[str]:
+        if name not in self.number_regex.groupindex:
+            return None
+
+        return match.group(name)
+
+    def _passes_checksum(self, match: Match) -> bool:
+        raw_serial_number = self._match_group(match, "SerialNumber")
+        check_digit = self._match_group(match, "CheckDigit")
+        if not raw_serial_number or not check_digit:
+            return False
+
+        check_digit_value = _parse_check_digit(check_digit)
+        if check_digit_value is None:
+            return False
+
+        serial_number = self._parse_serial_number(raw_serial_number)
+        if serial_number is None:
+            return False
+
+        return self.checksum_validator.passes(  # type: ignore
+            serial_number=serial_number,
+            check_digit=check_digit_value,
+        )
+
+    def _passes_additional(
+        self,
+        validation: AdditionalValidation,
+        match: Match,
+    ) -> bool:
+        raw_value = self._match_group(match, validation.regex_group_name)
+        if not raw_value:
+            return False
+
+        value = _remove_whitespace(raw_value)
+        return any(
+            value_matcher.matches(value) for value_matcher in validation.value_matchers
+        )
+
     def tracking_url(self, tracking_number: str) -> Optional[str]:
         if not self.tracking_url_template:
             return None
@@ -207,3 +325,10 @@ class TrackingNumberDefinition:
 
 def _remove_whitespace(value: str) -> str:
     return "".join(ch for ch in value if ch.strip())
+
+
+def _parse_check_digit(check_digit: str) -> Optional[int]:
+    # Some patterns (e.g. UPS) allow a letter where the check digit goes, which can
+    # never pass the checksum
+    check_digit = check_digit.strip()
+    return int(check_digit) if check_digit.isdecimal() else None
@@ -0,0 +1,397 @@
+"""A matching engine that compiles the definition patterns into a single DFA, so that
+a number is matched against all of them in one pass over its characters.
+
+    matcher = DfaMatcher()
+    tracking_number = matcher.get("1Z5R89390357567127")
+
+The DFA is built by subset construction over the patterns' NFA (see automaton.py).
+Its states keep the NFA states in the priority order of a backtracking matcher, and
+every transition records which state each new NFA state came from and which capture
+slots it crossed. Matching only appends the taken transitions to an array, and the
+capture boundaries of the accepting definitions are recovered by walking those
+backwards, so each input character is read exactly once.
+
+Patterns outside of the subset that the NFA supports (e.g. CDL's lookahead) are
+matched with `re` instead.
+"""
+from array import array
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Match
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.automaton import CHAR
+from tracking_numbers.automaton import MATCH
+from tracking_numbers.automaton import Nfa
+from tracking_numbers.automaton import SAVE
+from tracking_numbers.automaton import SPLIT
+from tracking_numbers.automaton import UnsupportedPattern
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.types import TrackingNumber
+
+DEFAULT_MAX_STATES = 100_000
+
+DEAD = 0
+START = 1
+
+# The NFA states reached by a transition and the capture slots crossed on the way
+Closure = List[Tuple[int, Tuple[int, ...]]]
+
+Span = Tuple[int, int]
+
+
+class DfaMatch:
+    """The match of a number against one definition, with the same accessors as the
+    `re.Match` that `number_regex.fullmatch()` would return.
+    """
+
+    def __init__(
+        self,
+        tn_definition: TrackingNumberDefinition,
+        string: str,
+        spans: Sequence[Span],
+    ):
+        self.definition = tn_definition
+        self.string = string
+        self.spans = spans
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(product={self.definition.product.name!r}, "
+            f"string={self.string!r})"
+        )
+
+    def span(self, group=0) -> Span:
+        return self.spans[self._group_index(group)]
+
+    def start(self, group=0) -> int:
+        return self.span(group)[0]
+
+    def end(self, group=0) -> int:
+        return self.span(group)[1]
+
+    def group(self, group=0) -> Optional[str]:
+        start, end = self.span(group)
+        return None if start < 0 else self.string[start:end]
+
+    def groupdict(self) -> Dict[str, Optional[str]]:
+        return {
+            name: self.group(index)
+            for name, index in self.definition.number_regex.groupindex.items()
+        }
+
+    def _group_index(self, group) -> int:
+        if isinstance(group, str):
+            return self.definition.number_regex.groupindex[group]
+
+        return group
+
+
+class DfaMatcher:
+    """Matches numbers against the definitions (in precedence order) with a single
+    DFA compiled from all their patterns. The transition table is an `array` of
+    `len(states) * len(character classes)` target states, where the character
+    classes group together the characters that no pattern tells apart.
+    """
+
+    def __init__(
+        self,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+        max_states: int = DEFAULT_MAX_STATES,
+    ):
+        self.definitions = list(DEFINITIONS if definitions is None else definitions)
+
+        # Definitions whose patterns the NFA can't represent are matched with `re`
+        self._fallback: List[int] = []
+        self._compiled: List[int] = []
+        for index, tn_definition in enumerate(self.definitions):
+            try:
+                Nfa([tn_definition.number_regex])
+            except UnsupportedPattern:
+                self._fallback.append(index)
+            else:
+                self._compiled.append(index)
+
+        compiled = self._compiled
+        self._nfa = Nfa([self.definitions[index].number_regex for index in compiled])
+        self._build_classes()
+        self._build_states(max_states)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(states={self.state_count}, "
+            f"classes={self._width}, fallback={len(self._fallback)})"
+        )
+
+    @property
+    def fallback(self) -> List[TrackingNumberDefinition]:
+        """The definitions that are matched with `re`"""
+        return [self.definitions[index] for index in self._fallback]
+
+    @property
+    def state_count(self) -> int:
+        return len(self._threads)
+
+    def get(self, number: str) -> Optional[TrackingNumber]:
+        """The first valid result, like get_tracking_number(). The DFA narrows the
+        definitions down to the accepting ones, which are then validated with
+        is_valid() before their captures are worked out.
+        """
+        for tracking_number in self._iter_valid(number):
+            return tracking_number
+
+        return None
+
+    def get_all(self, number: str) -> List[TrackingNumber]:
+        """All the valid results, in precedence order"""
+        return list(self._iter_valid(number))
+
+    def accepting(self, number: str) -> List[TrackingNumberDefinition]:
+        """The definitions whose pattern matches the whole number, in precedence
+        order, without working out the capture groups.
+        """
+        state = self._run(number, None)
+        return [
+            self.definitions[index]
+            for index, owner, _ in self._candidates[state]
+            if owner >= 0 or self._fallback_match(index, number)
+        ]
+
+    def match(self, number: str) -> List[DfaMatch]:
+        """The matches of the whole number against each definition, in precedence
+        order.
+        """
+        return list(self._iter_matches(number))
+
+    def _iter_matches(self, number: str) -> Iterator[DfaMatch]:
+        # Only works out the captures of a definition when it's reached
+        path = array("i")
+        state = self._run(number, path)
+        for index, owner, thread in self._candidates[state]:
+            match = self._match(number, path, index, owner, thread)
+            if match:
+                yield match
+
+    def _iter_valid(self, number: str) -> Iterator[TrackingNumber]:
+        # The path is only recorded (in a second pass) once a definition is valid
+        path: Optional[array] = None
+        state = self._run(number, None)
+        for index, owner, thread in self._candidates[state]:
+            # Most accepting definitions fail validation, and the bool-only check is
+            # much cheaper than recovering the captures and building a result
+            if not self.definitions[index].is_valid(number):
+                continue
+
+            if path is None:
+                path = array("i")
+                self._run(number, path)
+
+            match = self._match(number, path, index, owner, thread)
+            if match:
+                yield match.definition.test_match_data(
+                    number,
+                    match.groupdict(),  # type: ignore
+                )
+
+    def _match(
+        self,
+        number: str,
+        path: array,
+        index: int,
+        owner: int,
+        thread: int,
+    ) -> Optional[DfaMatch]:
+        if owner >= 0:
+            spans = self._spans(path, thread, self._nfa.group_counts[owner])
+        else:
+            re_match = self._fallback_match(index, number)
+            if not re_match:
+                return None
+
+            groups = range(re_match.re.groups + 1)
+            spans = [re_match.span(group) for group in groups]
+
+        return DfaMatch(self.definitions[index], number, spans)
+
+    def _fallback_match(self, index: int, number: str) -> Optional[Match]:
+        tn_definition = self.definitions[index]
+        if len(number) < tn_definition.min_length:
+            return None
+
+        return tn_definition.number_regex.fullmatch(number)
+
+    def _run(self, number: str, path: Optional[array]) -> int:
+        classes = self._classes
+        table = self._table
+        width = self._width
+        whitespace = self._whitespace_class
+        other = self._other_class
+
+        state = START
+        for ch in number:
+            char_class = classes.get(ch)
+            if char_class is None:
+                char_class = whitespace if ch.isspace() else other
+
+            transition = state * width + char_class
+            state = table[transition]
+            if state == DEAD:
+                break
+            elif path is not None:
+                path.append(transition)
+
+        return state
+
+    def _spans(self, path: array, thread: int, group_count: int) -> List[Span]:
+        # Walking backwards, the first time a slot is crossed is the last time it
+        # was set going forwards, which is the value a backtracking matcher keeps
+        slots = [-1] * (2 * group_count)
+        position = len(path)
+        for transition in reversed(path):
+            for slot in self._saves[transition][thread]:
+                if slots[slot] < 0:
+                    slots[slot] = position
+
+            thread = self._parents[transition][thread]
+            position -= 1
+
+        for slot in self._start_saves[thread]:
+            if slots[slot] < 0:
+                slots[slot] = 0
+
+        spans: List[Span] = []
+        for group in range(group_count):
+            start, end = slots[2 * group], slots[2 * group + 1]
+            spans.append((start, end) if start >= 0 and end >= 0 else (-1, -1))
+
+        return spans
+
+    def _build_classes(self):
+        """Groups the characters the patterns mention by the set of character sets
+        they belong to. Whitespace and other characters that no pattern mentions
+        get a class each.
+        """
+        nfa = self._nfa
+        charsets = [charset for charset in nfa.charset if charset is not None]
+        chars = sorted({ch for charset in charsets for ch in charset.chars})
+
+        by_signature: Dict[Tuple[bool, ...], int] = {}
+        self._representatives: List[str] = []
+
+        def class_of(ch: str) -> int:
+            signature = tuple(ch in charset for charset in charsets)
+            if signature not in by_signature:
+                by_signature[signature] = len(self._representatives)
+                self._representatives.append(ch)
+
+            return by_signature[signature]
+
+        self._classes = {ch: class_of(ch) for ch in chars}
+
+        # Only used for the characters that aren't in self._classes
+        whitespace = next(ch for ch in " \t\n\r\x0b\x0c\u3000" if ch not in chars)
+        other = next(ch for ch in "\x00\uffff" if ch not in chars)
+        self._whitespace_class = class_of(whitespace)
+        self._other_class = class_of(other)
+        self._width = len(self._representatives)
+
+    def _build_states(self, max_states: int):
+        nfa = self._nfa
+        start: Closure = []
+        seen: set = set()
+        for state in nfa.starts:
+            self._closure(state, (), start, seen)
+
+        # Candidates are (definition index, owner, thread) in precedence order, where
+        # the definitions matched with `re` are always candidates (with owner -1)
+        fallback = [(index, -1, -1) for index in self._fallback]
+
+        # DEAD is all-zero rows, with no threads
+        self._threads: List[Tuple[int, ...]] = [()]
+        self._candidates: List[Tuple[Tuple[int, int, int], ...]] = [tuple(fallback)]
+        self._table = array("i", [DEAD] * self._width)
+        self._parents: List[Tuple[int, ...]] = [()] * self._width
+        self._saves: List[Tuple[Tuple[int, ...], ...]] = [()] * self._width
+        self._start_saves = [saves for _, saves in start]
+
+        ids: Dict[Tuple[int, ...], int] = {}
+
+        def add(threads: Tuple[int, ...]) -> int:
+            state_id = ids.get(threads)
+            if state_id is None:
+                if len(self._threads) >= max_states:
+                    raise UnsupportedPattern(f"The DFA needs over {max_states} states")
+
+                state_id = ids[threads] = len(self._threads)
+                self._threads.append(threads)
+                accepting = [
+                    (self._compiled[nfa.owner[nfa_state]], nfa.owner[nfa_state], thread)
+                    for thread, nfa_state in enumerate(threads)
+                    if nfa.kind[nfa_state] == MATCH
+                ]
+                self._candidates.append(tuple(sorted(accepting + fallback)))
+                self._table.extend([DEAD] * self._width)
+                self._parents.extend([()] * self._width)
+                self._saves.extend([()] * self._width)
+
+            return state_id
+
+        add(tuple(state for state, _ in start))
+        state_id = START
+        while state_id < len(self._threads):
+            threads = self._threads[state_id]
+            for char_class, ch in enumerate(self._representatives):
+                reached: Closure = []
+                parents: List[int] = []
+                seen = set()
+                for thread, nfa_state in enumerate(threads):
+                    if nfa.kind[nfa_state] != CHAR:
+                        continue
+                    elif ch not in nfa.charset[nfa_state]:  # type: ignore
+                        continue
+
+                    count = len(reached)
+                    self._closure(nfa.out1[nfa_state], (), reached, seen)
+                    parents.extend([thread] * (len(reached) - count))
+
+                if reached:
+                    transition = state_id * self._width + char_class
+                    self._table[transition] = add(tuple(state for state, _ in reached))
+                    self._parents[transition] = tuple(parents)
+                    self._saves[transition] = tuple(saves for _, saves in reached)
+
+            state_id += 1
+
+    def _closure(
+        self,
+        state: int,
+        saves: Tuple[int, ...],
+        reached: Closure,
+        seen: set,
+    ):
+        """Appends the CHAR and MATCH states reachable from `state` without consuming
+        input to `reached`, in priority order, along with the capture slots crossed
+        on the way. States in `seen` were already reached by a higher priority path.
+        """
+        nfa = self._nfa
+        stack = [(state, saves)]
+        while stack:
+            current, saves = stack.pop()
+            if current < 0 or current in seen:
+                continue
+
+            seen.add(current)
+            kind = nfa.kind[current]
+            if kind in (CHAR, MATCH):
+                reached.append((current, saves))
+            elif kind == SPLIT:
+                stack.append((nfa.out2[current], saves))
+                stack.append((nfa.out1[current], saves))
+            elif kind == SAVE:
+                stack.append((nfa.out1[current], saves + (nfa.slot[current],)))
+            else:
+                stack.append((nfa.out1[current], saves))
@@ -0,0 +1,151 @@
+import csv
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import TextIO
+
+from tracking_numbers.types import DEFAULT_FIELDS
+from tracking_numbers.types import FIELDS
+from tracking_numbers.types import TrackingNumber
+
+DEFAULT_CSV_FIELDS = (
+    "number",
+    "courier_code",
+    "product_name",
+    "valid",
+    "tracking_url",
+)
+
+Encoder = Callable[[TrackingNumber], str]
+
+# Fields whose value only depends on the definition that produced the result
+_DEFINITION_FIELDS = {
+    "courier",
+    "courier_code",
+    "courier_name",
+    "product",
+    "product_name",
+}
+
+
+def write_jsonl(
+    results: Iterable[Optional[TrackingNumber]],
+    fp: TextIO,
+    fields: Sequence[str] = DEFAULT_FIELDS,
+) -> int:
+    """Writes one JSON object per line, the same as `json.dumps(result.to_dict(fields))`
+    but without building the dicts. Missing results (None) are written as `null`.
+    Returns the number of lines written.
+    """
+    encoder = JsonEncoder(fields)
+    count = 0
+    for result in results:
+        fp.write(encoder.encode(result) if result else "null")
+        fp.write("\n")
+        count += 1
+
+    return count
+
+
+def write_csv(
+    results: Iterable[Optional[TrackingNumber]],
+    fp: TextIO,
+    fields: Sequence[str] = DEFAULT_CSV_FIELDS,
+    header: bool = True,
+) -> int:
+    """Writes a CSV row per result with the given fields. Lists are flattened: the
+    serial number to its digits and the validation errors to "name: message" pairs
+    separated by "; ". Missing results (None) are written as empty rows.
+    Returns the number of rows written, excluding the header.
+    """
+    getters = [_csv_getter(field) for field in fields]
+    empty_row = [""] * len(fields)
+
+    writer = csv.writer(fp)
+    if header:
+        writer.writerow(fields)
+
+    count = 0
+    for result in results:
+        writer.writerow([getter(result) for getter in getters] if result else empty_row)
+        count += 1
+
+    return count
+
+
+class JsonEncoder:
+    """Encodes results as JSON objects with the given fields. Values that are the
+    same for every number of a definition (the courier and product) are encoded once
+    and reused.
+    """
+
+    def __init__(self, fields: Sequence[str] = DEFAULT_FIELDS):
+        for field in fields:
+            if field not in FIELDS:
+                raise ValueError(f"Unknown field: {field}")
+
+        self._constant_cache: Dict[tuple, str] = {}
+        self._encoders: List[Encoder] = [self._field_encoder(field) for field in fields]
+
+    def encode(self, tracking_number: TrackingNumber) -> str:
+        parts = [encoder(tracking_number) for encoder in self._encoders]
+        return "{" + ", ".join(parts) + "}"
+
+    def _field_encoder(self, field: str) -> Encoder:
+        key = encode_basestring_ascii(field) + ": "
+        getter = FIELDS[field]
+
+        if field in _DEFINITION_FIELDS:
+            cache = self._constant_cache
+
+            def encode_constant(tn: TrackingNumber) -> str:
+                cache_key = (field, tn.courier.code, tn.courier.name, tn.product.name)
+                fragment = cache.get(cache_key)
+                if fragment is None:
+                    fragment = cache[cache_key] = key + json.dumps(getter(tn))
+                return fragment
+
+            return encode_constant
+        elif field == "number":
+            return lambda tn: key + encode_basestring_ascii(tn.number)
+        elif field == "serial_number":
+            return lambda tn: key + _encode_serial_number(tn.serial_number)
+        elif field == "valid":
+            return lambda tn: key + ("false" if tn.validation_errors else "true")
+        elif field == "validation_errors":
+            return lambda tn: key + (
+                json.dumps(getter(tn)) if tn.validation_errors else "[]"
+            )
+
+        return lambda tn: key + json.dumps(getter(tn))
+
+
+def _encode_serial_number(serial_number: Optional[List[int]]) -> str:
+    if serial_number is None:
+        return "null"
+
+    return "[" + ", ".join(map(str, serial_number)) + "]"
+
+
+def _csv_getter(field: str) -> Callable[[TrackingNumber], object]:
+    if field not in FIELDS:
+        raise ValueError(f"Unknown field: {field}")
+
+    getter = FIELDS[field]
+    if field == "serial_number":
+        return lambda tn: "".join(map(str, tn.serial_number or []))
+    elif field == "validation_errors":
+        return lambda tn: "; ".join(
+            f"{name}: {message}" for name, message in tn.validation_errors
+        )
+    elif field == "courier":
+        return lambda tn: tn.courier.code
+    elif field == "product":
+        return lambda tn: tn.product.name
+
+    return getter
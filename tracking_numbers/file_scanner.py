@@ -0,0 +1,126 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.types import TrackingNumber
+
+DEFAULT_SHARD_SIZE = 64 * 1024 * 1024
+
+ByteRange = Tuple[int, int]
+
+
+def scan_file(
+    path: str,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Iterator[Optional[TrackingNumber]]:
+    """Classifies every line of a newline-delimited file, yielding the result of
+    get_tracking_number(...) for each line in file order.
+
+    The file is split into line-aligned byte ranges that are classified in separate
+    worker processes. Each worker memory-maps the file itself, so only the path and
+    offsets are sent to it, never the raw input.
+    """
+    ranges = split_ranges(path, shard_size)
+    for results in _map_ranges(_classify_range, path, ranges, workers):
+        yield from results
+
+
+def scan_file_to_shards(
+    path: str,
+    output_dir: str,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> List[str]:
+    """Like scan_file(...), but each worker writes its results to its own
+    tab-separated file in `output_dir` (number, courier code and product name, with
+    empty fields when there is no match) instead of sending them back.
+    Returns the shard paths in file order.
+    """
+    ranges = split_ranges(path, shard_size)
+    output_paths = [
+        os.path.join(output_dir, f"shard-{index:05d}.tsv")
+        for index in range(len(ranges))
+    ]
+
+    jobs = [
+        (start, end, output_path)
+        for (start, end), output_path in zip(ranges, output_paths)
+    ]
+    list(_map_ranges(_write_range, path, jobs, workers))
+    return output_paths
+
+
+def split_ranges(path: str, shard_size: int = DEFAULT_SHARD_SIZE) -> List[ByteRange]:
+    """Splits the file into byte ranges of roughly `shard_size` that each end just
+    after a newline (or at the end of the file).
+    """
+    size = os.path.getsize(path)
+    if not size:
+        return []
+
+    ranges: List[ByteRange] = []
+    with _open_mmap(path) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b"\n", min(start + shard_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _map_ranges(fn, path: str, jobs: list, workers: Optional[int]) -> Iterator:
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield fn(path, *job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(fn, [path] * len(jobs), *zip(*jobs))
+
+
+@contextmanager
+def _open_mmap(path: str) -> Iterator[mmap.mmap]:
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _iter_lines(path: str, start: int, end: int) -> Iterator[str]:
+    with _open_mmap(path) as mm:
+        position = start
+        while position < end:
+            newline = mm.find(b"\n", position, end)
+            line_end = end if newline == -1 else newline
+            line = mm[position:line_end]
+            yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+            position = line_end + 1
+
+
+def _classify_range(
+    path: str,
+    start: int,
+    end: int,
+) -> List[Optional[TrackingNumber]]:
+    return [get_tracking_number(line) for line in _iter_lines(path, start, end)]
+
+
+def _write_range(path: str, start: int, end: int, output_path: str) -> None:
+    with open(output_path, "w") as wf:
+        for line in _iter_lines(path, start, end):
+            tracking_number = get_tracking_number(line)
+            if tracking_number:
+                courier_code = tracking_number.courier.code
+                product_name = tracking_number.product.name
+            else:
+                courier_code = product_name = ""
+
+            wf.write(f"{line}\t{courier_code}\t{product_name}\n")
@@ -0,0 +1,148 @@
+import time
+from dataclasses import dataclass
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.regex import bound_whitespace
+from tracking_numbers.helpers.regex import DEFAULT_MAX_WHITESPACE_RUN
+from tracking_numbers.helpers.regex import max_width
+from tracking_numbers.types import TrackingNumber
+
+
+class InputGuard:
+    """Rejects input that no definition could reasonably match before any regex runs,
+    so the time spent on hostile input (huge strings, long runs of whitespace, etc.)
+    stays bounded.
+
+    - max_length: the most non-whitespace characters any definition can match
+    - max_whitespace: the most whitespace any definition accepts when every `\\s*` in
+      its pattern is limited to `max_whitespace_run` characters
+    """
+
+    def __init__(
+        self,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+        max_whitespace_run: int = DEFAULT_MAX_WHITESPACE_RUN,
+    ):
+        self.definitions = list(DEFINITIONS if definitions is None else definitions)
+        self.max_length = 0
+        self.max_whitespace = 0
+        for tn_definition in self.definitions:
+            length, whitespace = _width_budget(tn_definition, max_whitespace_run)
+            self.max_length = max(self.max_length, length)
+            self.max_whitespace = max(self.max_whitespace, whitespace)
+
+    def allows(self, number: str) -> bool:
+        if len(number) > self.max_length + self.max_whitespace:
+            return False
+
+        whitespace = sum(1 for ch in number if ch.isspace())
+        return (
+            whitespace <= self.max_whitespace
+            and len(number) - whitespace <= self.max_length
+        )
+
+    def get_tracking_number(self, number: str) -> Optional[TrackingNumber]:
+        if not self.allows(number):
+            return None
+
+        for tn_definition in self.definitions:
+            tracking_number = tn_definition.test(number)
+            if tracking_number and tracking_number.valid:
+                return tracking_number
+
+        return None
+
+
+def _width_budget(
+    tn_definition: TrackingNumberDefinition,
+    max_whitespace_run: int,
+) -> Tuple[int, int]:
+    no_whitespace = max_width(bound_whitespace(tn_definition.number_regex, 0))
+    with_whitespace = max_width(
+        bound_whitespace(tn_definition.number_regex, max_whitespace_run),
+    )
+    if no_whitespace is None or with_whitespace is None:
+        raise ValueError(
+            f"Pattern has no maximum length: {tn_definition.number_regex.pattern}",
+        )
+
+    return no_whitespace, with_whitespace - no_whitespace
+
+
+@dataclass
+class LatencyReport:
+    definition: TrackingNumberDefinition
+    worst_seconds: float
+    worst_input_kind: str
+    worst_input_length: int
+    guard_rejects: bool
+
+
+def iter_pathological_inputs(length: int, size: int) -> Iterator[Tuple[str, str]]:
+    """Near-miss inputs for patterns of (at most) `length` non-whitespace characters
+    that each fail on their very last character, with `size` controlling the amount
+    of whitespace.
+    """
+    yield "whitespace run", "0" + " " * size + "X"
+    yield "spaced digits", ("0" + " " * size) * length + "X"
+    yield "single spaced digits", "0 " * (length * size) + "X"
+    yield "spaced alphanumerics", ("A0" + " " * size) * length + "!"
+    yield "long digits", "0" * (length * size) + "X"
+
+
+def analyze_worst_case(
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    sizes: Sequence[int] = (1, 8, 64, 512),
+    repeat: int = 3,
+) -> List[LatencyReport]:
+    """Measures the worst fullmatch(...) time for each definition over generated
+    pathological inputs, and whether the default InputGuard would reject them.
+    """
+    guard = InputGuard(definitions)
+    reports: List[LatencyReport] = []
+    for tn_definition in guard.definitions:
+        length, _ = _width_budget(tn_definition, 0)
+        report = LatencyReport(tn_definition, 0.0, "", 0, True)
+        for size in sizes:
+            for kind, text in iter_pathological_inputs(length, size):
+                seconds = min(
+                    _time_fullmatch(tn_definition, text) for _ in range(repeat)
+                )
+                if seconds > report.worst_seconds:
+                    report.worst_seconds = seconds
+                    report.worst_input_kind = kind
+                    report.worst_input_length = len(text)
+                    report.guard_rejects = not guard.allows(text)
+
+        reports.append(report)
+
+    return reports
+
+
+def _time_fullmatch(tn_definition: TrackingNumberDefinition, text: str) -> float:
+    start = time.perf_counter()
+    tn_definition.number_regex.fullmatch(text)
+    return time.perf_counter() - start
+
+
+def main():
+    guard = InputGuard()
+    print(f"max length: {guard.max_length}, max whitespace: {guard.max_whitespace}")
+    for report in analyze_worst_case():
+        print(
+            f"{report.definition.product.name:40} "
+            f"{report.worst_seconds * 1e6:10.1f}us "
+            f"{report.worst_input_kind:22} "
+            f"len={report.worst_input_length:<7} "
+            f"{'rejected' if report.guard_rejects else 'ALLOWED'}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Measures how much the hot path allocates per call, using tracemalloc.
+
+For every definition, test() is profiled on a valid number, a number that matches the
+pattern but fails validation (when the definition validates anything) and a number
+that doesn't match. get_tracking_number() is profiled on the same inputs.
+
+    python -m tracking_numbers.helpers.allocations
+    python -m tracking_numbers.helpers.allocations --record tests/allocation_budgets.json
+"""
+import argparse
+import json
+import random
+import tracemalloc
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.regex import sample
+
+VALID = "valid"
+INVALID = "invalid"
+NO_MATCH = "no_match"
+
+DEFAULT_REPEAT = 200
+DEFAULT_TOLERANCE = 0.25
+# Absolute slack on top of the relative tolerance, so that tiny budgets don't fail
+# on a single extra block or a few bytes of interpreter noise
+BLOCK_SLACK = 2
+BYTE_SLACK = 256
+# The peak is the same on every run of the same interpreter (unlike what's retained,
+# which depends on free lists and caches warmed by earlier calls), so it's held to
+# a much tighter bound
+PEAK_TOLERANCE = 0.05
+PEAK_SLACK = 64
+
+_MAX_SAMPLE_ATTEMPTS = 1_000
+
+
+@dataclass
+class AllocationProfile:
+    """Allocations of a single call, averaged over the repeated calls.
+
+    - blocks/size: memory blocks (and their bytes) still alive after the call, i.e.
+      the result and everything it references
+    - peak: the highest traced memory during the call, including temporaries
+    """
+
+    blocks: float
+    size: float
+    peak: int
+
+
+def profile_call(
+    func: Callable[[Any], Any],
+    arg: Any,
+    repeat: int = DEFAULT_REPEAT,
+) -> AllocationProfile:
+    # Warm up lazily-built state (compiled lookups, caches) so it isn't counted
+    func(arg)
+
+    results: List[Any] = [None] * repeat
+    indexes = list(range(repeat))
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    try:
+        filters = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        before = tracemalloc.take_snapshot().filter_traces(filters)
+        for index in indexes:
+            results[index] = func(arg)
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+
+        peak = None
+        for _ in indexes:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func(arg)
+            call_peak = tracemalloc.get_traced_memory()[1] - current
+            peak = call_peak if peak is None else min(peak, call_peak)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    blocks = 0
+    size = 0
+    for stat in after.compare_to(before, "filename"):
+        blocks += stat.count_diff
+        size += stat.size_diff
+
+    return AllocationProfile(
+        blocks=max(blocks, 0) / repeat,
+        size=max(size, 0) / repeat,
+        peak=max(peak or 0, 0),
+    )
+
+
+def iter_cases(
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    seed: int = 0,
+) -> Iterator[Tuple[TrackingNumberDefinition, str, str]]:
+    """Yields (definition, case, number) with the case being VALID, INVALID or
+    NO_MATCH. Numbers are generated from the definition's pattern with a fixed seed,
+    so the same numbers are profiled every time.
+    """
+    rng = random.Random(seed)
+    for tn_definition in DEFINITIONS if definitions is None else definitions:
+        validates = bool(
+            tn_definition.checksum_validator or tn_definition.additional_validations
+        )
+        valid = None
+        invalid = None
+        for _ in range(_MAX_SAMPLE_ATTEMPTS):
+            number = sample(tn_definition.number_regex, rng, whitespace=0)
+            errors = tn_definition.check(number)
+            if errors == 0 and valid is None:
+                valid = number
+            elif errors and invalid is None:
+                invalid = number
+
+            if valid is not None and (invalid is not None or not validates):
+                break
+
+        if valid is not None:
+            yield tn_definition, VALID, valid
+            # No pattern allows a "!", so replacing the last character with one
+            # makes a number of the right length that doesn't match
+            yield tn_definition, NO_MATCH, valid[:-1] + "!"
+        if invalid is not None:
+            yield tn_definition, INVALID, invalid
+
+
+def profile_definitions(
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    repeat: int = DEFAULT_REPEAT,
+) -> Dict[str, AllocationProfile]:
+    """Profiles test() and get_tracking_number(), keyed by
+    "<function>:<courier code>:<product name>:<case>".
+    """
+    profiles: Dict[str, AllocationProfile] = {}
+    for tn_definition, case, number in iter_cases(definitions):
+        name = f"{tn_definition.courier.code}:{tn_definition.product.name}:{case}"
+        profiles[f"test:{name}"] = profile_call(tn_definition.test, number, repeat)
+        profiles[f"get_tracking_number:{name}"] = profile_call(
+            get_tracking_number,
+            number,
+            repeat,
+        )
+
+    return profiles
+
+
+def over_budget(
+    profile: AllocationProfile,
+    budget: AllocationProfile,
+    tolerance: float = DEFAULT_TOLERANCE,
+    peak_tolerance: float = PEAK_TOLERANCE,
+) -> List[str]:
+    """Returns the measures that regressed past the budget"""
+    regressions: List[str] = []
+    if profile.blocks > budget.blocks * (1 + tolerance) + BLOCK_SLACK:
+        regressions.append(f"blocks {profile.blocks:.1f} > {budget.blocks:.1f}")
+    if profile.size > budget.size * (1 + tolerance) + BYTE_SLACK:
+        regressions.append(f"size {profile.size:.0f} > {budget.size:.0f}")
+    if profile.peak > budget.peak * (1 + peak_tolerance) + PEAK_SLACK:
+        regressions.append(f"peak {profile.peak} > {budget.peak}")
+
+    return regressions
+
+
+def load_budgets(path: str) -> Dict[str, AllocationProfile]:
+    with open(path) as f:
+        budgets = json.load(f)
+
+    return {name: AllocationProfile(**value) for name, value in budgets.items()}
+
+
+def save_budgets(path: str, profiles: Dict[str, AllocationProfile]):
+    with open(path, "w") as f:
+        json.dump({name: asdict(p) for name, p in profiles.items()}, f, indent=2)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--record", metavar="PATH", help="save as the new budgets")
+    args = parser.parse_args()
+
+    profiles = profile_definitions(repeat=args.repeat)
+    print(f"{'blocks':>8} {'size':>8} {'peak':>8}  name")
+    for name, profile in profiles.items():
+        print(f"{profile.blocks:8.1f} {profile.size:8.0f} {profile.peak:8d}  {name}")
+
+    if args.record:
+        save_budgets(args.record, profiles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Checks that an optimized engine returns exactly what the reference linear scan over
+DEFINITIONS returns, and times both on the same inputs.
+
+    from tracking_numbers.helpers.equivalence import compare_engines
+    from tracking_numbers.matcher import TrackingNumberMatcher
+
+    report = compare_engines(TrackingNumberMatcher().get)
+    assert report.ok, report.mismatches[:10]
+    print(f"{report.speedup:.2f}x")
+"""
+import os
+import random
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.regex import sample
+from tracking_numbers.helpers.spec import DEFAULT_BASE_DIR
+from tracking_numbers.helpers.spec import iter_courier_specs
+from tracking_numbers.helpers.spec import iter_test_cases
+from tracking_numbers.types import TrackingNumber
+
+Engine = Callable[[str], Optional[TrackingNumber]]
+
+_NOISE_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdef -\t\n"
+
+
+def reference_get_tracking_number(number: str) -> Optional[TrackingNumber]:
+    """The linear scan that every engine has to agree with. Kept separate from
+    get_tracking_number() so that it stays the reference if that gets optimized.
+    """
+    for tn_definition in DEFINITIONS:
+        tracking_number = tn_definition.test(number)
+        if tracking_number and tracking_number.valid:
+            return tracking_number
+
+    return None
+
+
+@dataclass
+class Mismatch:
+    number: str
+    expected: Any
+    actual: Any
+
+
+@dataclass
+class EquivalenceReport:
+    inputs: int
+    engine_seconds: float
+    reference_seconds: float
+    mismatches: List[Mismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def speedup(self) -> float:
+        if not self.engine_seconds:
+            return 0.0
+        return self.reference_seconds / self.engine_seconds
+
+
+def compare_engines(
+    engine: Engine,
+    reference: Engine = reference_get_tracking_number,
+    inputs: Optional[Sequence[str]] = None,
+    seed: int = 0,
+    samples_per_definition: int = 200,
+) -> EquivalenceReport:
+    """Runs both engines over the inputs (by default, see iter_inputs) and reports
+    every number where the courier, product, serial number, URL or validation errors
+    differ. Exceptions are outcomes too: both engines have to raise the same type.
+    """
+    if inputs is None:
+        inputs = list(
+            iter_inputs(seed=seed, samples_per_definition=samples_per_definition)
+        )
+
+    reference_outcomes, reference_seconds = _run(reference, inputs)
+    engine_outcomes, engine_seconds = _run(engine, inputs)
+
+    report = EquivalenceReport(
+        inputs=len(inputs),
+        engine_seconds=engine_seconds,
+        reference_seconds=reference_seconds,
+    )
+    for number, expected, actual in zip(inputs, reference_outcomes, engine_outcomes):
+        if expected != actual:
+            report.mismatches.append(Mismatch(number, expected, actual))
+
+    return report
+
+
+def outcome(engine: Engine, number: str) -> Any:
+    """What's compared between engines for a single number"""
+    try:
+        tracking_number = engine(number)
+    except Exception as e:
+        return "raises", type(e).__name__
+
+    if tracking_number is None:
+        return None
+
+    return (
+        tracking_number.number,
+        tracking_number.courier.code,
+        tracking_number.product.name,
+        tracking_number.serial_number,
+        tracking_number.tracking_url,
+        tuple(tracking_number.validation_errors),
+    )
+
+
+def _run(engine: Engine, inputs: Sequence[str]):
+    start = time.perf_counter()
+    outcomes = [outcome(engine, number) for number in inputs]
+    return outcomes, time.perf_counter() - start
+
+
+def iter_inputs(
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    seed: int = 0,
+    samples_per_definition: int = 200,
+    spec_dir: str = DEFAULT_BASE_DIR,
+) -> Iterator[str]:
+    """The spec test numbers (when the data is available), random strings generated
+    from each definition's pattern, random noise, and near-miss mutations of all of
+    those.
+    """
+    rng = random.Random(seed)
+    seeds = list(_iter_spec_numbers(spec_dir))
+    for tn_definition in DEFINITIONS if definitions is None else definitions:
+        for _ in range(samples_per_definition):
+            seeds.append(sample(tn_definition.number_regex, rng))
+
+    for _ in range(samples_per_definition):
+        length = rng.randint(0, 40)
+        seeds.append("".join(rng.choice(_NOISE_CHARS) for _ in range(length)))
+
+    for number in seeds:
+        yield number
+        yield mutate(number, rng)
+
+
+def mutate(number: str, rng: random.Random) -> str:
+    """A random near-miss: one character substituted, deleted, inserted or swapped
+    with its neighbour, or whitespace added.
+    """
+    if not number:
+        return rng.choice(_NOISE_CHARS)
+
+    position = rng.randrange(len(number))
+    kind = rng.randrange(5)
+    if kind == 0:
+        return number[:position] + rng.choice(_NOISE_CHARS) + number[position + 1 :]
+    elif kind == 1:
+        return number[:position] + number[position + 1 :]
+    elif kind == 2:
+        return number[:position] + rng.choice(_NOISE_CHARS) + number[position:]
+    elif kind == 3 and position + 1 < len(number):
+        swapped = number[position + 1] + number[position]
+        return number[:position] + swapped + number[position + 2 :]
+
+    return number[:position] + " " * rng.randint(1, 3) + number[position:]
+
+
+def _iter_spec_numbers(spec_dir: str) -> Iterator[str]:
+    if not os.path.isdir(spec_dir):
+        return
+
+    for courier_spec in iter_courier_specs(spec_dir):
+        for _, number, _ in iter_test_cases(courier_spec):
+            yield number
@@ -0,0 +1,63 @@
+import hashlib
+import math
+
+DEFAULT_PRECISION = 14
+
+_HASH_BITS = 64
+
+
+class HyperLogLog:
+    """Estimates the number of distinct strings added, in `2 ** precision` bytes. The
+    standard error is about `1.04 / sqrt(2 ** precision)`, i.e. 0.8% by default.
+
+    Values are hashed with blake2b rather than hash(), so sketches built in different
+    processes can be merged.
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"Precision must be between 4 and 18, not {precision}")
+
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(precision={self.precision})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, HyperLogLog):
+            return NotImplemented
+
+        return self.precision == other.precision and self.registers == other.registers
+
+    def add(self, value: str):
+        digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+
+        index = hashed >> (_HASH_BITS - self.precision)
+        remaining_bits = _HASH_BITS - self.precision
+        rest = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog"):
+        """Adds everything that was added to the other sketch to this one"""
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Can't merge precision {other.precision} into {self.precision}",
+            )
+
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0**-rank for rank in self.registers)
+
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = size * math.log(size / zeros)
+
+        return round(estimate)
@@ -0,0 +1,185 @@
+import random
+import re
+from re import Pattern
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+try:
+    # Python 3.11+ moved the parser into the re package and deprecated the old name
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:  # pragma: no cover
+    import sre_parse  # type: ignore
+
+# Most whitespace characters allowed in a row inside a number, e.g. "1Z 999 AA1 ...",
+# wherever a bounded amount of whitespace is needed
+DEFAULT_MAX_WHITESPACE_RUN = 2
+
+
+def min_width(pattern: Pattern) -> int:
+    """The fewest characters that the pattern can possibly match. Since `\\s*`
+    contributes nothing to this, it is also a lower bound on the number of
+    non-whitespace characters in any input the pattern accepts.
+    """
+    return sre_parse.parse(pattern.pattern, pattern.flags).getwidth()[0]
+
+
+def max_width(pattern: Pattern) -> Optional[int]:
+    """The most characters that the pattern can possibly match, or None if that is
+    unbounded (e.g. because of `\\s*`).
+    """
+    width = sre_parse.parse(pattern.pattern, pattern.flags).getwidth()[1]
+    return width if width < sre_parse.MAXREPEAT else None
+
+
+def bound_whitespace(pattern: Pattern, max_run: int) -> Pattern:
+    """Rewrites every `\\s*` in the pattern to `\\s{0,max_run}` so that the pattern
+    has a finite maximum width.
+    """
+    bounded = pattern.pattern.replace("\\s*", f"\\s{{0,{max_run}}}")
+    return re.compile(bounded, pattern.flags)
+
+
+def first_chars(pattern: Pattern) -> Optional[FrozenSet[str]]:
+    """The characters that the first non-whitespace character of any input the
+    pattern accepts can be, or None if that can't be determined (e.g. `.`, `\\d` or a
+    case-insensitive pattern).
+    """
+    if pattern.flags & re.IGNORECASE:
+        return None
+
+    chars, _ = _first_of_sequence(sre_parse.parse(pattern.pattern, pattern.flags))
+    return None if chars is None else frozenset(chars)
+
+
+FirstChars = Tuple[Optional[Set[str]], bool]
+
+_MAX_RANGE_SIZE = 256
+
+
+def _first_of_sequence(items) -> FirstChars:
+    """Returns the possible first characters and whether the sequence can be skipped
+    entirely (i.e. it can match nothing but whitespace)
+    """
+    chars: Set[str] = set()
+    for op, av in items:
+        item_chars, nullable = _first_of_item(op, av)
+        if item_chars is None:
+            return None, False
+
+        chars |= item_chars
+        if not nullable:
+            return chars, False
+
+    return chars, True
+
+
+def _first_of_item(op, av) -> FirstChars:
+    if op is sre_parse.LITERAL:
+        ch = chr(av)
+        return (set(), True) if ch.isspace() else ({ch}, False)
+    elif op is sre_parse.IN:
+        return _first_of_set(av)
+    elif op is sre_parse.SUBPATTERN:
+        _, add_flags, _, items = av
+        if add_flags & sre_parse.SRE_FLAG_IGNORECASE:
+            # e.g. `(?i:ac)`, where the literals stand for both cases
+            return None, False
+
+        return _first_of_sequence(items)
+    elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+        min_count, _, item = av
+        chars, nullable = _first_of_sequence(item)
+        return chars, nullable or min_count == 0
+    elif op is sre_parse.BRANCH:
+        chars = set()
+        nullable = False
+        for branch in av[1]:
+            branch_chars, branch_nullable = _first_of_sequence(branch)
+            if branch_chars is None:
+                return None, False
+
+            chars |= branch_chars
+            nullable = nullable or branch_nullable
+
+        return chars, nullable
+    elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT, sre_parse.AT):
+        # Zero-width, so they don't consume the first character
+        return set(), True
+
+    return None, False
+
+
+def _first_of_set(items) -> FirstChars:
+    chars: Set[str] = set()
+    has_whitespace = False
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_parse.RANGE and av[1] - av[0] < _MAX_RANGE_SIZE:
+            chars.update(chr(code) for code in range(av[0], av[1] + 1))
+        elif op is sre_parse.CATEGORY and av is sre_parse.CATEGORY_SPACE:
+            has_whitespace = True
+        else:
+            return None, False
+
+    # A class that can match whitespace (e.g. `[ A]`) can be skipped like `\s`
+    whitespace = {ch for ch in chars if ch.isspace()}
+    return chars - whitespace, has_whitespace or bool(whitespace)
+
+
+def sample(pattern: Pattern, rng: random.Random, whitespace: float = 0.1) -> str:
+    """Generates a random string that the pattern (mostly) matches. Each optional
+    whitespace character is included with probability `whitespace`. Lookaheads are
+    ignored, so the result may not match patterns that use them.
+    """
+    parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    parts: List[str] = []
+    _sample_sequence(parsed, rng, whitespace, parts)
+    return "".join(parts)
+
+
+def _sample_sequence(items, rng: random.Random, whitespace: float, parts: List[str]):
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            parts.append(chr(av))
+        elif op is sre_parse.IN:
+            parts.append(_sample_set(av, rng))
+        elif op is sre_parse.SUBPATTERN:
+            _sample_sequence(av[-1], rng, whitespace, parts)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            min_count, max_count, item = av
+            extra = 0
+            if _is_whitespace(item):
+                while rng.random() < whitespace and min_count + extra < max_count:
+                    extra += 1
+            elif max_count != min_count:
+                extra = rng.randint(0, min(max_count - min_count, 2))
+
+            for _ in range(min_count + extra):
+                _sample_sequence(item, rng, whitespace, parts)
+        elif op is sre_parse.BRANCH:
+            _sample_sequence(rng.choice(av[1]), rng, whitespace, parts)
+        elif op not in (sre_parse.ASSERT, sre_parse.ASSERT_NOT, sre_parse.AT):
+            raise ValueError(f"Can't sample regex construct: {op}")
+
+
+def _is_whitespace(items) -> bool:
+    return len(items) == 1 and _first_of_sequence(items) == (set(), True)
+
+
+def _sample_set(items, rng: random.Random) -> str:
+    choices: List[str] = []
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            choices.append(chr(av))
+        elif op is sre_parse.RANGE and av[1] - av[0] < _MAX_RANGE_SIZE:
+            choices.extend(chr(code) for code in range(av[0], av[1] + 1))
+        elif op is sre_parse.CATEGORY and av is sre_parse.CATEGORY_SPACE:
+            choices.append(" ")
+        else:
+            raise ValueError(f"Can't sample character class item: {op}")
+
+    return rng.choice(choices)
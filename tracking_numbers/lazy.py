@@ -0,0 +1,112 @@
+"""The generated definitions are split into a module per courier, which is only
+imported the first time that courier is needed. DEFINITIONS is a LazyDefinitions:
+it imports every courier (in the manifest's precedence order) the first time it's
+used, and from then on is a plain list.
+"""
+import importlib
+import threading
+from typing import Dict
+from typing import List
+
+from tracking_numbers.definition import TrackingNumberDefinition
+
+_lock = threading.RLock()
+
+
+class Definitions(list):
+    __slots__ = ()
+
+    loaded = True
+
+    def load(self):
+        pass
+
+
+class LazyDefinitions(Definitions):
+    """A list of all the generated definitions that's only filled in when first
+    used. Once loaded, it turns into a Definitions, so that it's as fast as a list.
+    """
+
+    __slots__ = ()
+
+    loaded = False
+
+    def load(self):
+        with _lock:
+            if type(self) is LazyDefinitions:
+                definitions: List[TrackingNumberDefinition] = []
+                for courier_code in courier_codes():
+                    definitions.extend(load_courier(courier_code))
+
+                list.extend(self, definitions)
+                self.__class__ = Definitions  # type: ignore
+
+
+def _loading(name: str):
+    method = getattr(list, name)
+
+    def load_then_call(self, *args, **kwargs):
+        self.load()
+        return method(self, *args, **kwargs)
+
+    load_then_call.__name__ = name
+    return load_then_call
+
+
+for _name in (
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__ge__",
+    "__getitem__",
+    "__gt__",
+    "__iadd__",
+    "__imul__",
+    "__iter__",
+    "__le__",
+    "__len__",
+    "__lt__",
+    "__mul__",
+    "__ne__",
+    "__reduce_ex__",
+    "__repr__",
+    "__reversed__",
+    "__rmul__",
+    "__setitem__",
+    "__sizeof__",
+    "append",
+    "clear",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(LazyDefinitions, _name, _loading(_name))
+
+
+def courier_codes() -> List[str]:
+    """The generated couriers, in precedence order"""
+    return [courier_code for courier_code, _ in _manifest().items()]
+
+
+def load_courier(courier_code: str) -> List[TrackingNumberDefinition]:
+    """Imports the generated definitions of a single courier"""
+    module_name = _manifest().get(courier_code.lower())
+    if module_name is None:
+        raise ValueError(f"Unknown courier: {courier_code}")
+
+    module = importlib.import_module(f"tracking_numbers._generated.{module_name}")
+    return module.DEFINITIONS  # type: ignore
+
+
+def _manifest() -> Dict[str, str]:
+    # Imported here so that codegen can run when the generated code is out of date
+    from tracking_numbers._generated import MANIFEST
+
+    return dict(MANIFEST)
@@ -0,0 +1,176 @@
+import hashlib
+import importlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from stat import S_IWGRP
+from stat import S_IWOTH
+from functools import lru_cache
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.spec import iter_definitions
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "tracking-numbers",
+)
+
+# Bump this whenever the pickled layout of the definitions changes
+CACHE_VERSION = b"1"
+
+# The modules whose classes end up in the cache. Their source is part of the cache
+# key, so that upgrading (or editing) the library never loads stale objects.
+_PICKLED_MODULES = [
+    "tracking_numbers.checksum_validator",
+    "tracking_numbers.compat",
+    "tracking_numbers.definition",
+    "tracking_numbers.serial_number",
+    "tracking_numbers.types",
+    "tracking_numbers.value_matcher",
+]
+
+
+def load_definitions(
+    paths: Iterable[str],
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+) -> List[TrackingNumberDefinition]:
+    """Builds the definitions from courier spec JSON files, in the same format as
+    `tracking_number_data/couriers`. Directories are expanded to the files they
+    contain, in name order.
+
+    The result is cached in `cache_dir` (pass None to disable), keyed by the content
+    of the files and the library's code, so later calls with the same files skip
+    parsing the JSON and building the definitions from it. The regexes are still
+    compiled when the cache is loaded, since pickled patterns only keep their source.
+
+    Loading the cache unpickles it, which can run arbitrary code, so only pass a
+    `cache_dir` that no other user can write to. The directory is created private to
+    the current user, and cache files that aren't owned by the current user (or that
+    others can write to) are ignored and rebuilt.
+    """
+    contents = [_read(path) for path in _expand_paths(paths)]
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, f"definitions-{_hash(contents)}.pickle")
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            return cached
+
+    definitions: List[TrackingNumberDefinition] = []
+    for content in contents:
+        for definition, _ in iter_definitions(json.loads(content)):
+            # Computed eagerly so that it's part of the cached artifact
+            definition.min_length
+            definitions.append(definition)
+
+    if cache_path is not None:
+        _write_cache(cache_path, definitions)
+
+    return definitions
+
+
+def register_definitions(
+    paths: Iterable[str],
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+) -> List[TrackingNumberDefinition]:
+    """Loads the definitions from the spec files (see load_definitions) and merges them
+    into DEFINITIONS. A definition with the same courier code and product name as an
+    existing one replaces it in place, otherwise it's added after the built-in ones.
+    """
+    definitions = load_definitions(paths, cache_dir=cache_dir)
+
+    positions = {_key(definition): i for i, definition in enumerate(DEFINITIONS)}
+    for definition in definitions:
+        position = positions.get(_key(definition))
+        if position is not None:
+            DEFINITIONS[position] = definition
+        else:
+            positions[_key(definition)] = len(DEFINITIONS)
+            DEFINITIONS.append(definition)
+
+    return definitions
+
+
+def _key(definition: TrackingNumberDefinition) -> Tuple[str, str]:
+    return definition.courier.code, definition.product.name
+
+
+def _expand_paths(paths: Iterable[str]) -> List[str]:
+    expanded: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for filename in sorted(os.listdir(path)):
+                if filename.endswith(".json"):
+                    expanded.append(os.path.join(path, filename))
+        else:
+            expanded.append(path)
+
+    return expanded
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _hash(contents: List[bytes]) -> str:
+    digest = hashlib.sha256(CACHE_VERSION)
+    digest.update(_library_fingerprint())
+    for content in contents:
+        digest.update(len(content).to_bytes(8, "big"))
+        digest.update(content)
+
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _library_fingerprint() -> bytes:
+    digest = hashlib.sha256(f"{sys.version_info[:2]}".encode())
+    for module_name in _PICKLED_MODULES:
+        module = importlib.import_module(module_name)
+        digest.update(_read(module.__file__))  # type: ignore
+
+    return digest.digest()
+
+
+def _read_cache(cache_path: str) -> Optional[List[TrackingNumberDefinition]]:
+    try:
+        with open(cache_path, "rb") as f:
+            if not _is_trusted(os.fstat(f.fileno())):
+                return None
+
+            return pickle.load(f)
+    except Exception:
+        # A missing, corrupt or incompatible cache is rebuilt rather than failing
+        return None
+
+
+def _is_trusted(stat: os.stat_result) -> bool:
+    # Anyone who can write the file can make loading it run their code
+    if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+        return False
+
+    return not stat.st_mode & (S_IWGRP | S_IWOTH)
+
+
+def _write_cache(cache_path: str, definitions: List[TrackingNumberDefinition]):
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    # Write then rename, so that concurrent readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(definitions, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
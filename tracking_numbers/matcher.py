@@ -0,0 +1,158 @@
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from tracking_numbers import get_definitions
+from tracking_numbers.batch import BatchResult
+from tracking_numbers.batch import get_tracking_numbers
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.regex import first_chars
+from tracking_numbers.types import TrackingNumber
+
+DefinitionIndex = Dict[str, Tuple[TrackingNumberDefinition, ...]]
+
+
+class TrackingNumberMatcher:
+    """A prebuilt matcher over a subset of the definitions, selected by courier code
+    and/or product name (case-insensitive). Definitions keep their usual precedence.
+
+    The definitions are indexed by the first non-whitespace character they accept,
+    so each number is only tested against the definitions it could possibly match.
+    """
+
+    def __init__(
+        self,
+        couriers: Optional[Iterable[str]] = None,
+        products: Optional[Iterable[str]] = None,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    ):
+        if definitions is None:
+            # Only imports the selected couriers' definitions
+            couriers = None if couriers is None else list(couriers)
+            definitions = get_definitions(couriers)
+
+        self.definitions = _select(definitions, couriers=couriers, products=products)
+        self._index, self._fallback = _build_index(self.definitions)
+
+    def __repr__(self):
+        products = [tn_definition.product.name for tn_definition in self.definitions]
+        return f"{self.__class__.__name__}(products={products!r})"
+
+    def get(self, number: str) -> Optional[TrackingNumber]:
+        for tn_definition in self._candidates(number):
+            if len(number) < tn_definition.min_length:
+                continue
+
+            tracking_number = tn_definition.test(number)
+            if tracking_number and tracking_number.valid:
+                return tracking_number
+
+        return None
+
+    def get_all(self, number: str) -> List[TrackingNumber]:
+        """All the valid matches for the number, in precedence order"""
+        tracking_numbers: List[TrackingNumber] = []
+        for tn_definition in self._candidates(number):
+            if len(number) < tn_definition.min_length:
+                continue
+
+            tracking_number = tn_definition.test(number)
+            if tracking_number and tracking_number.valid:
+                tracking_numbers.append(tracking_number)
+
+        return tracking_numbers
+
+    def get_many(
+        self,
+        numbers: Iterable[str],
+        with_counts: bool = False,
+    ) -> BatchResult:
+        return get_tracking_numbers(numbers, with_counts=with_counts, classify=self.get)
+
+    def is_valid(self, number: str) -> bool:
+        return any(
+            tn_definition.is_valid(number) for tn_definition in self._candidates(number)
+        )
+
+    def detect_courier(self, number: str) -> Optional[Tuple[str, str]]:
+        for tn_definition in self._candidates(number):
+            if tn_definition.is_valid(number):
+                return tn_definition.courier.code, tn_definition.product.name
+
+        return None
+
+    def _candidates(self, number: str) -> Tuple[TrackingNumberDefinition, ...]:
+        first = number[:1]
+        if first.isspace():
+            first = number.lstrip()[:1]
+
+        return self._index.get(first, self._fallback)
+
+
+def _select(
+    definitions: Sequence[TrackingNumberDefinition],
+    couriers: Optional[Iterable[str]],
+    products: Optional[Iterable[str]],
+) -> List[TrackingNumberDefinition]:
+    courier_codes = None if couriers is None else {c.lower() for c in couriers}
+    product_names = None if products is None else {p.lower() for p in products}
+
+    selected: List[TrackingNumberDefinition] = []
+    for tn_definition in definitions:
+        courier_code = tn_definition.courier.code.lower()
+        product_name = tn_definition.product.name.lower()
+        if courier_codes is not None and courier_code not in courier_codes:
+            continue
+        if product_names is not None and product_name not in product_names:
+            continue
+
+        selected.append(tn_definition)
+
+    known_couriers = {d.courier.code.lower() for d in definitions}
+    known_products = {d.product.name.lower() for d in definitions}
+    _check_known(courier_codes, known_couriers, "courier")
+    _check_known(product_names, known_products, "product")
+    return selected
+
+
+def _check_known(requested: Optional[set], known: set, kind: str):
+    unknown = sorted((requested or set()) - known)
+    if unknown:
+        raise ValueError(f"Unknown {kind}: {', '.join(unknown)}")
+
+
+def _build_index(
+    definitions: Sequence[TrackingNumberDefinition],
+) -> Tuple[DefinitionIndex, Tuple[TrackingNumberDefinition, ...]]:
+    """Maps each possible first character to the definitions that accept it, along
+    with the definitions to use for any other character (those whose first character
+    can't be determined ahead of time).
+    """
+    definition_chars = [
+        (tn_definition, first_chars(tn_definition.number_regex))
+        for tn_definition in definitions
+    ]
+
+    all_chars: Set[str] = set()
+    for _, chars in definition_chars:
+        all_chars |= chars or set()
+
+    index: DefinitionIndex = {}
+    for ch in all_chars:
+        index[ch] = tuple(
+            tn_definition
+            for tn_definition, chars in definition_chars
+            if chars is None or ch in chars
+        )
+
+    # Empty and all-whitespace input are left to whatever the patterns make of them
+    index[""] = tuple(definitions)
+    fallback = tuple(
+        tn_definition for tn_definition, chars in definition_chars if chars is None
+    )
+
+    return index, fallback
@@ -0,0 +1,212 @@
+"""A cache of classification results in a local SQLite file, so that they outlive the
+process and can be shared by several worker processes.
+
+    with PersistentCache("results.sqlite") as cache:
+        results = cache.get_tracking_numbers(numbers)
+
+Entries are keyed on the number without surrounding whitespace and a fingerprint of
+the definitions, so results from different definitions (e.g. after upgrading) are
+never mixed up. The oldest entries are evicted past `max_entries`.
+"""
+import hashlib
+import json
+import sqlite3
+from contextlib import contextmanager
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers import get_tracking_number
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.types import TrackingNumber
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+DEFAULT_TIMEOUT = 30.0
+
+# Bump this whenever the stored layout of the results changes
+CACHE_VERSION = "1"
+
+# Stays under SQLite's limit on the number of parameters of a statement
+_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT NOT NULL,
+    number TEXT NOT NULL,
+    value TEXT,
+    UNIQUE (fingerprint, number)
+)
+"""
+
+
+def definitions_fingerprint(definitions: Iterable[TrackingNumberDefinition]) -> str:
+    digest = hashlib.sha256(CACHE_VERSION.encode())
+    for tn_definition in definitions:
+        digest.update(repr(tn_definition).encode())
+        digest.update(b"\n")
+
+    return digest.hexdigest()
+
+
+class PersistentCache:
+    """Bulk get and put of classification results (including the numbers that
+    weren't recognized) in a SQLite file. Each process (or thread) should open its
+    own PersistentCache on the file; writes are serialized by SQLite.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        definitions = list(DEFINITIONS if definitions is None else definitions)
+        self.path = path
+        self.max_entries = max_entries
+        self.fingerprint = definitions_fingerprint(definitions)
+        self._definitions = {
+            _key(tn_definition.courier.code, tn_definition.product.name): tn_definition
+            for tn_definition in definitions
+        }
+
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    def __enter__(self) -> "PersistentCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    def get_many(self, numbers: Iterable[str]) -> Dict[str, Optional[TrackingNumber]]:
+        """The cached results of the numbers that are in the cache (None for those
+        known not to be tracking numbers). Missing numbers are left out.
+        """
+        by_key: Dict[str, List[str]] = {}
+        for number in numbers:
+            by_key.setdefault(number.strip(), []).append(number)
+
+        results: Dict[str, Optional[TrackingNumber]] = {}
+        keys = list(by_key)
+        for start in range(0, len(keys), _CHUNK_SIZE):
+            chunk = keys[start : start + _CHUNK_SIZE]
+            rows = self._connection.execute(
+                "SELECT number, value FROM results WHERE fingerprint = ? "
+                f"AND number IN ({', '.join('?' * len(chunk))})",
+                [self.fingerprint, *chunk],
+            )
+            for key, value in rows:
+                for number in by_key[key]:
+                    if value is None:
+                        results[number] = None
+                        continue
+
+                    tracking_number = self._decode(number, value)
+                    if tracking_number:
+                        results[number] = tracking_number
+
+        return results
+
+    def put_many(self, results: Iterable[Tuple[str, Optional[TrackingNumber]]]):
+        """Stores (number, result) pairs, evicting the oldest entries past the cap"""
+        rows = [
+            (self.fingerprint, number.strip(), _encode(tracking_number))
+            for number, tracking_number in results
+        ]
+        if not rows:
+            return
+
+        with self._transaction():
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                rows,
+            )
+            if self.max_entries is not None:
+                # Rowids only grow, so this is an upper bound of the entry count
+                self._connection.execute(
+                    "DELETE FROM results WHERE rowid <= "
+                    "(SELECT max(rowid) FROM results) - ?",
+                    (self.max_entries,),
+                )
+
+    def get_tracking_numbers(
+        self,
+        numbers: Sequence[str],
+        classify: Callable[[str], Optional[TrackingNumber]] = get_tracking_number,
+    ) -> List[Optional[TrackingNumber]]:
+        """Results for all the numbers, in order, classifying (and caching) only the
+        ones that aren't cached yet.
+        """
+        cached = self.get_many(numbers)
+
+        classified: Dict[str, Optional[TrackingNumber]] = {}
+        for number in numbers:
+            if number not in cached and number not in classified:
+                classified[number] = classify(number)
+
+        self.put_many(classified.items())
+        return [
+            cached[number] if number in cached else classified[number]
+            for number in numbers
+        ]
+
+    def clear(self):
+        with self._transaction():
+            self._connection.execute("DELETE FROM results")
+
+    @contextmanager
+    def _transaction(self):
+        # IMMEDIATE takes the write lock upfront, so concurrent writers wait for it
+        # (up to the timeout) rather than failing on a lock upgrade
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+
+        self._connection.execute("COMMIT")
+
+    def _decode(self, number: str, value: str) -> Optional[TrackingNumber]:
+        courier_code, product_name, serial_number, validation_errors = json.loads(value)
+        tn_definition = self._definitions.get(_key(courier_code, product_name))
+        if not tn_definition:
+            return None
+
+        return TrackingNumber(
+            number=number,
+            courier=tn_definition.courier,
+            product=tn_definition.product,
+            serial_number=serial_number,
+            tracking_url=tn_definition.tracking_url(number),
+            validation_errors=[(name, message) for name, message in validation_errors],
+        )
+
+
+def _encode(tracking_number: Optional[TrackingNumber]) -> Optional[str]:
+    if tracking_number is None:
+        return None
+
+    return json.dumps(
+        [
+            tracking_number.courier.code,
+            tracking_number.product.name,
+            tracking_number.serial_number,
+            tracking_number.validation_errors,
+        ]
+    )
+
+
+def _key(courier_code: str, product_name: str) -> Tuple[str, str]:
+    return courier_code.lower(), product_name.lower()
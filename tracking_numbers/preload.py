@@ -0,0 +1,69 @@
+import gc
+import threading
+from dataclasses import dataclass
+from typing import List
+from typing import Optional
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.guard import InputGuard
+from tracking_numbers.matcher import TrackingNumberMatcher
+from tracking_numbers.typeahead import build_automaton
+from tracking_numbers.typeahead import TypeaheadAutomaton
+from tracking_numbers.typeahead import TypeaheadMatcher
+
+
+@dataclass
+class Preloaded:
+    definitions: List[TrackingNumberDefinition]
+    matcher: TrackingNumberMatcher
+    guard: InputGuard
+    typeahead_automaton: TypeaheadAutomaton
+
+    def typeahead(self) -> TypeaheadMatcher:
+        """A new type-ahead matcher (one per field or session) over the preloaded
+        automaton.
+        """
+        return TypeaheadMatcher(automaton=self.typeahead_automaton)
+
+
+_preloaded: Optional[Preloaded] = None
+_lock = threading.Lock()
+
+
+def preload(freeze: bool = True) -> Preloaded:
+    """Eagerly builds every lazily-derived structure (per-definition lookups, the
+    matcher index, input limits, the type-ahead automaton) so that it happens once in
+    the parent of a prefork server (e.g. gunicorn with `preload_app`) rather than in
+    every worker.
+
+    With `freeze=True`, everything allocated so far is then moved out of the garbage
+    collector's reach with `gc.freeze()`. Collections in the workers then don't
+    touch (and so don't copy) the memory pages holding these objects. Call this as
+    late as possible before forking, after the rest of the app has been imported.
+
+    Definitions whose patterns the type-ahead automaton can't represent are left
+    out of it and matched with `re` (see TypeaheadAutomaton).
+
+    Calling it again returns the structures built the first time.
+    """
+    global _preloaded
+
+    with _lock:
+        if _preloaded is None:
+            for tn_definition in DEFINITIONS:
+                tn_definition.min_length
+                tn_definition.number_regex.groupindex
+
+            _preloaded = Preloaded(
+                definitions=list(DEFINITIONS),
+                matcher=TrackingNumberMatcher(),
+                guard=InputGuard(),
+                typeahead_automaton=build_automaton(DEFINITIONS),
+            )
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return _preloaded
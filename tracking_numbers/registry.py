@@ -0,0 +1,145 @@
+"""A registry of definitions that can be replaced while a long-running service keeps
+classifying numbers, e.g. after courier data changes:
+
+    registry = Registry()
+    result = registry.get_tracking_number(number)  # result.version == 1
+
+    future = registry.publish_later(lambda: load_definitions(["couriers/"]))
+    future.result()  # new calls now use version 2
+
+A new set of definitions is built, along with everything derived from it, before it
+is published by replacing a single reference. Reading that reference is atomic, so
+calls never lock: each one reads the current snapshot once and finishes on it, even
+if a newer one is published meanwhile.
+"""
+import dataclasses
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.matcher import TrackingNumberMatcher
+from tracking_numbers.types import TrackingNumber
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A published set of definitions with its derived indexes, never modified"""
+
+    version: int
+    definitions: Tuple[TrackingNumberDefinition, ...]
+    matcher: TrackingNumberMatcher
+    by_product: Dict[str, TrackingNumberDefinition]
+
+
+@dataclass(frozen=True)
+class RegistryResult:
+    """The result of a lookup, and the version of the definitions that produced it"""
+
+    tracking_number: Optional[TrackingNumber]
+    version: int
+
+
+class Registry:
+    def __init__(
+        self,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    ):
+        self._publish_lock = threading.Lock()
+        self._snapshot = dataclasses.replace(
+            build_snapshot(DEFINITIONS if definitions is None else definitions),
+            version=1,
+        )
+
+    def __repr__(self):
+        snapshot = self._snapshot
+        return (
+            f"{self.__class__.__name__}(version={snapshot.version}, "
+            f"definitions={len(snapshot.definitions)})"
+        )
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """The current snapshot. Use it for several lookups that need to be made
+        against the same version.
+        """
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def get_tracking_number(self, number: str) -> RegistryResult:
+        snapshot = self._snapshot
+        return RegistryResult(snapshot.matcher.get(number), snapshot.version)
+
+    def is_valid(self, number: str) -> bool:
+        return self._snapshot.matcher.is_valid(number)
+
+    def detect_courier(self, number: str) -> Optional[Tuple[str, str]]:
+        return self._snapshot.matcher.detect_courier(number)
+
+    def get_definition(self, product_name: str) -> Optional[TrackingNumberDefinition]:
+        return self._snapshot.by_product.get(product_name.lower())
+
+    def publish(self, definitions: Sequence[TrackingNumberDefinition]) -> Snapshot:
+        """Builds a snapshot of the definitions and makes it the current one. Returns
+        the published snapshot.
+        """
+        snapshot = build_snapshot(definitions)
+
+        # Only publishers take the lock, so that versions are handed out in the order
+        # the snapshots are published
+        with self._publish_lock:
+            snapshot = dataclasses.replace(snapshot, version=self.version + 1)
+            self._snapshot = snapshot
+
+        return snapshot
+
+    def publish_later(
+        self,
+        load: Callable[[], Sequence[TrackingNumberDefinition]],
+    ) -> "Future[Snapshot]":
+        """Loads the definitions and publishes them (see publish) in a background
+        thread. The future resolves to the published snapshot, or to the exception
+        raised while building it, in which case the current one stays in place.
+        """
+        future: "Future[Snapshot]" = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+
+            try:
+                future.set_result(self.publish(load()))
+            except BaseException as e:
+                future.set_exception(e)
+
+        thread = threading.Thread(target=run, name="tracking-numbers-registry")
+        thread.daemon = True
+        thread.start()
+        return future
+
+
+def build_snapshot(definitions: Sequence[TrackingNumberDefinition]) -> Snapshot:
+    """Builds the indexes of a snapshot (with version 0, until it's published)"""
+    definitions = tuple(definitions)
+    by_product: Dict[str, TrackingNumberDefinition] = {}
+    for tn_definition in definitions:
+        # Computed lazily otherwise, so the first calls after publishing would pay
+        tn_definition.min_length
+        tn_definition.number_regex.groupindex
+        by_product.setdefault(tn_definition.product.name.lower(), tn_definition)
+
+    return Snapshot(
+        version=0,
+        definitions=definitions,
+        matcher=TrackingNumberMatcher(definitions=definitions),
+        by_product=by_product,
+    )
@@ -0,0 +1,350 @@
+"""A small HTTP classification service for non-Python consumers, using only the
+standard library. Bind it to localhost.
+
+    python -m tracking_numbers.server --port 8080
+
+- GET /classify?number=... classifies one number. Concurrent requests are merged
+  into micro-batches that run on a worker pool.
+- POST /classify/batch with a JSON list of numbers classifies them all at once.
+- GET /stats returns connection, latency and throughput counters.
+
+Results are `TrackingNumber.to_dict()`, or null when the number isn't recognized.
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from tracking_numbers import get_tracking_number
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_BATCH_DELAY = 0.002
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def classify_batch(numbers: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Runs on the worker pool, so it has to be a picklable module-level function.
+    A number that fails to classify is returned as unrecognized, rather than failing
+    the other numbers in the batch (which may come from other requests).
+    """
+    results: List[Optional[Dict[str, Any]]] = []
+    for number in numbers:
+        try:
+            tracking_number = get_tracking_number(number)
+        except Exception:
+            tracking_number = None
+
+        results.append(tracking_number.to_dict() if tracking_number else None)
+
+    return results
+
+
+class ServerStats:
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.connections_total = 0
+        self.connections_open = 0
+        self.requests_total = 0
+        self.errors_total = 0
+        self.numbers_total = 0
+        self.batches_total = 0
+        self.batched_numbers_total = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record_request(self, latency: float, numbers: int, error: bool):
+        self.requests_total += 1
+        self.numbers_total += numbers
+        self.errors_total += int(error)
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def to_dict(self) -> Dict[str, Any]:
+        uptime = time.monotonic() - self.started_at
+        requests = self.requests_total
+        return {
+            "uptime_seconds": uptime,
+            "connections_total": self.connections_total,
+            "connections_open": self.connections_open,
+            "requests_total": requests,
+            "errors_total": self.errors_total,
+            "numbers_total": self.numbers_total,
+            "batches_total": self.batches_total,
+            "mean_batch_size": (
+                self.batched_numbers_total / self.batches_total
+                if self.batches_total
+                else 0.0
+            ),
+            "latency_mean_seconds": self.latency_total / requests if requests else 0.0,
+            "latency_max_seconds": self.latency_max,
+            "requests_per_second": requests / uptime if uptime else 0.0,
+            "numbers_per_second": self.numbers_total / uptime if uptime else 0.0,
+        }
+
+
+class ClassificationServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_delay: float = DEFAULT_MAX_BATCH_DELAY,
+        executor: Optional[Executor] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.stats = ServerStats()
+
+        self._executor = executor or ThreadPoolExecutor()
+        self._queue: Optional[asyncio.Queue] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.get_running_loop().create_task(self._run_batcher())
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self.host,
+            self.port,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher:
+            self._batcher.cancel()
+
+        self._executor.shutdown(wait=False)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()  # type: ignore
+        finally:
+            await self.stop()
+
+    async def classify(self, number: str) -> Optional[Dict[str, Any]]:
+        """Queues the number for the next micro-batch and waits for its result"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((number, future))  # type: ignore
+        return await future
+
+    async def _run_batcher(self):
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_batch_delay
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            numbers = [number for number, _ in batch]
+            self.stats.batches_total += 1
+            self.stats.batched_numbers_total += len(batch)
+            try:
+                results = await loop.run_in_executor(
+                    self._executor,
+                    classify_batch,
+                    numbers,
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _handle_connection(self, reader, writer):
+        self.stats.connections_total += 1
+        self.stats.connections_open += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await _read_request(reader)
+                except (
+                    asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError,
+                    ConnectionError,
+                ):
+                    break
+                except HttpError as e:
+                    await _write_response(writer, e.status, {"error": e.message}, False)
+                    break
+
+                method, target, version, headers, body = request
+                keep_alive = _wants_keep_alive(version, headers)
+
+                started = time.perf_counter()
+                numbers = 0
+                try:
+                    status = 200
+                    payload, numbers = await self._route(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": e.message}
+                except Exception:
+                    # Anything else is a bug, but the client still gets a response
+                    status, payload = 500, {"error": "Internal server error"}
+
+                self.stats.record_request(
+                    time.perf_counter() - started,
+                    numbers,
+                    error=status != 200,
+                )
+                await _write_response(writer, status, payload, keep_alive)
+        finally:
+            self.stats.connections_open -= 1
+            writer.close()
+
+    async def _route(self, method: str, target: str, body: bytes) -> Tuple[Any, int]:
+        url = urlsplit(target)
+        if url.path == "/classify":
+            _require_method(method, "GET")
+            query = parse_qs(url.query, keep_blank_values=True)
+            if "number" not in query:
+                raise HttpError(400, "Missing number")
+            return await self.classify(query["number"][0]), 1
+        elif url.path == "/classify/batch":
+            _require_method(method, "POST")
+            numbers = _parse_numbers(body)
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                self._executor,
+                classify_batch,
+                numbers,
+            )
+            return results, len(numbers)
+        elif url.path == "/stats":
+            _require_method(method, "GET")
+            return self.stats.to_dict(), 0
+
+        raise HttpError(404, f"Unknown path: {url.path}")
+
+
+def _require_method(method: str, expected: str):
+    if method != expected:
+        raise HttpError(405, f"Expected {expected}")
+
+
+def _parse_numbers(body: bytes) -> List[str]:
+    try:
+        numbers = json.loads(body)
+    except ValueError:
+        raise HttpError(400, "Body must be JSON")
+
+    if not isinstance(numbers, list) or not all(isinstance(n, str) for n in numbers):
+        raise HttpError(400, "Body must be a JSON list of strings")
+
+    return numbers
+
+
+async def _read_request(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HttpError(400, "Malformed request line")
+
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HttpError(400, "Malformed Content-Length")
+    if length < 0:
+        raise HttpError(400, "Negative Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HttpError(413, "Body too large")
+
+    body = await reader.readexactly(length) if length else b""
+    return method, target, version, headers, body
+
+
+def _wants_keep_alive(version: str, headers: Dict[str, str]) -> bool:
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+
+    return connection != "close"
+
+
+async def _write_response(writer, status: int, payload: Any, keep_alive: bool):
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument(
+        "--max-batch-delay",
+        type=float,
+        default=DEFAULT_MAX_BATCH_DELAY,
+    )
+    args = parser.parse_args()
+
+    server = ClassificationServer(
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_batch_delay=args.max_batch_delay,
+    )
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""SQL functions for classifying tracking numbers inside SQLite queries.
+
+    import sqlite3
+    from tracking_numbers.sqlite import register_functions
+
+    connection = sqlite3.connect("shipments.db")
+    register_functions(connection)
+    connection.execute(
+        "SELECT tracking_courier(number), count(*) FROM shipments GROUP BY 1"
+    )
+
+The functions are registered as deterministic, so they can also be used in
+generated columns and expression indexes. Those then need the functions registered on
+every connection that reads or writes them.
+"""
+import sqlite3
+from functools import lru_cache
+from typing import Callable
+from typing import Optional
+
+from tracking_numbers import get_tracking_number
+from tracking_numbers.types import TrackingNumber
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def register_functions(
+    connection: sqlite3.Connection,
+    cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+):
+    """Registers on the connection, each taking the number and returning NULL when
+    it isn't recognized:
+
+    - tracking_courier(number): the courier code
+    - tracking_courier_name(number): the courier name
+    - tracking_product(number): the product name
+    - tracking_valid(number): 1 if it's a valid tracking number, 0 otherwise
+    - tracking_url(number): the tracking URL
+    - tracking_serial_number(number): the serial number digits
+
+    The functions share a cache of `cache_size` classified numbers (unbounded if
+    None), so using several of them on the same rows classifies each number once.
+    """
+    classify = lru_cache(maxsize=cache_size)(_classify)
+
+    def define(name: str, getter: Callable[[TrackingNumber], object]):
+        def function(number):
+            tracking_number = classify(_to_text(number))
+            return getter(tracking_number) if tracking_number else None
+
+        connection.create_function(name, 1, function, deterministic=True)
+
+    define("tracking_courier", lambda tn: tn.courier.code)
+    define("tracking_courier_name", lambda tn: tn.courier.name)
+    define("tracking_product", lambda tn: tn.product.name)
+    define("tracking_url", lambda tn: tn.tracking_url)
+    define(
+        "tracking_serial_number",
+        lambda tn: "".join(map(str, tn.serial_number)) if tn.serial_number else None,
+    )
+
+    def tracking_valid(number):
+        return int(classify(_to_text(number)) is not None)
+
+    connection.create_function("tracking_valid", 1, tracking_valid, deterministic=True)
+
+
+def _classify(number: Optional[str]) -> Optional[TrackingNumber]:
+    if number is None:
+        return None
+
+    return get_tracking_number(number)
+
+
+def _to_text(value) -> Optional[str]:
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, int):
+        # Numeric-only tracking numbers are sometimes stored as integers
+        return str(value)
+    elif isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+
+    return None
@@ -0,0 +1,130 @@
+import re
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.helpers.regex import bound_whitespace
+from tracking_numbers.helpers.regex import DEFAULT_MAX_WHITESPACE_RUN
+from tracking_numbers.helpers.regex import max_width
+from tracking_numbers.types import TrackingNumber
+
+Candidate = Tuple[int, int, int, TrackingNumber]
+
+
+class StreamScanner:
+    """Finds valid tracking numbers in text that arrives in arbitrary chunks, e.g. from
+    a socket or a tailed log. Numbers may be split across chunks.
+
+    Numbers must not be directly preceded or followed by a letter or digit. When
+    candidates overlap, the one that starts first wins, then the longest, then the
+    one whose definition comes first.
+
+    Only a tail of the input is buffered between calls, which is bounded by the
+    longest possible match of any definition.
+    """
+
+    def __init__(
+        self,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+        max_whitespace_run: int = DEFAULT_MAX_WHITESPACE_RUN,
+    ):
+        self._searchers: List[Tuple[TrackingNumberDefinition, Pattern]] = []
+        longest_match = 0
+        for tn_definition in DEFINITIONS if definitions is None else definitions:
+            bounded = bound_whitespace(tn_definition.number_regex, max_whitespace_run)
+            width = max_width(bounded)
+            if width is None:
+                raise ValueError(
+                    f"Pattern has no maximum length: {bounded.pattern}",
+                )
+
+            search_regex = re.compile(
+                f"(?<![0-9A-Za-z])(?:{bounded.pattern})(?![0-9A-Za-z])",
+                bounded.flags,
+            )
+            self._searchers.append((tn_definition, search_regex))
+            longest_match = max(longest_match, width)
+
+        # A match is only final once we've also seen the character after it
+        self._window = longest_match + 1
+        self._buffer = ""
+        self._start = 0
+
+    def feed(self, chunk: str) -> List[TrackingNumber]:
+        """Adds the chunk to the stream and returns the matches that are confirmed"""
+        self._buffer += chunk
+        return self._scan(final=False)
+
+    def close(self) -> List[TrackingNumber]:
+        """Ends the stream and returns the remaining matches"""
+        tracking_numbers = self._scan(final=True)
+        self._buffer = ""
+        self._start = 0
+        return tracking_numbers
+
+    def _scan(self, final: bool) -> List[TrackingNumber]:
+        buffer = self._buffer
+        # Anything that starts before the limit can't be affected by future input
+        limit = len(buffer) if final else len(buffer) - self._window
+        if limit <= self._start:
+            return []
+
+        tracking_numbers: List[TrackingNumber] = []
+        resume = self._start
+        for start, end, _, tracking_number in self._select(self._candidates(buffer)):
+            if start >= limit:
+                break
+
+            tracking_numbers.append(tracking_number)
+            resume = end
+
+        # Keep one character before the unconsumed text for the lookbehind
+        keep_from = max(resume, limit)
+        context = min(keep_from, 1)
+        self._buffer = buffer[keep_from - context :]
+        self._start = context
+        return tracking_numbers
+
+    def _candidates(self, buffer: str) -> List[Candidate]:
+        candidates: List[Candidate] = []
+        for index, (tn_definition, search_regex) in enumerate(self._searchers):
+            position = self._start
+            while True:
+                match = search_regex.search(buffer, position)
+                if not match:
+                    break
+
+                text = match.group()
+                number = text.strip()
+                start = match.start() + len(text) - len(text.lstrip())
+                end = start + len(number)
+                position = start + 1
+
+                tracking_number = tn_definition.test(number)
+                if tracking_number and tracking_number.valid:
+                    candidates.append((start, end, index, tracking_number))
+
+        return candidates
+
+    @staticmethod
+    def _select(candidates: List[Candidate]) -> List[Candidate]:
+        candidates.sort(key=lambda c: (c[0], c[0] - c[1], c[2]))
+
+        selected: List[Candidate] = []
+        end = -1
+        for candidate in candidates:
+            if candidate[0] >= end:
+                selected.append(candidate)
+                end = candidate[1]
+
+        return selected
+
+
+def find_tracking_numbers(text: str) -> List[TrackingNumber]:
+    """Finds all the valid tracking numbers in a complete piece of text"""
+    scanner = StreamScanner()
+    return scanner.feed(text) + scanner.close()
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.automaton import MATCH
+from tracking_numbers.automaton import Nfa
+from tracking_numbers.automaton import UnsupportedPattern
+from tracking_numbers.definition import TrackingNumberDefinition
+
+
+@dataclass
+class TypeaheadStatus:
+    """Where the text typed so far stands against each definition.
+
+    - possible: definitions that the text is a prefix of some match for
+    - complete: definitions whose pattern the text already matches in full
+    - valid: complete definitions that the text also passes validation for
+    """
+
+    text: str
+    possible: List[TrackingNumberDefinition]
+    complete: List[TrackingNumberDefinition]
+    valid: List[TrackingNumberDefinition]
+
+
+class TypeaheadAutomaton:
+    """The definition patterns compiled into one NFA. It isn't changed by matching,
+    so one can be built up front and shared by every TypeaheadMatcher (i.e. every
+    form field being typed into) over the same definitions.
+
+    Patterns the NFA can't represent (e.g. `\\d` or `.`, as in some loaded specs) are
+    left out of it, as in DfaMatcher. Their definitions are always possible, and
+    complete once `number_regex` matches the text.
+    """
+
+    def __init__(self, definitions: Sequence[TrackingNumberDefinition]):
+        self.definitions = list(definitions)
+        # Indexes into definitions of the patterns in the NFA, and of the rest
+        self.compiled: List[int] = []
+        self.fallback: List[int] = []
+        for index, tn_definition in enumerate(self.definitions):
+            try:
+                Nfa([tn_definition.number_regex], approximate=True)
+            except UnsupportedPattern:
+                self.fallback.append(index)
+            else:
+                self.compiled.append(index)
+
+        self.nfa = Nfa(
+            [self.definitions[index].number_regex for index in self.compiled],
+            approximate=True,
+        )
+
+        # Definitions whose matches the NFA can't confirm on its own
+        self.needs_regex = frozenset(self.fallback) | {
+            index
+            for pattern, index in enumerate(self.compiled)
+            if self.nfa.approximate[pattern]
+        }
+
+        initial: List[int] = []
+        for start_states in self.nfa.start_states:
+            initial.extend(start_states)
+
+        self.initial = tuple(initial)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(states={len(self.nfa)}, "
+            f"compiled={len(self.compiled)}, fallback={len(self.fallback)})"
+        )
+
+
+def build_automaton(
+    definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+) -> TypeaheadAutomaton:
+    """Compiles the definition patterns into the automaton TypeaheadMatcher runs"""
+    return TypeaheadAutomaton(DEFINITIONS if definitions is None else definitions)
+
+
+class TypeaheadMatcher:
+    """Incrementally matches text as it's typed, e.g. validating a form field on every
+    keystroke. All the definition patterns are compiled into one automaton, and the
+    set of active states is kept for every prefix, so appending a character costs
+    work proportional to the active states and deleting one is a lookup.
+
+    A matcher holds the text of one field. Pass an automaton from build_automaton()
+    to skip compiling it again; the definitions then default to the automaton's.
+    """
+
+    def __init__(
+        self,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+        automaton: Optional[TypeaheadAutomaton] = None,
+    ):
+        if automaton is None:
+            automaton = build_automaton(definitions)
+        elif definitions is not None and list(definitions) != automaton.definitions:
+            raise ValueError("The automaton was built for other definitions")
+
+        self.definitions = automaton.definitions
+        self._automaton = automaton
+        self._nfa = automaton.nfa
+        self._text: List[str] = []
+        self._states: List[Tuple[int, ...]] = [automaton.initial]
+
+    @property
+    def text(self) -> str:
+        return "".join(self._text)
+
+    def push(self, chars: str) -> TypeaheadStatus:
+        """Appends the characters to the text"""
+        states = self._states[-1]
+        for ch in chars:
+            states = self._nfa.advance(states, ch)
+            self._text.append(ch)
+            self._states.append(states)
+
+        return self.status()
+
+    def pop(self, count: int = 1) -> TypeaheadStatus:
+        """Removes the last `count` characters from the text"""
+        count = min(count, len(self._text))
+        if count:
+            del self._text[-count:]
+            del self._states[-count:]
+
+        return self.status()
+
+    def set_text(self, text: str) -> TypeaheadStatus:
+        """Replaces the text, reusing the work done for the prefix it shares with the
+        current text (e.g. when a form field is edited or pasted into).
+        """
+        shared = 0
+        for old, new in zip(self._text, text):
+            if old != new:
+                break
+            shared += 1
+
+        self.pop(len(self._text) - shared)
+        return self.push(text[shared:])
+
+    def reset(self) -> TypeaheadStatus:
+        return self.pop(len(self._text))
+
+    def status(self) -> TypeaheadStatus:
+        automaton = self._automaton
+        nfa = self._nfa
+        possible_indexes = set(automaton.fallback)
+        complete_indexes = set(automaton.fallback)
+        for state in self._states[-1]:
+            owner = automaton.compiled[nfa.owner[state]]
+            possible_indexes.add(owner)
+            if nfa.kind[state] == MATCH:
+                complete_indexes.add(owner)
+
+        text = self.text
+        complete: List[TrackingNumberDefinition] = []
+        valid: List[TrackingNumberDefinition] = []
+        for index in sorted(complete_indexes):
+            tn_definition = self.definitions[index]
+            # Approximated (lookaheads) and fallback patterns need the real regex
+            if index in automaton.needs_regex:
+                if not tn_definition.number_regex.fullmatch(text):
+                    continue
+
+            complete.append(tn_definition)
+            if tn_definition.is_valid(text):
+                valid.append(tn_definition)
+
+        return TypeaheadStatus(
+            text=text,
+            possible=[self.definitions[index] for index in sorted(possible_indexes)],
+            complete=complete,
+            valid=valid,
+        )
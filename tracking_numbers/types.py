@@ -1,14 +1,26 @@
 from dataclasses import dataclass
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 
 Spec = Dict[str, Any]
 SerialNumber = List[int]
 ValidationError = Tuple[str, str]
 
+# The fields of TrackingNumber.to_dict(...), matching dataclasses.asdict(...)
+DEFAULT_FIELDS = (
+    "number",
+    "courier",
+    "product",
+    "serial_number",
+    "tracking_url",
+    "validation_errors",
+)
+
 
 @dataclass
 class Product:
@@ -34,6 +46,30 @@ class TrackingNumber:
     def valid(self) -> bool:
         return not self.validation_errors
 
+    def to_dict(self, fields: Sequence[str] = DEFAULT_FIELDS) -> Dict[str, Any]:
+        """A faster alternative to dataclasses.asdict(...), which produces the same
+        output with the default fields. See FIELDS for the available fields.
+        Unlike asdict, the serial number list is shared with this object, not copied.
+        """
+        return {field: FIELDS[field](self) for field in fields}
+
+    def to_tuple(self, fields: Sequence[str] = DEFAULT_FIELDS) -> Tuple[Any, ...]:
+        return tuple(FIELDS[field](self) for field in fields)
+
+
+FIELDS: Dict[str, Callable[[TrackingNumber], Any]] = {
+    "number": lambda tn: tn.number,
+    "courier": lambda tn: {"code": tn.courier.code, "name": tn.courier.name},
+    "courier_code": lambda tn: tn.courier.code,
+    "courier_name": lambda tn: tn.courier.name,
+    "product": lambda tn: {"name": tn.product.name},
+    "product_name": lambda tn: tn.product.name,
+    "serial_number": lambda tn: tn.serial_number,
+    "tracking_url": lambda tn: tn.tracking_url,
+    "validation_errors": lambda tn: list(tn.validation_errors),
+    "valid": lambda tn: tn.valid,
+}
+
 
 def to_int(serial_number: SerialNumber) -> int:
     return int("".join(map(str, serial_number)))
@@ -0,0 +1,138 @@
+"""Extracts tracking numbers from couriers' tracking URLs, e.g.
+`https://tools.usps.com/go/TrackConfirmAction?tLabels=9405511108078863434863`.
+
+    index = UrlIndex()
+    results = index.get_many(urls)
+
+The definitions are indexed by the host and query parameter of their
+`tracking_url_template`, so each URL is looked up rather than tried against every
+definition, and the numbers in it are only tested against the definitions sharing
+that host and parameter.
+"""
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from urllib.parse import parse_qsl
+from urllib.parse import urlsplit
+
+from tracking_numbers import DEFINITIONS
+from tracking_numbers.definition import TrackingNumberDefinition
+from tracking_numbers.types import TrackingNumber
+
+# Host (without "www.") and query parameter name, both lowercase
+UrlKey = Tuple[str, str]
+
+# Couriers accept several numbers in one URL, separated by commas
+_SEPARATOR = ","
+
+_PLACEHOLDER = "TRACKINGNUMBER"
+
+
+class UrlIndex:
+    """Definitions by the host and query parameter of their tracking URL template.
+    Templates that don't have the number as the value of a query parameter aren't
+    indexed, and neither are the definitions without a template.
+    """
+
+    def __init__(
+        self,
+        definitions: Optional[Sequence[TrackingNumberDefinition]] = None,
+    ):
+        self.definitions = list(DEFINITIONS if definitions is None else definitions)
+        self._index: Dict[UrlKey, Tuple[TrackingNumberDefinition, ...]] = {}
+        for tn_definition in self.definitions:
+            key = template_key(tn_definition.tracking_url_template)
+            if key is not None:
+                self._index[key] = self._index.get(key, ()) + (tn_definition,)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(keys={sorted(self._index)!r})"
+
+    def keys(self) -> List[UrlKey]:
+        return list(self._index)
+
+    def definitions_for(self, url: str) -> List[TrackingNumberDefinition]:
+        """The definitions whose template has the host and a query parameter of the
+        URL, in precedence order.
+        """
+        definitions: List[TrackingNumberDefinition] = []
+        for key, _ in _iter_params(url):
+            definitions.extend(self._index.get(key, ()))
+
+        return definitions
+
+    def get(self, url: str) -> List[TrackingNumber]:
+        """The valid tracking numbers in the URL, in the order they appear"""
+        return self.get_many([url])[0]
+
+    def get_many(self, urls: Sequence[str]) -> List[List[TrackingNumber]]:
+        """The valid tracking numbers in each URL. Each distinct number is only tested
+        once per template.
+        """
+        classified: Dict[Tuple[UrlKey, str], Optional[TrackingNumber]] = {}
+        results: List[List[TrackingNumber]] = []
+        for url in urls:
+            tracking_numbers: List[TrackingNumber] = []
+            for key, value in _iter_params(url):
+                definitions = self._index.get(key)
+                if not definitions:
+                    continue
+
+                for number in value.split(_SEPARATOR):
+                    number = number.strip()
+                    if (key, number) not in classified:
+                        classified[key, number] = _classify(number, definitions)
+
+                    tracking_number = classified[key, number]
+                    if tracking_number:
+                        tracking_numbers.append(tracking_number)
+
+            results.append(tracking_numbers)
+
+        return results
+
+
+def template_key(tracking_url_template: Optional[str]) -> Optional[UrlKey]:
+    """The host and query parameter that a template puts the number in, if any"""
+    if not tracking_url_template:
+        return None
+
+    url = tracking_url_template.replace("%s", _PLACEHOLDER)
+    for key, value in _iter_params(url):
+        if value == _PLACEHOLDER:
+            return key
+
+    return None
+
+
+def _iter_params(url: str) -> List[Tuple[UrlKey, str]]:
+    if "://" not in url and not url.startswith("//"):
+        # e.g. "tools.usps.com/go/TrackConfirmAction?tLabels=..."
+        url = f"//{url}"
+
+    try:
+        parts = urlsplit(url.strip())
+        host = parts.hostname or ""
+    except ValueError:
+        # Malformed, e.g. an invalid port or IPv6 address
+        return []
+
+    host = host[4:] if host.startswith("www.") else host
+    return [
+        ((host, name.lower()), value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+
+
+def _classify(
+    number: str,
+    definitions: Sequence[TrackingNumberDefinition],
+) -> Optional[TrackingNumber]:
+    for tn_definition in definitions:
+        tracking_number = tn_definition.test(number)
+        if tracking_number and tracking_number.valid:
+            return tracking_number
+
+    return None